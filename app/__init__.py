@@ -1,7 +1,7 @@
 import os
 import traceback
 
-from flask import Flask, jsonify
+from flask import Flask, jsonify, g
 
 import config
 from config import get_config
@@ -37,6 +37,17 @@ def create_app():
 		response.status_code = 500
 		return response
 
+	from .services.monday import api as monday_api
+
+	@app.before_request
+	def open_item_scope():
+		# items fetched while handling a request are shared for the rest of the request
+		g.monday_item_scope = monday_api.open_item_scope()
+
+	@app.teardown_request
+	def close_item_scope(exc=None):
+		monday_api.close_item_scope(g.pop('monday_item_scope', None))
+
 	# Here, import and register blueprints
 	from .routes import (scheduling, slack, monday as monday_routes, ai as ai_routes, zendesk as zendesk_routes,
 						 admin_routes, xero_webhooks)
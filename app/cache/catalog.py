@@ -0,0 +1,542 @@
+# versioned namespaces for the catalog caches (products, devices, parts, pre-checks)
+# each version of a namespace is one Redis hash of {item ID: JSON}, so reads never scan the keyspace. A rebuild writes
+# a new version and then switches the namespace's version pointer to it, so readers keep using the complete previous
+# version until the new one is ready. The previous version expires after a grace period, which covers processes that
+# have not seen the switch yet
+# relationships between catalog items (e.g. the products of a device) are kept in secondary indexes alongside each
+# version: one Redis set of item IDs per indexed value, see find_ids
+# each process also keeps a local copy of the namespaces it lists in full (local_catalog), dropped through Redis pub/sub
+# whenever an item or version of the namespace changes
+import os
+import json
+import time
+import logging
+import threading
+
+import redis
+
+import config
+
+from .redis_client import get_redis_connection
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+# {namespace: (expires at, version)}, each process rechecks the version pointer every CATALOG_VERSION_LOCAL_TTL
+_versions = {}
+
+# {namespace: (expires at, swept at)}, rechecked on the same schedule as _versions
+_swept_at = {}
+
+# cached item data is stamped with the time it was cached under this key
+CACHED_AT = "_cached_at"
+
+# see freshness
+FRESH = "fresh"
+STALE = "stale"
+EXPIRED = "expired"
+
+# messages are '{namespace}' when a whole namespace changed, or '{namespace}:{item ID}' when one item did
+INVALIDATION_CHANNEL = "cache:catalog:invalidate"
+
+
+class LocalNamespace:
+	"""a process-local copy of one version of a namespace, as parsed item data by item ID"""
+
+	def __init__(self, version, items):
+		self.version = version
+		self.items = items
+		self.loaded_at = time.monotonic()
+		# items changed since the copy was loaded, refetched on the next read
+		self.stale = set()
+		# set when the whole namespace changed while the copy was being loaded, so it must not be kept
+		self.invalidated = False
+
+
+class LocalCatalog:
+	"""
+	Process-local copies of catalog namespaces, so listing a catalog does not download and parse it from Redis each
+	time. Copies are only kept while this process is subscribed to INVALIDATION_CHANNEL, and for no longer than
+	conf.CATALOG_LOCAL_TTL in case a message was missed. The parsed item data is shared and must not be modified
+	"""
+
+	def __init__(self):
+		self._namespaces = {}
+		# {namespace: [LocalNamespace]} copies being loaded, which collect the invalidations received meanwhile
+		self._loading = {}
+		self._lock = threading.Lock()
+		self._listener = None
+		self._pid = None
+
+	def _subscribed(self):
+		"""subscribe to invalidations if this process is not subscribed yet, returning whether it is"""
+		if self._pid == os.getpid() and self._listener is not None and self._listener.is_alive():
+			return True
+		with self._lock:
+			# copies inherited through a fork, or kept by a listener that has stopped, may have missed invalidations
+			self._namespaces = {}
+			try:
+				pubsub = get_redis_connection().pubsub(ignore_subscribe_messages=True)
+				pubsub.subscribe(**{INVALIDATION_CHANNEL: self.handle_message})
+				self._listener = pubsub.run_in_thread(
+					sleep_time=1, daemon=True, exception_handler=self._handle_listener_error
+				)
+				self._pid = os.getpid()
+			except redis.RedisError as e:
+				log.warning(f"Could not subscribe to catalog invalidations: {e}")
+				self._listener = None
+				return False
+		return True
+
+	def _handle_listener_error(self, error, pubsub, listener):
+		log.warning(f"Catalog invalidation listener stopped: {error}")
+		listener.stop()
+		with self._lock:
+			self._namespaces = {}
+
+	def handle_message(self, message):
+		data = message['data']
+		if isinstance(data, bytes):
+			data = data.decode('utf-8')
+		namespace, _, item_id = data.partition(':')
+		with self._lock:
+			for loading in self._loading.get(namespace, []):
+				if item_id:
+					loading.stale.add(item_id)
+				else:
+					loading.invalidated = True
+			local = self._namespaces.get(namespace)
+			if local is None:
+				return
+			if item_id:
+				local.stale.add(item_id)
+			else:
+				del self._namespaces[namespace]
+
+	def get_all(self, namespace, version):
+		"""the parsed data of every item in a version of a namespace, loading the namespace if needed"""
+		local = self._namespaces.get(namespace)
+		if (
+				local is None
+				or local.version != version
+				or time.monotonic() - local.loaded_at > conf.CATALOG_LOCAL_TTL
+				or not self._subscribed()
+		):
+			# subscribe and register the copy before loading, so changes published during the load are applied to it
+			subscribed = self._subscribed()
+			local = LocalNamespace(version, {})
+			with self._lock:
+				self._loading.setdefault(namespace, []).append(local)
+			try:
+				local.items = {
+					key.decode('utf-8'): json.loads(value)
+					for key, value in get_redis_connection().hgetall(items_key(namespace, version)).items()
+				}
+			finally:
+				with self._lock:
+					self._loading[namespace].remove(local)
+					if not self._loading[namespace]:
+						del self._loading[namespace]
+			if not subscribed or local.invalidated:
+				return list(local.items.values())
+			with self._lock:
+				self._namespaces[namespace] = local
+
+		if local.stale:
+			self._refresh_stale(namespace, local)
+		return list(local.items.values())
+
+	def get(self, namespace, version, item_id):
+		"""
+		the parsed data of an item from a local copy of its namespace
+		:return: (found, data), found is False when there is no usable local copy
+		"""
+		local = self._namespaces.get(namespace)
+		item_id = str(item_id)
+		if (
+				local is None
+				or local.version != version
+				or item_id in local.stale
+				or time.monotonic() - local.loaded_at > conf.CATALOG_LOCAL_TTL
+				or not self._subscribed()
+		):
+			return False, None
+		return True, local.items.get(item_id)
+
+	def _refresh_stale(self, namespace, local):
+		with self._lock:
+			stale = list(local.stale)
+			local.stale.clear()
+		values = get_redis_connection().hmget(items_key(namespace, local.version), stale)
+		for item_id, value in zip(stale, values):
+			if value is None:
+				local.items.pop(item_id, None)
+			else:
+				local.items[item_id] = json.loads(value)
+
+	def clear(self):
+		with self._lock:
+			self._namespaces = {}
+
+
+local_catalog = LocalCatalog()
+
+
+def publish_invalidation(namespace, item_id=None, pipe=None):
+	message = namespace if item_id is None else f"{namespace}:{item_id}"
+	try:
+		(pipe if pipe is not None else get_redis_connection()).publish(INVALIDATION_CHANNEL, message)
+	except redis.RedisError as e:
+		log.warning(f"Could not publish catalog invalidation {message}: {e}")
+
+
+def version_key(namespace):
+	return f"cache:{namespace}:version"
+
+
+def version_counter_key(namespace):
+	return f"cache:{namespace}:next_version"
+
+
+def versions_key(namespace):
+	# the set of versions of a namespace that have been built and not yet expired
+	return f"cache:{namespace}:versions"
+
+
+def rebuild_lock_key(namespace):
+	return f"cache:{namespace}:rebuild"
+
+
+def swept_at_key(namespace):
+	return f"cache:{namespace}:swept_at"
+
+
+def items_key(namespace, version):
+	return f"cache:{namespace}:{version}:items"
+
+
+def index_key(namespace, version, index, value):
+	return f"cache:{namespace}:{version}:index:{index}:{value}"
+
+
+def index_registry_key(namespace, version):
+	# the set of index keys written for a version, so they can be expired with it. Only versions built with indexes
+	# have one
+	return f"cache:{namespace}:{version}:indexes"
+
+
+def missing_key(namespace, item_id):
+	# set for CATALOG_MISSING_TTL when an item is found not to exist, so lookups of it do not reach the API each time
+	return f"cache:{namespace}:missing:{item_id}"
+
+
+def fill_lock_key(namespace, item_id):
+	# held while a cache miss is fetched from the API, so concurrent misses for the item wait for one fetch
+	return f"cache:{namespace}:fill:{item_id}"
+
+
+def refresh_key(namespace, item_id):
+	# set when a background refresh of a stale item is queued, so reads of it do not queue another
+	return f"catalog:refresh:{namespace}:{item_id}"
+
+
+def legacy_item_key(namespace, item_id):
+	# items were kept under one '{namespace}:{id}' string key each before catalog caches were versioned
+	return f"{namespace}:{item_id}"
+
+
+def current_version(namespace):
+	"""the version of a namespace that readers should use, None if it has never been built"""
+	cached = _versions.get(namespace)
+	if cached and cached[0] > time.monotonic():
+		return cached[1]
+	version = get_redis_connection().get(version_key(namespace))
+	if version is not None:
+		version = version.decode('utf-8')
+	_versions[namespace] = (time.monotonic() + conf.CATALOG_VERSION_LOCAL_TTL, version)
+	return version
+
+
+def get_item(namespace, item_id):
+	"""the cached data of an item in the current version of a namespace, None if it is not cached"""
+	version = current_version(namespace)
+	if version is None:
+		cached = get_redis_connection().get(legacy_item_key(namespace, item_id))
+	else:
+		found, data = local_catalog.get(namespace, version, item_id)
+		if found:
+			return data
+		cached = get_redis_connection().hget(items_key(namespace, version), str(item_id))
+	return json.loads(cached) if cached else None
+
+
+def get_all_items(namespace):
+	"""the cached data of every item in the current version of a namespace, None if it has never been built"""
+	version = current_version(namespace)
+	if version is None:
+		return None
+	return local_catalog.get_all(namespace, version)
+
+
+def get_items(namespace, item_ids):
+	"""the cached data of items in the current version of a namespace, as {item ID: data}, without uncached items"""
+	item_ids = [str(_) for _ in item_ids]
+	if not item_ids:
+		return {}
+	version = current_version(namespace)
+	found = {}
+	missing = []
+	for item_id in item_ids:
+		local, data = local_catalog.get(namespace, version, item_id) if version is not None else (False, None)
+		if local:
+			if data is not None:
+				found[item_id] = data
+		else:
+			missing.append(item_id)
+	if missing:
+		if version is None:
+			values = get_redis_connection().mget([legacy_item_key(namespace, _) for _ in missing])
+		else:
+			values = get_redis_connection().hmget(items_key(namespace, version), missing)
+		found.update({item_id: json.loads(value) for item_id, value in zip(missing, values) if value})
+	return found
+
+
+def get_missing_ids(namespace, item_ids):
+	"""the IDs out of item_ids that have recently been found not to exist"""
+	item_ids = [str(_) for _ in item_ids]
+	if not item_ids:
+		return set()
+	values = get_redis_connection().mget([missing_key(namespace, _) for _ in item_ids])
+	return {item_id for item_id, value in zip(item_ids, values) if value is not None}
+
+
+def set_missing(namespace, item_ids):
+	"""record that items do not exist, for CATALOG_MISSING_TTL"""
+	if not item_ids:
+		return
+	pipe = get_redis_connection().pipeline(transaction=False)
+	for item_id in item_ids:
+		pipe.set(missing_key(namespace, item_id), 1, ex=conf.CATALOG_MISSING_TTL)
+	pipe.execute()
+	log.info(f"Recorded missing {namespace} items: {list(item_ids)}")
+
+
+def claim_refreshes(namespace, item_ids):
+	"""the IDs out of item_ids that no background refresh has been queued for in the last CATALOG_REFRESH_DEDUPE_TTL"""
+	item_ids = [str(_) for _ in item_ids]
+	if not item_ids:
+		return []
+	pipe = get_redis_connection().pipeline(transaction=False)
+	for item_id in item_ids:
+		pipe.set(refresh_key(namespace, item_id), 1, nx=True, ex=conf.CATALOG_REFRESH_DEDUPE_TTL)
+	return [item_id for item_id, claimed in zip(item_ids, pipe.execute()) if claimed]
+
+
+def fill_lock(namespace, item_id):
+	return get_redis_connection().lock(
+		fill_lock_key(namespace, item_id),
+		timeout=conf.CATALOG_FILL_LOCK_TIMEOUT,
+		blocking_timeout=conf.CATALOG_FILL_LOCK_TIMEOUT,
+	)
+
+
+def get_item_ids(namespace):
+	"""the IDs of the items in the current version of a namespace"""
+	version = current_version(namespace)
+	if version is None:
+		return set()
+	return {_.decode('utf-8') for _ in get_redis_connection().hkeys(items_key(namespace, version))}
+
+
+def find_ids(namespace, index, value):
+	"""
+	the IDs of the items in the current version of a namespace whose index value is value
+	:return: a set of item IDs, or None if the current version has no indexes (it was built before they were added)
+	"""
+	version = current_version(namespace)
+	if version is None:
+		return None
+	pipe = get_redis_connection().pipeline(transaction=False)
+	pipe.exists(index_registry_key(namespace, version))
+	pipe.smembers(index_key(namespace, version, index, value))
+	indexed, ids = pipe.execute()
+	if not indexed:
+		return None
+	return {_.decode('utf-8') for _ in ids}
+
+
+def index_entries(item_data, indexes):
+	"""
+	the (index, value) pairs an item is indexed under
+	:param indexes: {index name: the key of item_data holding the indexed value, or a list of values}
+	"""
+	entries = set()
+	if not item_data or not indexes:
+		return entries
+	for index, data_key in indexes.items():
+		values = item_data.get(data_key)
+		if not isinstance(values, (list, tuple)):
+			values = [values]
+		entries.update((index, str(value)) for value in values if value not in (None, ''))
+	return entries
+
+
+def _write_index(pipe, namespace, version, item_id, added, removed):
+	for index, value in removed:
+		pipe.srem(index_key(namespace, version, index, value), str(item_id))
+	if added:
+		for index, value in added:
+			pipe.sadd(index_key(namespace, version, index, value), str(item_id))
+		pipe.sadd(index_registry_key(namespace, version), *[index_key(namespace, version, *_) for _ in added])
+
+
+def _indexed_data(namespace, version, item_ids):
+	"""the currently cached data of items, if the version has indexes to update: {item ID: data or None}, else None"""
+	pipe = get_redis_connection().pipeline(transaction=False)
+	pipe.exists(index_registry_key(namespace, version))
+	pipe.hmget(items_key(namespace, version), [str(_) for _ in item_ids])
+	indexed, values = pipe.execute()
+	if not indexed:
+		return None
+	return {str(item_id): json.loads(value) if value else None for item_id, value in zip(item_ids, values)}
+
+
+def set_item(namespace, item_id, item_data, version=None, pipe=None, indexes=None):
+	"""
+	cache an item's data in the current version of a namespace
+	:param version: the version being built, for cache rebuilds (readers are told when the version is switched to)
+	:param indexes: the item type's indexes, {index name: key of item_data}, see index_entries
+	"""
+	redis_connection = pipe if pipe is not None else get_redis_connection()
+	item_json = json.dumps({**item_data, CACHED_AT: time.time()})
+	entries = index_entries(item_data, indexes)
+	if version is not None:
+		redis_connection.hset(items_key(namespace, version), str(item_id), item_json)
+		_write_index(redis_connection, namespace, version, item_id, entries, ())
+		return
+	redis_connection.delete(missing_key(namespace, item_id))
+	version = current_version(namespace)
+	if version is None:
+		redis_connection.set(legacy_item_key(namespace, item_id), item_json)
+		return
+	if indexes:
+		previous = _indexed_data(namespace, version, [item_id])
+		if previous is not None:
+			previous_entries = index_entries(previous[str(item_id)], indexes)
+			_write_index(
+				redis_connection, namespace, version, item_id, entries - previous_entries, previous_entries - entries
+			)
+	redis_connection.hset(items_key(namespace, version), str(item_id), item_json)
+	publish_invalidation(namespace, item_id, pipe=pipe)
+
+
+def delete_items(namespace, item_ids, indexes=None):
+	"""remove items from the current version of a namespace"""
+	if not item_ids:
+		return
+	version = current_version(namespace)
+	if version is None:
+		get_redis_connection().delete(*[legacy_item_key(namespace, _) for _ in item_ids])
+		return
+	previous = _indexed_data(namespace, version, item_ids) if indexes else None
+	pipe = get_redis_connection().pipeline()
+	pipe.hdel(items_key(namespace, version), *[str(_) for _ in item_ids])
+	for item_id in item_ids:
+		if previous is not None:
+			_write_index(pipe, namespace, version, item_id, (), index_entries(previous[str(item_id)], indexes))
+		publish_invalidation(namespace, item_id, pipe=pipe)
+	pipe.execute()
+
+
+def next_version(namespace):
+	"""reserve a new version to build a namespace into"""
+	redis_connection = get_redis_connection()
+	version = str(redis_connection.incr(version_counter_key(namespace)))
+	redis_connection.sadd(versions_key(namespace), version)
+	return version
+
+
+def switch_version(namespace, version):
+	"""
+	point readers at a newly built version, expiring the previous version after the grace period
+	:return: the previous version
+	"""
+	redis_connection = get_redis_connection()
+	previous = redis_connection.get(version_key(namespace))
+	redis_connection.set(version_key(namespace), version)
+	_versions[namespace] = (time.monotonic() + conf.CATALOG_VERSION_LOCAL_TTL, version)
+
+	publish_invalidation(namespace)
+
+	previous = previous.decode('utf-8') if previous is not None else None
+	log.info(f"Switched {namespace} cache from version {previous} to {version}")
+	if previous is not None:
+		expire_version(namespace, previous)
+	return previous
+
+
+def expire_version(namespace, version):
+	redis_connection = get_redis_connection()
+	index_keys = redis_connection.smembers(index_registry_key(namespace, version))
+	pipe = redis_connection.pipeline(transaction=False)
+	for key in [items_key(namespace, version), index_registry_key(namespace, version), *index_keys]:
+		pipe.expire(key, conf.CATALOG_CACHE_GRACE_PERIOD)
+	pipe.srem(versions_key(namespace), version)
+	pipe.execute()
+
+
+def clear_namespace(namespace):
+	"""delete every version of a namespace, readers fall back to the API until it is built again"""
+	redis_connection = get_redis_connection()
+	versions = [_.decode('utf-8') for _ in redis_connection.smembers(versions_key(namespace))]
+	pipe = redis_connection.pipeline()
+	for version in versions:
+		index_keys = redis_connection.smembers(index_registry_key(namespace, version))
+		pipe.delete(items_key(namespace, version), index_registry_key(namespace, version), *index_keys)
+	pipe.delete(versions_key(namespace), version_key(namespace), swept_at_key(namespace))
+	pipe.execute()
+	_versions.pop(namespace, None)
+	_swept_at.pop(namespace, None)
+	publish_invalidation(namespace)
+
+
+def get_swept_at(namespace, local=False):
+	"""
+	the time (epoch seconds) up to which the namespace is known to reflect its board, None if never recorded
+	:param local: reuse the value this process last read, for up to CATALOG_VERSION_LOCAL_TTL
+	"""
+	cached = _swept_at.get(namespace)
+	if local and cached and cached[0] > time.monotonic():
+		return cached[1]
+	swept_at = get_redis_connection().get(swept_at_key(namespace))
+	swept_at = float(swept_at) if swept_at is not None else None
+	_swept_at[namespace] = (time.monotonic() + conf.CATALOG_VERSION_LOCAL_TTL, swept_at)
+	return swept_at
+
+
+def set_swept_at(namespace, timestamp):
+	get_redis_connection().set(swept_at_key(namespace), str(timestamp))
+	_swept_at[namespace] = (time.monotonic() + conf.CATALOG_VERSION_LOCAL_TTL, float(timestamp))
+
+
+def freshness(namespace, item_data=None):
+	"""
+	how fresh cached data is: STALE after conf.CATALOG_SOFT_TTL, EXPIRED after conf.CATALOG_HARD_TTL
+	an item is as fresh as the later of when it was cached and when its namespace was last swept (which checks every
+	item against the board). Without item_data, the freshness of the namespace as a whole
+	"""
+	checked_at = [get_swept_at(namespace, local=True)]
+	if item_data is not None:
+		checked_at.append(item_data.get(CACHED_AT))
+	checked_at = [_ for _ in checked_at if _ is not None]
+	if not checked_at:
+		# cached before entries were timestamped, usable until the next sweep
+		return STALE
+	age = time.time() - max(checked_at)
+	if age > conf.CATALOG_HARD_TTL:
+		return EXPIRED
+	if age > conf.CATALOG_SOFT_TTL:
+		return STALE
+	return FRESH
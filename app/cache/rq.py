@@ -1,10 +1,14 @@
 import datetime
+import logging
 
 from rq import Queue
+from rq.job import Job, JobStatus
+from rq.exceptions import NoSuchJobError, InvalidJobOperation
 from rq.registry import FailedJobRegistry
 
 from .redis_client import get_redis_connection
 
+log = logging.getLogger('eric')
 
 a_sync = True
 # if conf.DEBUG:
@@ -16,6 +20,43 @@ q_high = Queue('high', connection=get_redis_connection(), is_async=a_sync, failu
 q_ai_results = Queue('ai_results', connection=get_redis_connection(), is_async=a_sync, failure_ttl=500)
 
 
+def enqueue_once(queue, dedupe_key, func, *args, dedupe_ttl=60, **kwargs):
+	"""
+	enqueue a job unless one was enqueued under the same dedupe key in the last dedupe_ttl seconds
+	:return: the job, or None if it was deduplicated
+	"""
+	if not get_redis_connection().set(f"rq:once:{dedupe_key}", 1, nx=True, ex=dedupe_ttl):
+		log.debug(f"{dedupe_key} already enqueued")
+		return None
+	return queue.enqueue(func, *args, **kwargs)
+
+
+def enqueue_debounced(queue, key, func, *args, delay=15, **kwargs):
+	"""
+	enqueue a job to run after delay seconds, cancelling the job last enqueued under the same key if it has not
+	started yet, so repeated triggers within the delay are merged into one run with the latest arguments
+	:param key: what the job is for, e.g. f"schedule_sync:{user.monday_id}"
+	:return: the job
+	"""
+	job = queue.enqueue_in(datetime.timedelta(seconds=delay), func, *args, **kwargs)
+	redis_connection = get_redis_connection()
+	pipe = redis_connection.pipeline()
+	pipe.getset(f"rq:debounce:{key}", job.id)
+	pipe.expire(f"rq:debounce:{key}", delay + 60)
+	previous_id, _ = pipe.execute()
+	if previous_id is None:
+		return job
+
+	try:
+		previous = Job.fetch(previous_id.decode('utf-8'), connection=redis_connection)
+		if previous.get_status() in (JobStatus.SCHEDULED, JobStatus.QUEUED):
+			previous.cancel()
+			log.debug(f"Replaced job {previous.id} for {key} with {job.id}")
+	except (NoSuchJobError, InvalidJobOperation):
+		pass
+	return job
+
+
 def remove_failed_jobs():
 	for q in (q_low, q_med, q_high, q_ai_results):
 		print(q)
@@ -1,137 +1,212 @@
+import time
 import logging
 
-from . import get_redis_connection
+from dateutil import parser as date_parser
+
+import config
+
+from . import get_redis_connection, catalog
 from ..services import monday
 
-log = logging.getLogger('eric')
+conf = config.get_config()
 
+log = logging.getLogger('eric')
 
-def clear_cache(key_prefix=''):
-	log.info(f"Clearing cache for key: {key_prefix}")
-	redis_connection = get_redis_connection()
-	pipe = redis_connection.pipeline()
-	for key in redis_connection.scan_iter(f"{key_prefix}*"):
-		pipe.delete(key)
+# cached items are written to Redis in pipelines of this many items while a cache is built
+BUILD_PIPELINE_SIZE = 500
+
+# items updated this many seconds before the last sweep are refreshed again, allowing for clock differences
+SWEEP_OVERLAP = 60
+
+
+def get_catalog_item_types():
+	return [
+		monday.items.ProductItem,
+		monday.items.DeviceItem,
+		monday.items.PartItem,
+		monday.items.misc.CheckItem,
+	]
+
+
+def get_catalog_item_type(board_id):
+	"""the cacheable item type for a catalog board, None if the board is not cached"""
+	for item_type in get_catalog_item_types():
+		if str(item_type.BOARD_ID) == str(board_id):
+			return item_type
+	return None
+
+
+def get_namespace_item_type(namespace):
+	"""the cacheable item type of a catalog cache namespace, None if it is not a catalog"""
+	for item_type in get_catalog_item_types():
+		if item_type.CACHE_NAMESPACE == namespace:
+			return item_type
+	return None
+
+
+def clear_cache(item_type):
+	"""delete every version of a catalog cache"""
+	log.info(f"Clearing {item_type.CACHE_NAMESPACE} cache")
+	catalog.clear_namespace(item_type.CACHE_NAMESPACE)
+
+
+def build_catalog_cache(item_type):
+	"""
+	cache every item on a cacheable item type's board into a new version of its cache namespace, then switch readers to
+	it. Readers keep using the previous version while the build runs, and only one build per namespace runs at a time
+	:param item_type: a BaseCacheableItem subclass
+	:returns: the number of items cached, or None if another build of the namespace was already running
+	"""
+	namespace = item_type.CACHE_NAMESPACE
+	lock = get_redis_connection().lock(catalog.rebuild_lock_key(namespace), timeout=conf.CATALOG_REBUILD_LOCK_TIMEOUT)
+	if not lock.acquire(blocking=False):
+		log.info(f"{namespace} cache is already being built, skipping")
+		return None
+
+	try:
+		started = time.time()
+		version = catalog.next_version(namespace)
+		log.info(f"Building {namespace} cache version {version}")
+		try:
+			count = _cache_items(item_type, version)
+		except Exception:
+			# readers never saw the partial version, let it expire
+			catalog.expire_version(namespace, version)
+			raise
+		catalog.switch_version(namespace, version)
+		# changes made while the build ran are picked up by the next sweep
+		catalog.set_swept_at(namespace, started)
+		log.info(f"Built {namespace} cache version {version} with {count} items")
+		return count
+	finally:
+		lock.release()
+
+
+def _cache_items(item_type, version):
+	pipe = get_redis_connection().pipeline(transaction=False)
+	count = 0
+	for item in item_type.iter_all():
+		item.save_to_cache(pipe, version=version)
+		count += 1
+		if count % BUILD_PIPELINE_SIZE == 0:
+			pipe.execute()
+			log.debug(f"Total items cached: {count}")
 	pipe.execute()
+	return count
 
 
 def build_product_cache():
-	def cache_item_set(item_set):
-		for i in item_set:
-			p = monday.items.ProductItem(i['id'], i)
-			p.save_to_cache(pipe)
-
-	log.info("Building product cache")
-	clear_cache("product:*")
-	pipe = get_redis_connection().pipeline()
-
-	query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-		monday.items.ProductItem.BOARD_ID
-	)['data']['boards'][0]['items_page']
-	cursor = query_results['cursor']
-	log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-	cache_item_set(query_results['items'])
-	while cursor:
-		query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-			monday.items.ProductItem.BOARD_ID,
-			cursor=cursor
-		)['data']['boards'][0]['items_page']
-		cursor = query_results['cursor']
-		log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-		cache_item_set(query_results['items'])
-		if not cursor:
-			break
-	pipe.execute()
+	return build_catalog_cache(monday.items.ProductItem)
 
 
 def build_device_cache():
-	def cache_item_set(item_set):
-		for i in item_set:
-			d = monday.items.DeviceItem(i['id'], i)
-			d.save_to_cache(pipe)
-
-	log.info("Building Device Cache")
-	clear_cache("device:*")
-	pipe = get_redis_connection().pipeline()
-
-	query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-		monday.items.DeviceItem.BOARD_ID
-	)['data']['boards'][0]['items_page']
-	cursor = query_results['cursor']
-	log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-	cache_item_set(query_results['items'])
-	while True:
-		query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-			monday.items.DeviceItem.BOARD_ID,
-			cursor=cursor
-		)['data']['boards'][0]['items_page']
-		cursor = query_results['cursor']
-		log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-		cache_item_set(query_results['items'])
-		if not cursor:
-			break
-	pipe.execute()
+	return build_catalog_cache(monday.items.DeviceItem)
 
 
 def build_part_cache():
-	def cache_item_set(item_set):
-		for i in item_set:
-			p = monday.items.PartItem(i['id'], i)
-			p.save_to_cache(pipe)
-
-	log.info("Building Parts Cache")
-	clear_cache("part:*")
-	pipe = get_redis_connection().pipeline()
-
-	query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-		monday.items.PartItem.BOARD_ID
-	)['data']['boards'][0]['items_page']
-	cursor = query_results['cursor']
-	log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-	cache_item_set(query_results['items'])
-	counter = len(query_results['items'])
-	while True:
-		query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-			monday.items.PartItem.BOARD_ID,
-			cursor=cursor
-		)['data']['boards'][0]['items_page']
-		cursor = query_results['cursor']
-		log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-		cache_item_set(query_results['items'])
-		if not cursor:
-			break
-		counter += len(query_results['items'])
-		log.debug(f"Total items fetched: {counter}")
-	pipe.execute()
+	return build_catalog_cache(monday.items.PartItem)
 
 
 def build_pre_check_cache():
-	def cache_item_set(item_set):
-		for i in item_set:
-			p = monday.items.misc.CheckItem(i['id'], i)
-			p.save_to_cache(pipe)
-
-	log.info("Building Pre-Check Item Cache")
-	clear_cache("pre_check_item:*")
-	pipe = get_redis_connection().pipeline()
-
-	query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-		monday.items.misc.CheckItem.BOARD_ID
-	)['data']['boards'][0]['items_page']
-	cursor = query_results['cursor']
-	log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-	cache_item_set(query_results['items'])
-	counter = len(query_results['items'])
-	while True:
-		query_results = monday.api.monday_connection.boards.fetch_items_by_board_id(
-			monday.items.misc.CheckItem.BOARD_ID,
-			cursor=cursor
-		)['data']['boards'][0]['items_page']
-		cursor = query_results['cursor']
-		log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-		cache_item_set(query_results['items'])
-		if not cursor:
-			break
-		counter += len(query_results['items'])
-		log.debug(f"Total items fetched: {counter}")
+	return build_catalog_cache(monday.items.misc.CheckItem)
+
+
+def refresh_cached_items(item_type, item_ids):
+	"""
+	fetch items from the API into the current version of their cache namespace, removing any that no longer exist
+	:returns: the IDs of the items removed
+	"""
+	item_ids = [str(_) for _ in item_ids]
+	if not item_ids:
+		return []
+	pipe = get_redis_connection().pipeline(transaction=False)
+	fetched = set()
+	for item_data in monday.api.get_api_items(item_ids, column_ids=item_type.default_column_ids()):
+		item_type(item_data['id'], item_data).save_to_cache(pipe)
+		fetched.add(str(item_data['id']))
 	pipe.execute()
+	log.debug(f"Refreshed {len(fetched)} {item_type.CACHE_NAMESPACE} cache items")
+
+	missing = [_ for _ in item_ids if _ not in fetched]
+	remove_cached_items(item_type, missing)
+	return missing
+
+
+def remove_cached_items(item_type, item_ids):
+	"""remove items from the current version of their cache namespace"""
+	if not item_ids:
+		return
+	catalog.delete_items(item_type.CACHE_NAMESPACE, item_ids, indexes=item_type.CACHE_INDEXES)
+	log.debug(f"Removed {item_type.CACHE_NAMESPACE} cache items: {item_ids}")
+
+
+def update_cached_catalog_item(board_id, item_id, deleted=False):
+	"""keep a catalog cache up to date with a change reported by a monday webhook"""
+	item_type = get_catalog_item_type(board_id)
+	if item_type is None:
+		log.warning(f"Board {board_id} does not have a catalog cache")
+		return
+	if deleted:
+		remove_cached_items(item_type, [item_id])
+	else:
+		refresh_cached_items(item_type, [item_id])
+
+
+def sweep_catalog_cache(item_type):
+	"""
+	bring a catalog cache up to date with its board, refreshing the items updated since the last sweep and removing
+	items that are no longer on the board. A safety net for changes whose webhooks were missed
+	Namespaces that have never been built are built in full
+	"""
+	namespace = item_type.CACHE_NAMESPACE
+	swept_at = catalog.get_swept_at(namespace)
+	if catalog.current_version(namespace) is None or swept_at is None:
+		return build_catalog_cache(item_type)
+
+	lock = get_redis_connection().lock(catalog.rebuild_lock_key(namespace), timeout=conf.CATALOG_REBUILD_LOCK_TIMEOUT)
+	if not lock.acquire(blocking=False):
+		log.info(f"{namespace} cache is being built, skipping sweep")
+		return None
+
+	try:
+		started = time.time()
+		board_ids = set()
+		updated = []
+		for item in monday.api.iter_board_item_updates(item_type.BOARD_ID):
+			board_ids.add(str(item['id']))
+			if date_parser.isoparse(item['updated_at']).timestamp() > swept_at - SWEEP_OVERLAP:
+				updated.append(str(item['id']))
+
+		refresh_cached_items(item_type, updated)
+
+		cached_ids = catalog.get_item_ids(namespace)
+		remove_cached_items(item_type, list(cached_ids - board_ids))
+
+		catalog.set_swept_at(namespace, started)
+		log.info(f"Swept {namespace} cache: {len(updated)} refreshed, {len(cached_ids - board_ids)} removed")
+		return updated
+	finally:
+		lock.release()
+
+
+def sweep_catalog_caches():
+	for item_type in get_catalog_item_types():
+		sweep_catalog_cache(item_type)
+
+
+def refresh_namespace_items(namespace, item_ids):
+	"""refresh stale items of a catalog cache, enqueued by reads that find them past CATALOG_SOFT_TTL"""
+	item_type = get_namespace_item_type(namespace)
+	if item_type is None:
+		log.warning(f"{namespace} is not a catalog cache, cannot refresh {item_ids}")
+		return None
+	return refresh_cached_items(item_type, item_ids)
+
+
+def sweep_namespace(namespace):
+	"""sweep a catalog cache, enqueued by reads that find it has not been swept within CATALOG_SOFT_TTL"""
+	item_type = get_namespace_item_type(namespace)
+	if item_type is None:
+		log.warning(f"{namespace} is not a catalog cache, cannot sweep it")
+		return None
+	return sweep_catalog_cache(item_type)
@@ -0,0 +1,114 @@
+# webhook events are recorded to a capped Redis stream per source and deduplicated before they are handled
+# routes only enqueue the work an event needs, so they answer quickly, and a redelivered event (monday retries a
+# webhook it gets no quick response to, other senders retry on timeouts) is acknowledged without being handled again
+# monday events also drop the cached API data of the item they report a change to, before any work is enqueued
+import hashlib
+import logging
+from functools import wraps
+
+from flask import request, jsonify
+from redis.exceptions import RedisError
+
+import config
+
+from .redis_client import get_redis_connection
+from ..services.monday.api.item_cache import invalidate_items
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+
+def events_key(source):
+	return f"webhooks:{source}:events"
+
+
+def seen_key(source, event_id, path=None):
+	# scoped to the route, as one monday change can fire several subscriptions carrying the same triggerUuid
+	return f"webhooks:{source}:seen:{path or ''}:{event_id}"
+
+
+def fingerprint(payload):
+	"""a stable id for a payload that does not carry one"""
+	if isinstance(payload, str):
+		payload = payload.encode()
+	return hashlib.sha256(payload).hexdigest()
+
+
+def get_event_id(data, body):
+	"""the id the sender gave an event (monday's triggerUuid, or a top level event_id), else a fingerprint of the body"""
+	if isinstance(data, dict):
+		event = data.get('event') if isinstance(data.get('event'), dict) else {}
+		for event_id in (event.get('triggerUuid'), data.get('event_id')):
+			if event_id:
+				return str(event_id)
+	return fingerprint(body)
+
+
+def record_webhook(source, event_id, body, path=None):
+	"""
+	store a webhook event in its source's event stream, unless it has been received by the same route in the last
+	WEBHOOK_DEDUPE_TTL
+	:return: False if the event is a duplicate, events are treated as new when Redis cannot be reached
+	"""
+	try:
+		redis_connection = get_redis_connection()
+		if not redis_connection.set(seen_key(source, event_id, path), 1, nx=True, ex=conf.WEBHOOK_DEDUPE_TTL):
+			return False
+		redis_connection.xadd(
+			events_key(source),
+			{'id': event_id, 'path': path or '', 'body': body},
+			maxlen=conf.WEBHOOK_EVENT_LOG_LENGTH,
+			approximate=True
+		)
+	except RedisError as e:
+		log.warning(f"Could not record {source} webhook event {event_id}: {e}")
+	return True
+
+
+def forget_webhook(source, event_id, path=None):
+	"""let a redelivery of an event be handled, for events that could not be handled"""
+	try:
+		get_redis_connection().delete(seen_key(source, event_id, path))
+	except RedisError as e:
+		log.warning(f"Could not forget {source} webhook event {event_id}: {e}")
+
+
+# sources whose webhooks are sent by monday, with the changed item's ID as the event's pulseId
+MONDAY_SOURCES = ('monday', 'typeform')
+
+
+def ingests_webhook(source, id_header=None):
+	"""
+	record the events a webhook route receives and acknowledge duplicates without calling the route
+	place below monday_challenge so subscription challenges are not recorded
+	:param source: who sends the webhook, e.g. 'monday', events are stored in a stream per source. Events from
+		MONDAY_SOURCES invalidate the cached API data of their item
+	:param id_header: a request header carrying the sender's event id, for senders that do not put it in the payload
+	"""
+	def decorator(func):
+		@wraps(func)
+		def decorated_function(*args, **kwargs):
+			body = request.get_data()
+			data = request.get_json(silent=True)
+			event_id = request.headers.get(id_header) if id_header else None
+			event_id = event_id or get_event_id(data, body)
+
+			if not record_webhook(source, event_id, body, path=request.path):
+				log.debug(f"Duplicate {source} webhook event {event_id} on {request.path}, ignoring")
+				return jsonify({'message': 'Duplicate'}), 200
+
+			if source in MONDAY_SOURCES and isinstance(data, dict) and isinstance(data.get('event'), dict):
+				if data['event'].get('pulseId'):
+					invalidate_items([data['event']['pulseId']])
+
+			try:
+				return func(*args, **kwargs)
+			except Exception:
+				# the sender will retry an event that errored, which should then be handled
+				forget_webhook(source, event_id, request.path)
+				raise
+
+		return decorated_function
+
+	return decorator
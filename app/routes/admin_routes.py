@@ -28,6 +28,15 @@ def refresh_cache():
 	return jsonify({'status': 'success'}), 200
 
 
+@admin_bp.route('/invalidate-board/<int:board_id>', methods=['POST'])
+def invalidate_board(board_id):
+	"""
+	Drop a board's cached schema and labels, after its column settings have been changed
+	"""
+	monday.api.boards.invalidate(board_id)
+	return jsonify({'status': 'success'}), 200
+
+
 @admin_bp.route('/motion-reschedule', methods=['POST'])
 def force_reschedule():
 	"""
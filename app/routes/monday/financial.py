@@ -4,25 +4,24 @@ import json
 from ...services import monday
 from ...tasks.monday import sales as sales_tasks
 from ...cache.rq import q_high, q_low
+from ...cache.webhooks import ingests_webhook
 
 monday_sales_bp = Blueprint('monday_sales', __name__, url_prefix='/monday/financial')
 
 
 @monday_sales_bp.route('/re-process-sales-item', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def re_process_sales_item():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
 	data = json.loads(data)['event']
 
 	sales_control_id = data['pulseId']
-	api_data = monday.api.get_api_items([sales_control_id])[0]
-
-	main_id = [c for c in api_data['column_values'] if c['id'] == 'text'][0]['text']
 
 	q_high.enqueue(
-		sales_tasks.create_or_update_sale,
-		main_id
+		sales_tasks.sync_sale_from_linked_item,
+		args=(sales_control_id, 'text')
 	)
 
 	return jsonify({'message': 'OK'}), 200
@@ -30,6 +29,7 @@ def re_process_sales_item():
 
 @monday_sales_bp.route('/re-process-sales-ledger-item', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def re_process_sales_ledger_item():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -46,6 +46,7 @@ def re_process_sales_ledger_item():
 
 @monday_sales_bp.route('/manual-sale-creation-request', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def manual_creation_of_sale_item_requested():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -63,6 +64,7 @@ def manual_creation_of_sale_item_requested():
 
 @monday_sales_bp.route("/generate-invoice-item", methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def add_line_to_invoice_item():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -80,6 +82,7 @@ def add_line_to_invoice_item():
 
 @monday_sales_bp.route("/sync-invoice-to-xero", methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def sync_invoice_to_xero():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -97,6 +100,7 @@ def sync_invoice_to_xero():
 
 @monday_sales_bp.route("/convert-to-pl-item", methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def add_item_to_pl_board():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -111,6 +115,7 @@ def add_item_to_pl_board():
 
 @monday_sales_bp.route("/process-pl-item", methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def process_pl_item():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
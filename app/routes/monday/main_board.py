@@ -6,11 +6,11 @@ from flask import Blueprint, request, jsonify
 from rq.job import Job
 from rq.exceptions import NoSuchJobError
 
-from ...services.monday import monday_challenge, items
+from ...services.monday import monday_challenge
 from ...services import monday, textlocal
 from ...utilities import notify_admins_of_error
-from ...errors import EricError
-from ...cache.rq import q_low, q_high
+from ...cache.webhooks import ingests_webhook
+from ...cache.rq import q_low, q_high, enqueue_debounced
 from ...tasks.monday import web_bookings, sessions, misc
 from ...tasks import notifications, stuart, monday
 
@@ -21,19 +21,12 @@ main_board_bp = Blueprint('main_board', __name__, url_prefix="/main-board")
 
 @main_board_bp.route("/tech-status", methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def handle_tech_status_adjustment():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
 	data = json.loads(data)['event']
 
-	repair_paused_status_labels = (
-		'No/Incorrect Password',
-		'Parts Issue',
-		'Stuck with Repair',
-		'Jump to Other Repair',
-		'Battery Testing',
-	)
-
 	new_label = data['value']['label']['text']
 	log.debug(f"Tech Status Adjustment: {new_label}")
 
@@ -64,60 +57,17 @@ def handle_tech_status_adjustment():
 
 	log.debug('Dealing with phases.....')
 
-	main_id = data['pulseId']
-	main = items.MainItem(main_id).load_from_api()
-
-	def get_next_phase_entity():
-		# get_phase_model, then look at line items and match self.phase_status to line item mainboard_repair_status
-		phase_model = main.get_phase_model()
-		lines = phase_model.phase_lines
-		log.debug(f"Got {len(lines)} phase lines:")
-		for line in lines:
-			log.debug(str(line))
-		for i, line in enumerate(lines):
-			phase_entity = line.get_phase_entity_item()
-			log.debug(str(phase_entity))
-			if phase_entity.main_board_phase_label.value == main.repair_phase.value:
-				# Check if there is a next item
-				if i + 1 < len(lines):
-					next_line = lines[i + 1]
-					return next_line.get_phase_entity_item()
-				else:
-					# There is no next item, handle accordingly
-					return None
-
-	if new_label == 'Complete':
-		log.debug(f"Phase completed, moving to next phase")
-		next_phase = get_next_phase_entity()
-		if not next_phase:
-			# no more phases, repair has been completed
-			main.repair_phase = "Repaired"
-		else:
-			main.repair_phase = next_phase.main_board_phase_label.value
-			main.phase_status = "Not Started"
-
-		main.commit()
-
-	elif new_label in repair_paused_status_labels:
-		log.warning(f"Repair Paused: {new_label}")
-	# notify_admins_of_error(f"{str(main)} paused with status: {new_label}. Actions will neeed to be taken")
-
-	elif new_label == 'Not Started':
-		log.debug('Not Started: Do Nothing')
-	# notify_admins_of_error(f"{str(main)} has been reset to Not Started. This is likely a system change.")
-
-	elif new_label == 'Active':
-		log.warning("Not Yet Developed")
-	# notify_admins_of_error("Tech Status Adjustment: Active. A technician has started repairing a phase")
-
-	else:
-		raise EricError(f"Unknown Tech Status: {new_label}")
+	q_high.enqueue(
+		monday.repair_process.handle_tech_status_change,
+		args=(data['pulseId'], new_label)
+	)
 
 	return jsonify({'message': 'OK'}), 200
 
 
 @main_board_bp.route('/add-web-booking', methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def handle_web_booking():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -136,6 +86,7 @@ def handle_web_booking():
 
 @main_board_bp.route('/main-status-change', methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def handle_main_status_adjustment():
 	log.debug('Handling Main Board Main Status Change')
 	webhook = request.get_data()
@@ -185,11 +136,16 @@ def handle_main_status_adjustment():
 		)
 
 	if new_label == 'Repaired':
-		monday.repair_process.request_checks_from_technician(
-			main_item_id=data['pulseId'],
-			checkpoint_name='tech_post_check',
-		)
 		q_high.enqueue(
+			monday.repair_process.request_checks_from_technician,
+			kwargs={
+				"main_item_id": data['pulseId'],
+				"checkpoint_name": "tech_post_check",
+			}
+		)
+		enqueue_debounced(
+			q_high,
+			f"sale_sync:{data['pulseId']}",
 			monday.sales.create_or_update_sale,
 			kwargs={
 				"main_id": data['pulseId'],
@@ -208,6 +164,7 @@ def handle_main_status_adjustment():
 
 @main_board_bp.route('/book-collection', methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def book_courier_collection():
 	log.debug('Booking Courier Collection')
 	webhook = request.get_data()
@@ -223,6 +180,7 @@ def book_courier_collection():
 
 @main_board_bp.route('/book-return', methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def book_courier_return():
 	log.debug('Booking Courier Return')
 	webhook = request.get_data()
@@ -238,6 +196,7 @@ def book_courier_return():
 
 @main_board_bp.route("/handle-imei-change", methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def handle_imei_change():
 	log.debug('Booking Courier Return')
 	webhook = request.get_data()
@@ -254,6 +213,7 @@ def handle_imei_change():
 
 @main_board_bp.route("/handle-stuart-updates", methods=["POST"])
 @monday_challenge
+@ingests_webhook('stuart')
 def handle_stuart_job_updates():
 	log.debug('Booking Courier Return')
 	webhook = request.get_data()
@@ -274,6 +234,7 @@ def handle_stuart_job_updates():
 
 @main_board_bp.route("/request-feedback", methods=["POST"])
 @monday_challenge
+@ingests_webhook('monday')
 def request_client_feedback():
 	log.debug('Requesting Feedback')
 	webhook = request.get_data()
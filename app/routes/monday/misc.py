@@ -3,6 +3,7 @@ from flask import Blueprint, jsonify, request
 import json
 
 from ...cache.rq import q_low, q_high
+from ...cache.webhooks import ingests_webhook
 from ...services import monday
 from ...tasks.monday import web_bookings, product_management, sales, misc, repair_process
 from ...tasks import sync_platform
@@ -18,6 +19,7 @@ monday_misc_bp = Blueprint('monday_misc', __name__, url_prefix='/monday/misc')
 
 @monday_misc_bp.route('/enquiry', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def push_web_enquiry_to_zendesk():
 	log.debug('Handling Main Board Main Status Change')
 	webhook = request.get_data()
@@ -37,6 +39,7 @@ def push_web_enquiry_to_zendesk():
 
 @monday_misc_bp.route('/info-sync', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def sync_item_with_external_services():
 	log.debug('Handling Main Board Data Change')
 	webhook = request.get_data()
@@ -54,28 +57,55 @@ def sync_item_with_external_services():
 	return jsonify({'message': 'OK'}), 200
 
 
+@monday_misc_bp.route('/catalog-change', methods=['POST'])
+@monday.monday_challenge
+@ingests_webhook('monday')
+def update_catalog_cache():
+	"""keeps the product, device, part and pre-check caches up to date with changes, creations and deletions"""
+	from ...cache import utilities as cache_utilities
+	webhook = request.get_data()
+	data = webhook.decode('utf-8')
+	data = json.loads(data)['event']
+	log.debug(f"Catalog Change: {data['type']} on {data['boardId']}")
+
+	deleted = data['type'] in ('delete_pulse', 'item_deleted', 'item_archived')
+
+	if conf.CONFIG in ("DEVELOPMENT", "TESTING"):
+		cache_utilities.update_cached_catalog_item(data['boardId'], data['pulseId'], deleted=deleted)
+	else:
+		q_high.enqueue(
+			cache_utilities.update_cached_catalog_item,
+			args=(data['boardId'], data['pulseId']),
+			kwargs={'deleted': deleted}
+		)
+
+	return jsonify({'message': 'OK'}), 200
+
+
 @monday_misc_bp.route('/add-woocommerce-order-to-monday', methods=['POST'])
+@ingests_webhook('woocommerce')
 def process_woo_order():
 	log.debug('Processing WooCommerce Order')
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
 	try:
 		data = json.loads(data)
-		item = monday.items.misc.WebBookingItem()
-		item.woo_commerce_order_id = str(data['id'])
-		item.create(data['billing']['first_name'])
-	except Exception as e:
+	except ValueError as e:
 		log.error(f"Error processing WooCommerce Order: {e}")
 		notify_admins_of_error(f"Error processing WooCommerce Order: {e}\n\n{type(data)}\n{data}")
 		return jsonify({'message': 'OK'}), 200
 
-	item.add_update(json.dumps(data, indent=4))
+	q_high.enqueue(
+		web_bookings.create_web_booking_from_woo_order,
+		data
+	)
 
 	return jsonify({'message': 'OK'}), 200
 
 
 @monday_misc_bp.route('/adjust-web-price', methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def adjust_web_price():
 	log.debug('Processing WooCommerce Order')
 	webhook = request.get_data()
@@ -107,6 +137,7 @@ def adjust_web_price():
 
 @monday_misc_bp.route('/battery-test-results', methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def print_battery_results_to_main_item():
 	log.debug('Printing Battery Test Results to Main Item')
 	webhook = request.get_data()
@@ -123,27 +154,17 @@ def print_battery_results_to_main_item():
 
 @monday_misc_bp.route('/convert-to-new-sales', methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def convert_financial_item_to_sales():
-	from dateutil.parser import parse
 	log.debug('Converting old financial item to new sales item')
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
 	data = json.loads(data)['event']
 	financial_id = data['pulseId']
 
-	financial_data = monday.api.get_api_items([int(financial_id)])[0]
-
-	main_id_col = [c for c in financial_data['column_values'] if c['id'] == "mainboard_id6"][0]
-	date_col = [c for c in financial_data['column_values'] if c['id'] == "date3"][0]
-
-	main_id = main_id_col['text']
-	date_added = date_col['text']
-
 	q_low.enqueue(
-		sales.create_or_update_sale,
-		kwargs={
-			"main_id": main_id,
-		}
+		sales.sync_sale_from_linked_item,
+		args=(financial_id, "mainboard_id6")
 	)
 
 	return jsonify({'message': 'OK'}), 200
@@ -151,6 +172,7 @@ def convert_financial_item_to_sales():
 
 @monday_misc_bp.route('/sync-check-item-to-results-column', methods=["POST"])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def create_new_check_results_column():
 	log.debug('Responding to new item in checks board')
 	webhook = request.get_data()
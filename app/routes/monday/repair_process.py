@@ -6,6 +6,7 @@ from flask import Blueprint, jsonify, request
 import config
 from ...services import monday
 from ...cache.rq import q_low
+from ...cache.webhooks import ingests_webhook
 from ...tasks import monday as mon_tasks
 
 conf = config.get_config()
@@ -17,6 +18,7 @@ repair_process_bp = Blueprint('repair_process', __name__, url_prefix='/monday/re
 
 @repair_process_bp.route('/sync-check-items-and-results-columns', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def sync_check_items_and_results_columns():
 	log.debug('Syncing Check Items and Results Columns')
 	webhook = request.get_data()
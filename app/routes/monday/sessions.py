@@ -3,7 +3,8 @@ import json
 from flask import jsonify, request, Blueprint
 
 from ...services import gcal, monday
-from ...cache.rq import q_low
+from ...cache.rq import q_low, enqueue_debounced
+from ...cache.webhooks import ingests_webhook
 from ... import tasks
 
 sessions_bp = Blueprint('sessions', __name__, url_prefix='/repair-sessions')
@@ -11,12 +12,15 @@ sessions_bp = Blueprint('sessions', __name__, url_prefix='/repair-sessions')
 
 @sessions_bp.route('/map-to-gcal', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def map_session_to_gcal():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
 	data = json.loads(data)['event']
 
-	q_low.enqueue(
+	enqueue_debounced(
+		q_low,
+		f"session_gcal:{data['pulseId']}",
 		tasks.monday.sessions.map_session_to_gcal,
 		data['pulseId']
 	)
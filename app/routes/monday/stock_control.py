@@ -3,6 +3,7 @@ from flask import Blueprint, request, jsonify
 import json
 
 from ...cache.rq import q_low
+from ...cache.webhooks import ingests_webhook
 from ...services import monday
 from ...tasks.monday import stock_control as stock_tasks
 
@@ -13,6 +14,7 @@ stock_control_bp = Blueprint('monday_stock_control', __name__, url_prefix="/mond
 
 @stock_control_bp.route("/orders/process", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def process_order():
 	log.debug('Handling Main Board Main Status Change')
 	webhook = request.get_data()
@@ -27,6 +29,7 @@ def process_order():
 
 @stock_control_bp.route("/counts/process-completed-count", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def process_completed_count():
 	log.debug('Handling Main Board Main Status Change')
 	webhook = request.get_data()
@@ -42,6 +45,7 @@ def process_completed_count():
 
 @stock_control_bp.route("/stock-profile-creation", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def build_stock_profile():
 	log.debug('Checking out repair stock')
 	webhook = request.get_data()
@@ -49,18 +53,16 @@ def build_stock_profile():
 	data = json.loads(data)['event']
 
 	sc_item_id = data['pulseId']
-	sc_item = monday.items.part.StockCheckoutControlItem(sc_item_id)
-	main_id = sc_item.main_item_id.value
-	if main_id:
-		q_low.enqueue(
-			stock_tasks.update_stock_checkouts,
-			main_id
-		)
+	q_low.enqueue(
+		stock_tasks.update_stock_checkouts_for_control_item,
+		sc_item_id
+	)
 	return jsonify({'status': 'ok'}), 200
 
 
 @stock_control_bp.route("/stock-checkout-adjustment", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def checkout_stock_profile():
 	log.debug('Checking out repair stock')
 	webhook = request.get_data()
@@ -78,6 +80,7 @@ def checkout_stock_profile():
 
 @stock_control_bp.route("/add-part-to-pending-orders", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def add_part_to_pending_orders():
 	log.debug('Adding part to pending orders')
 	webhook = request.get_data()
@@ -95,6 +98,7 @@ def add_part_to_pending_orders():
 
 @stock_control_bp.route("/process-refurb-output", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def process_refurb_output_item():
 	log.debug('Processing Refurb Output')
 	webhook = request.get_data()
@@ -112,6 +116,7 @@ def process_refurb_output_item():
 
 @stock_control_bp.route("/process-refurb-output-components", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def process_refurb_output_components():
 	log.debug('Processing Refurb Output Components')
 	webhook = request.get_data()
@@ -129,6 +134,7 @@ def process_refurb_output_components():
 
 @stock_control_bp.route("/handle-waste-stock-adjustment", methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('monday')
 def handle_waste_stock_adjustment():
 	log.debug('Handling Waste Stock Adjustment')
 	webhook = request.get_data()
@@ -5,12 +5,14 @@ from flask import jsonify, Blueprint, request
 from ...services import monday
 from ...tasks.monday.typeform import sync_typeform_response_with_monday
 from ...cache import rq
+from ...cache.webhooks import ingests_webhook
 
 typeform_bp = Blueprint('typeform', __name__, url_prefix='/monday/typeform')
 
 
 @typeform_bp.route('/fetch-response-data', methods=['POST'])
 @monday.monday_challenge
+@ingests_webhook('typeform')
 def fetch_response_data_from_typeform():
 	webhook = request.get_data()
 	data = webhook.decode('utf-8')
@@ -4,10 +4,12 @@ import os
 import hmac
 import hashlib
 import base64
+import json
 
 from flask import Blueprint, request
 
 from ..cache import rq
+from ..cache.webhooks import record_webhook, fingerprint
 from .. import tasks
 
 log = logging.getLogger('eric')
@@ -57,6 +59,11 @@ def process_invoice_update():
 		# The payload is valid
 		log.debug("Received Xero Invoice Update")
 		log.debug(request.get_json())
+		# redeliveries carry new entropy, so events are identified by their contents
+		events = request.get_json()['events']
+		if not record_webhook('xero', fingerprint(json.dumps(events, sort_keys=True)), payload, path=request.path):
+			log.debug("Duplicate Xero Invoice Update, ignoring")
+			return "OK", 200
 		rq.q_high.enqueue(
 			tasks.monday.sales.notify_of_xero_invoice_payment,
 			request.get_json()['events'][0]['resourceId']
@@ -2,7 +2,8 @@ import json
 
 from flask import Blueprint, request, jsonify
 
-from ..cache.rq import q_high
+from ..cache.rq import q_high, enqueue_debounced
+from ..cache.webhooks import ingests_webhook
 from ..tasks import sync_platform, zendesk
 
 import config
@@ -13,6 +14,7 @@ zendesk_bp = Blueprint('zendesk', __name__, url_prefix='/zendesk')
 
 
 @zendesk_bp.route('/index', methods=['POST', 'GET'])
+@ingests_webhook('zendesk', id_header='X-Zendesk-Webhook-Invocation-Id')
 def zendesk_creates_monday_ticket():
 	data = request.get_data().decode()
 	data = json.loads(data)
@@ -23,7 +25,9 @@ def zendesk_creates_monday_ticket():
 		if conf.CONFIG in ('DEVELOPMENT', 'TESTING'):
 			sync_platform.sync_to_monday(ticket_id)
 		else:
-			q_high.enqueue(
+			enqueue_debounced(
+				q_high,
+				f"zendesk_sync:{ticket_id}",
 				sync_platform.sync_to_monday,
 				ticket_id
 			)
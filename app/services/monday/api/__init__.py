@@ -1,5 +1,8 @@
-from .client import conn as monday_connection, get_api_items, get_api_items_by_group, get_items_by_board_id
+from .client import conn as monday_connection, get_api_items, get_api_items_by_group, get_items_by_board_id, \
+	iter_board_items, iter_group_items, iter_board_item_updates, create_items, create_subitems, delete_items
 from .items import BaseItemType
+from .session import CommitSession
+from .identity import item_scope, open_item_scope, close_item_scope
 from .boards import cache as boards
 from .exceptions import MondayAPIError
 
@@ -1,30 +1,190 @@
+import json
+import time
+import logging
+
+import redis
+
+import config
+
 from .client import conn
 from .exceptions import MondayAPIError
+from ....cache import get_redis_connection
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+
+def board_cache_key(board_id):
+	return f"monday:board:{board_id}"
+
+
+def board_refetch_key(board_id):
+	return f"monday:board:{board_id}:refetched"
+
+
+def compile_label_maps(board):
+	"""
+	build label maps for every status and dropdown column of a board, so settings_str is parsed once per fetch
+	:return: {column_id: {"ids": {label_id: label}, "labels": {label: label_id}}}
+	"""
+	label_maps = {}
+	for column in board['columns']:
+		try:
+			labels = json.loads(column.get('settings_str') or '{}').get('labels')
+		except ValueError:
+			continue
+		if isinstance(labels, dict):
+			# status columns: {"0": "Working on it", ...}
+			ids = {str(key): str(value) for key, value in labels.items()}
+		elif isinstance(labels, list):
+			# dropdown columns: [{"id": 1, "name": "iPhone 12"}, ...]
+			ids = {str(label['id']): str(label['name']) for label in labels}
+		else:
+			continue
+		label_maps[str(column['id'])] = {
+			"ids": ids,
+			"labels": {label: label_id for label_id, label in ids.items()},
+		}
+	return label_maps
 
 
 class BoardCache:
-	def __init__(self):
+	"""
+	Board schemas (columns and their settings) shared across processes through Redis, with precompiled label maps
+	for status and dropdown columns. Entries expire after conf.MONDAY_BOARD_CACHE_TTL and each process keeps its own
+	copy for conf.MONDAY_BOARD_LOCAL_TTL, so an invalidation reaches every process within that time
+	Label lookups that miss refetch the board at most once per conf.MONDAY_BOARD_REFETCH_INTERVAL across processes,
+	and labels still missing afterwards are remembered for conf.MONDAY_BOARD_MISSING_LABEL_TTL
+	"""
+
+	def __init__(self, ttl=None, local_ttl=None, refetch_interval=None, missing_ttl=None):
+		self.ttl = ttl if ttl is not None else conf.MONDAY_BOARD_CACHE_TTL
+		self.local_ttl = local_ttl if local_ttl is not None else conf.MONDAY_BOARD_LOCAL_TTL
+		self.refetch_interval = refetch_interval if refetch_interval is not None else conf.MONDAY_BOARD_REFETCH_INTERVAL
+		self.missing_ttl = missing_ttl if missing_ttl is not None else conf.MONDAY_BOARD_MISSING_LABEL_TTL
 		self._cache = {}
+		# {board_id: monotonic time before which this process will not refetch the board}
+		self._refetched = {}
+		# {(board_id, column_id, direction, key): monotonic time until which the label is known to be missing}
+		self._missing = {}
 
-	def get_board(self, board_id):
+	def _get_entry(self, board_id):
 		board_id = str(board_id)
-		if board_id not in self._cache:
-			# Fetch the board data here
-			# This is a placeholder, replace with your actual implementation
-			try:
-				self._cache[board_id] = conn.boards.fetch_boards_by_id(int(board_id))['data']['boards'][0]
-			except IndexError:
-				raise MondayAPIError(f"Board with ID {board_id} not found")
-		return self._cache[board_id]
+		cached = self._cache.get(board_id)
+		if cached and cached[0] > time.monotonic():
+			return cached[1]
 
-	def get_board_column_map(self, board_id):
+		entry = self._read(board_id)
+		if entry is None:
+			entry = self._fetch(board_id)
+			self._write(board_id, entry)
+		self._cache[board_id] = (time.monotonic() + self.local_ttl, entry)
+		return entry
+
+	def _read(self, board_id):
+		try:
+			data = get_redis_connection().get(board_cache_key(board_id))
+		except redis.RedisError as e:
+			log.warning(f"Could not read board {board_id} from cache: {e}")
+			return None
+		if data is None:
+			return None
+		return json.loads(data)
+
+	def _write(self, board_id, entry):
+		try:
+			get_redis_connection().set(board_cache_key(board_id), json.dumps(entry), ex=self.ttl)
+		except redis.RedisError as e:
+			log.warning(f"Could not write board {board_id} to cache: {e}")
+
+	@staticmethod
+	def _fetch(board_id):
+		log.debug(f"Fetching board {board_id} schema")
+		try:
+			board = conn.boards.fetch_boards_by_id(int(board_id))['data']['boards'][0]
+		except IndexError:
+			raise MondayAPIError(f"Board with ID {board_id} not found")
+		return {"board": board, "label_maps": compile_label_maps(board)}
+
+	def invalidate(self, board_id):
+		"""drop a board from the shared and local caches, e.g. after its column settings have changed"""
+		board_id = str(board_id)
+		log.info(f"Invalidating board {board_id} schema cache")
+		self._cache.pop(board_id, None)
+		try:
+			get_redis_connection().delete(board_cache_key(board_id))
+		except redis.RedisError as e:
+			log.warning(f"Could not invalidate board {board_id} in cache: {e}")
+
+	def refresh(self, board_id):
+		"""
+		refetch a board and replace its cached schema, unless it was refetched by any process in the last
+		refetch_interval seconds, in which case the shared copy is reloaded instead
+		:return: whether the board was refetched
+		"""
 		board_id = str(board_id)
+		now = time.monotonic()
+		if self._refetched.get(board_id, 0) > now:
+			return False
+		self._refetched[board_id] = now + self.refetch_interval
+
+		try:
+			claimed = get_redis_connection().set(board_refetch_key(board_id), 1, nx=True, ex=self.refetch_interval)
+		except redis.RedisError as e:
+			log.warning(f"Could not claim board {board_id} refetch: {e}")
+			claimed = True
+
+		if claimed:
+			entry = self._fetch(board_id)
+			# the shared entry is replaced, not deleted first, so other processes keep reading it meanwhile
+			self._write(board_id, entry)
+		else:
+			entry = self._read(board_id)
+			if entry is None:
+				return False
+		self._cache[board_id] = (time.monotonic() + self.local_ttl, entry)
+		return bool(claimed)
+
+	def get_board(self, board_id):
+		return self._get_entry(board_id)['board']
+
+	def get_board_column_map(self, board_id):
 		board = self.get_board(board_id)
-		columns = board['columns']
-		column_map = {}
-		for column in columns:
-			column_map[column['id']] = column['type']
-		return column_map
+		return {column['id']: column['type'] for column in board['columns']}
+
+	def get_label_map(self, board_id, column_id):
+		"""
+		get the precompiled label map of a status or dropdown column
+		:return: {"ids": {label_id: label}, "labels": {label: label_id}}, or None if the column has no labels
+		"""
+		return self._get_entry(board_id)['label_maps'].get(str(column_id))
+
+	def lookup_label(self, board_id, column_id, key, direction='ids'):
+		"""
+		look up a label of a status or dropdown column, refetching the board if the column or label is missing,
+		as labels may have been added since the board was cached
+		:param direction: 'ids' to get the label text for a label id, 'labels' to get the label id for a label text
+		:return: the label text or id, or None if the key is empty or the label is still missing after refetching
+		"""
+		if key is None or str(key) == '':
+			return None
+		key = str(key)
+		missing_key = (str(board_id), str(column_id), direction, key)
+		now = time.monotonic()
+		if self._missing.get(missing_key, 0) > now:
+			return None
+
+		label_map = self.get_label_map(board_id, column_id)
+		if label_map is None or key not in label_map[direction]:
+			self.refresh(board_id)
+			label_map = self.get_label_map(board_id, column_id)
+		label = label_map[direction].get(key) if label_map is not None else None
+
+		if label is None:
+			self._missing = {k: expiry for k, expiry in self._missing.items() if expiry > now}
+			self._missing[missing_key] = now + self.missing_ttl
+		return label
 
 
 cache = BoardCache()
@@ -1,86 +1,267 @@
 import os
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import monday
 
 import config
 
-from .exceptions import MondayAPIError
+from .exceptions import MondayAPIError, MondayRateLimitError
+from .limiter import limit_client
+from .transport import install_transport
+from .item_cache import invalidate_items
 
 conf = config.get_config()
 
-conn = monday.MondayClient(conf.MONDAY_KEYS["system"])
+# every call made through conn is sent over the pooled per-process transport, via the shared complexity limiter
+conn = limit_client(install_transport(monday.MondayClient(conf.MONDAY_KEYS["system"])))
 
 log = logging.getLogger('eric')
 
+# monday's items query accepts a limit of up to 100 IDs per request
+MAX_ITEMS_PER_QUERY = 100
 
-def get_api_items(item_ids):
-	item_data = []
+COLUMN_VALUE_FIELDS = "id text value type"
+
+
+def item_fields(column_ids=None):
+	"""
+	Build the item selection set for a query
+	:param column_ids: None fetches every column, an empty list fetches only id and name, otherwise only
+		the listed column IDs are fetched
+	"""
+	if column_ids is None:
+		return f"id name column_values {{ {COLUMN_VALUE_FIELDS} }}"
+	elif not column_ids:
+		return "id name"
+	else:
+		ids = json.dumps([str(_) for _ in column_ids])
+		return f"id name column_values(ids: {ids}) {{ {COLUMN_VALUE_FIELDS} }}"
+
+
+def execute_query(query):
+	"""execute a raw GraphQL query and return its 'data' payload"""
+	try:
+		result = conn.custom.execute_custom_query(query)
+	except MondayRateLimitError:
+		raise
+	except Exception as e:
+		raise MondayAPIError(f"Error calling monday API: {e}")
+
+	if result.get("error_message"):
+		raise MondayAPIError(f"Error from Monday: {result['error_message']}")
+	if result.get("errors"):
+		raise MondayAPIError(f"Error from Monday: {[_.get('message') for _ in result['errors']]}")
+
+	return result["data"]
+
+
+def _fetch_item_block(item_id_block, column_ids=None):
+	query = f"""query {{
+		items(ids: {json.dumps(item_id_block)}, limit: {len(item_id_block)}) {{ {item_fields(column_ids)} }}
+	}}"""
+	return execute_query(query)["items"]
+
+
+def get_api_items(item_ids, column_ids=None, chunk_size=None, max_workers=None):
+	"""
+	Fetch items by ID, splitting the IDs into chunks that are requested concurrently.
+	Results are returned in the order of the chunks they were requested in.
+
+	:param item_ids: item IDs to fetch
+	:param column_ids: column projection, see item_fields
+	:param chunk_size: number of IDs per request (defaults to conf.MONDAY_ITEM_CHUNK_SIZE, max 100)
+	:param max_workers: number of requests in flight at once (defaults to conf.MONDAY_MAX_CONCURRENT_REQUESTS)
+	"""
 	item_ids = [int(_) for _ in item_ids]
 	if not item_ids:
 		return []
 
-	# Slice item_ids into blocks of 25
-	item_id_blocks = [item_ids[i:i + 25] for i in range(0, len(item_ids), 25)]
+	chunk_size = chunk_size or conf.MONDAY_ITEM_CHUNK_SIZE
+	if not 0 < chunk_size <= MAX_ITEMS_PER_QUERY:
+		raise ValueError(f"chunk_size must be between 1 and {MAX_ITEMS_PER_QUERY}, got {chunk_size}")
+	max_workers = max_workers or conf.MONDAY_MAX_CONCURRENT_REQUESTS
 
-	for item_id_block in item_id_blocks:
-		try:
-			query_result = conn.items.fetch_items_by_id(ids=item_id_block)
-		except Exception as e:
-			raise MondayAPIError(f"Error calling monday API: {e}")
+	item_id_blocks = [item_ids[i:i + chunk_size] for i in range(0, len(item_ids), chunk_size)]
 
-		if query_result.get("error_message"):
-			raise MondayAPIError(f"Error fetching items from Monday: {query_result['error_message']}")
+	if len(item_id_blocks) == 1 or max_workers == 1:
+		results = [_fetch_item_block(block, column_ids) for block in item_id_blocks]
+	else:
+		with ThreadPoolExecutor(max_workers=min(max_workers, len(item_id_blocks))) as executor:
+			# map preserves block order and re-raises the first MondayAPIError encountered
+			results = list(executor.map(lambda block: _fetch_item_block(block, column_ids), item_id_blocks))
 
-		item_data.extend(query_result["data"]["items"])
+	item_data = []
+	for block_data in results:
+		item_data.extend(block_data)
 
 	return item_data
 
 
-def get_api_items_by_group(board_id, group_id):
-	results = []
+def _next_items_page(cursor, fields):
+	query = f"""query {{
+		next_items_page(limit: {conf.MONDAY_PAGE_SIZE}, cursor: {json.dumps(cursor)}) {{
+			cursor items {{ {fields} }}
+		}}
+	}}"""
+	return execute_query(query)["next_items_page"]
+
+
+def _iter_cursor_pages(api_data, fields):
+	"""
+	yield the items of a cursor page and of every page after it, fetching the next page in the background while the
+	items of the current page are being consumed
+	:param api_data: the first page, {"cursor": ..., "items": [...]}
+	:param fields: the item selection set the first page was fetched with
+	"""
+	executor = ThreadPoolExecutor(max_workers=1)
 	try:
-		raw = conn.groups.get_items_by_group(board_id, group_id)
-	except Exception as e:
-		raise MondayAPIError(f"Error calling monday API: {e}")
+		while True:
+			cursor = api_data.get('cursor')
+			next_page = executor.submit(_next_items_page, cursor, fields) if cursor else None
+			log.debug(f"Cursor: {cursor}, {len(api_data['items'])} items fetched")
+			yield from api_data['items']
+			if next_page is None:
+				return
+			api_data = next_page.result()
+	finally:
+		# a generator closed early does not wait for a page it will never read
+		executor.shutdown(wait=False, cancel_futures=True)
 
-	if raw.get("error_message"):
-		raise MondayAPIError(f"Error fetching items from Monday: {raw['errors']}")
 
-	api_data = raw["data"]["boards"][0]["groups"][0]["items_page"]
-	results.extend(api_data["items"])
+def iter_group_items(board_id, group_id, column_ids=None):
+	"""yield the items of a board group page by page, prefetching the next page"""
+	query = f"""query {{
+		boards(ids: [{int(board_id)}]) {{
+			groups(ids: [{json.dumps(str(group_id))}]) {{
+				items_page(limit: {conf.MONDAY_PAGE_SIZE}) {{ cursor items {{ {item_fields(column_ids)} }} }}
+			}}
+		}}
+	}}"""
+	try:
+		api_data = execute_query(query)["boards"][0]["groups"][0]["items_page"]
+	except IndexError:
+		raise MondayAPIError(f"Group {group_id} not found on board {board_id}")
 
-	while api_data.get('cursor'):
-		raw = conn.groups.get_items_by_group(board_id, group_id, cursor=api_data['cursor'])
-		if raw.get("error_message"):
-			raise MondayAPIError(f"Error fetching items from Monday: {raw['errors']}")
-		api_data = raw["data"]["boards"][0]["groups"][0]["items_page"]
-		results.extend(api_data["items"])
+	yield from _iter_cursor_pages(api_data, item_fields(column_ids))
 
-	return results
 
+def get_api_items_by_group(board_id, group_id, column_ids=None):
+	return list(iter_group_items(board_id, group_id, column_ids))
 
-def get_items_by_board_id(board_id):
 
-	item_data = []
+def iter_board_items(board_id, column_ids=None):
+	"""yield the items of a board page by page, prefetching the next page, so whole boards are not held in memory"""
+	query = f"""query {{
+		boards(ids: [{int(board_id)}]) {{
+			items_page(limit: {conf.MONDAY_PAGE_SIZE}) {{ cursor items {{ {item_fields(column_ids)} }} }}
+		}}
+	}}"""
 	try:
-		query_results = conn.boards.fetch_items_by_board_id(
-			int(board_id)
-		)['data']['boards'][0]['items_page']
-		cursor = query_results.get('cursor')
-		log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-		counter = len(query_results['items'])
-		item_data.extend(query_results['items'])
-		while cursor:
-			query_results = conn.boards.fetch_items_by_board_id(
-				int(board_id),
-				cursor=cursor
-			)['data']['boards'][0]['items_page']
-			cursor = query_results.get('cursor')
-			log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-			counter += len(query_results['items'])
-			item_data.extend(query_results['items'])
-			log.debug(f"Total items fetched: {counter}")
+		api_data = execute_query(query)['boards'][0]['items_page']
+		yield from _iter_cursor_pages(api_data, item_fields(column_ids))
+	except MondayAPIError:
+		raise
 	except Exception as e:
 		raise MondayAPIError(f"Error fetching items by board: {e}")
+
+
+def iter_board_item_updates(board_id):
+	"""yield the id and updated_at time of every item on a board, page by page"""
+	fields = "id updated_at"
+	query = f"""query {{
+		boards(ids: [{int(board_id)}]) {{
+			items_page(limit: {conf.MONDAY_PAGE_SIZE}) {{ cursor items {{ {fields} }} }}
+		}}
+	}}"""
+	try:
+		api_data = execute_query(query)['boards'][0]['items_page']
+	except IndexError:
+		raise MondayAPIError(f"Board {board_id} not found")
+	yield from _iter_cursor_pages(api_data, fields)
+
+
+def get_items_by_board_id(board_id, column_ids=None):
+	item_data = list(iter_board_items(board_id, column_ids))
+	log.debug(f"Total items fetched: {len(item_data)}")
 	return item_data
+
+
+def search_items_by_column_value(board_id, column_id, value, column_ids=None):
+	"""search a board for items with the given value in a column, fetching only the projected columns"""
+	query = f"""query {{
+		items_page_by_column_values(
+			limit: {conf.MONDAY_PAGE_SIZE},
+			board_id: {int(board_id)},
+			columns: [{{column_id: {json.dumps(str(column_id))}, column_values: [{json.dumps(str(value))}]}}]
+		) {{ cursor items {{ {item_fields(column_ids)} }} }}
+	}}"""
+	api_data = execute_query(query)["items_page_by_column_values"]
+	return list(_iter_cursor_pages(api_data, item_fields(column_ids)))
+
+
+def execute_mutations(mutations, batch_size=None):
+	"""
+	Execute many mutation fields as aliases of one mutation, batch_size per request
+	:param mutations: mutation fields, e.g. 'delete_item(item_id: 123) { id }'
+	:param batch_size: mutations per request (defaults to conf.MONDAY_MUTATION_BATCH_SIZE)
+	:returns: the result of each mutation, in the order given
+	"""
+	batch_size = batch_size or conf.MONDAY_MUTATION_BATCH_SIZE
+	results = []
+	for i in range(0, len(mutations), batch_size):
+		batch = mutations[i:i + batch_size]
+		aliased = "\n".join(f"m{index}: {mutation}" for index, mutation in enumerate(batch))
+		try:
+			data = execute_query(f"mutation {{\n{aliased}\n}}")
+		except MondayAPIError:
+			if results:
+				log.error(f"Mutation batch failed after {len(results)} of {len(mutations)} mutations succeeded: {results}")
+			raise
+		results.extend(data[f"m{index}"] for index in range(len(batch)))
+	return results
+
+
+def graphql_json_arg(values):
+	"""format a dict as a JSON string argument, e.g. for column_values"""
+	# the argument is a string containing JSON, so the JSON is dumped a second time to quote it for GraphQL
+	return json.dumps(json.dumps(values))
+
+
+def create_items(board_id, items, group_id=None):
+	"""
+	Create many items on a board in batched requests
+	:param items: (item name, column values) pairs
+	:param group_id: the group to create the items in, the board's top group if not provided
+	:returns: the IDs of the created items, in the order given
+	"""
+	group = f"group_id: {json.dumps(str(group_id))}, " if group_id else ""
+	mutations = [
+		f"create_item(board_id: {int(board_id)}, {group}item_name: {json.dumps(str(name))}, "
+		f"column_values: {graphql_json_arg(column_values or {})}) {{ id }}"
+		for name, column_values in items
+	]
+	return [result['id'] for result in execute_mutations(mutations)]
+
+
+def create_subitems(parent_item_id, subitems):
+	"""
+	Create many subitems under one parent item in batched requests
+	:param subitems: (subitem name, column values) pairs
+	:returns: the IDs of the created subitems, in the order given
+	"""
+	mutations = [
+		f"create_subitem(parent_item_id: {int(parent_item_id)}, item_name: {json.dumps(str(name))}, "
+		f"column_values: {graphql_json_arg(column_values or {})}) {{ id }}"
+		for name, column_values in subitems
+	]
+	return [result['id'] for result in execute_mutations(mutations)]
+
+
+def delete_items(item_ids):
+	"""delete many items (or subitems) in batched requests, returning the deleted IDs"""
+	mutations = [f"delete_item(item_id: {int(item_id)}) {{ id }}" for item_id in item_ids]
+	deleted = [result['id'] for result in execute_mutations(mutations)]
+	invalidate_items(deleted)
+	return deleted
@@ -5,35 +5,100 @@ from datetime import timezone, datetime
 from dateutil import parser as date_parser
 import pytz
 
-from .client import conn as monday_connection
+from .client import conn as monday_connection, search_items_by_column_value
 from .boards import cache as board_cache
 from .exceptions import MondayDataError, MondayAPIError
 
 log = logging.getLogger('eric')
 
 
+def index_column_data(column_values: list) -> dict:
+	"""index the column_values list from an API item by column ID"""
+	return {col['id']: col for col in column_values}
+
+
+class ColumnStore:
+	"""
+	Base for the per item class column storage; subclasses are generated with one slot per declared column
+	(see BaseItemType.get_column_store_class). Unset slots read as the column's empty value, loaded slots hold the
+	RawColumnData of the column until its value is read
+	"""
+	__slots__ = ()
+
+	@classmethod
+	def for_columns(cls, name, column_names):
+		return type(name, (cls,), {'__slots__': tuple(column_names)})
+
+
+class RawColumnData:
+	"""column data as fetched from the API, held in an item's ColumnStore until the column's value is first read"""
+	__slots__ = ('data',)
+
+	def __init__(self, column_data: dict):
+		self.data = column_data
+
+
 class ValueType(abc.ABC):
+	"""
+	A column declared at class level on an item type. Reading the attribute from an item returns a ColumnValue bound
+	to that item, while the value itself is kept in the item's ColumnStore
+	"""
+
 	def __init__(self, column_id):
 		self.column_id = column_id
-		self._value = None
+		self.name = None
+
+	def __set_name__(self, owner, name):
+		self.name = name
+
+	def __get__(self, item, owner=None):
+		if item is None:
+			return self
+		return ColumnValue(self, item)
 
 	def __str__(self):
-		return str(self._value)
+		return f"{self.__class__.__name__}({self.column_id})"
 
 	def __repr__(self):
-		return str(self._value)
+		return str(self)
+
+	def get_value(self, item):
+		try:
+			value = getattr(item._column_store, self.name)
+		except AttributeError:
+			return self.empty_value()
+		if type(value) is RawColumnData:
+			# decoded on first read, most code paths only read a few of an item's columns
+			value = self.parse_column_value(value.data)
+			setattr(item._column_store, self.name, value)
+		return value
+
+	def set_value(self, item, new_value):
+		setattr(item._column_store, self.name, self.validate(new_value))
+
+	def empty_value(self):
+		return None
 
 	@abc.abstractmethod
-	def column_api_data(self, search=None):
+	def validate(self, new_value):
+		"""check a value being set on an item, returning the value to store"""
 		raise NotImplementedError
 
 	@abc.abstractmethod
-	def load_column_value(self, column_data: dict):
+	def column_api_data(self, value):
+		raise NotImplementedError
+
+	@abc.abstractmethod
+	def parse_column_value(self, column_data: dict):
+		"""convert the column data fetched from the API into this column's value"""
 		log.debug(f"Loading column value for {self.column_id}")
 
-	def search_for_board_items(self, board_id, value):
+	def search_for_board_items(self, board_id, value, column_ids=None):
 		# search for items on the board with the given value
 		# return the item data
+		if column_ids is not None:
+			# projected searches are built by the client; monday matches on the column's text value
+			return search_items_by_column_value(board_id, self.column_id, value, column_ids=column_ids)
 		col_data = self.column_api_data(value)
 		r = monday_connection.items.fetch_items_by_column_value(board_id, self.column_id, col_data[self.column_id])
 		if r.get('data'):
@@ -44,31 +109,75 @@ class ValueType(abc.ABC):
 			raise MondayAPIError(f"Error searching for items with value {value} in column {self.column_id}: {r}")
 
 
-class TextValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
+class ColumnValue:
+	"""A column bound to an item, giving access to the item's value for that column"""
+	__slots__ = ('column', 'item')
+
+	def __init__(self, column: ValueType, item):
+		self.column = column
+		self.item = item
+
+	def __str__(self):
+		return str(self.value)
+
+	def __repr__(self):
+		return str(self.value)
+
+	def __getattr__(self, name):
+		# column specific helpers, e.g. StatusValue.get_label_id
+		if name in ColumnValue.__slots__:
+			raise AttributeError(name)
+		return getattr(self.column, name)
+
+	@property
+	def column_id(self):
+		return self.column.column_id
 
 	@property
 	def value(self):
-		return self._value
+		return self.column.get_value(self.item)
 
 	@value.setter
 	def value(self, new_value):
-		if isinstance(new_value, str):  # or any other condition you want to check
-			self._value = new_value
-		else:
-			raise ValueError(f"Invalid value: {new_value} ({type(new_value)})")
+		self.column.set_value(self.item, new_value)
 
 	def column_api_data(self, search=None):
-		# prepare self.value for submission here
+		# prepare self.value for submission here, or the search value if provided
 		if search:
-			value = str(search)
-		else:
-			value = str(self.value)
-		return {self.column_id: value}
+			return self.column.column_api_data(search)
+		return self.column.column_api_data(self.value)
 
 	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+		# the column data is decoded by parse_column_value when the value is first read; parsed values are already
+		# valid, so they are stored without going through validate
+		setattr(self.item._column_store, self.column.name, RawColumnData(column_data))
+
+	def load_from_index(self, column_index: dict):
+		"""load this column's value from column data indexed by column ID (see index_column_data)"""
+		try:
+			column_data = column_index[self.column_id]
+		except KeyError:
+			raise ValueError(f"Column with ID {self.column_id} not found in item data")
+		self.load_column_value(column_data)
+
+	def search_for_board_items(self, board_id, value, column_ids=None):
+		return self.column.search_for_board_items(board_id, value, column_ids=column_ids)
+
+
+class TextValue(ValueType):
+
+	def validate(self, new_value):
+		if isinstance(new_value, str):  # or any other condition you want to check
+			return new_value
+		else:
+			raise ValueError(f"Invalid value: {new_value} ({type(new_value)})")
+
+	def column_api_data(self, value):
+		# prepare value for submission here
+		return {self.column_id: str(value)}
+
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -80,40 +189,26 @@ class TextValue(ValueType):
 		else:
 			value = str(value)
 
-		log.debug("Loaded column value: %s", value)
-
-		self.value = value
-		return self.value
+		return value
 
 
 class NumberValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
-
-	@property
-	def value(self):
-		return self._value
 
-	@value.setter
-	def value(self, new_value):
+	def validate(self, new_value):
 		if isinstance(new_value, (int, float)):  # or any other condition you want to check
-			self._value = new_value
+			return new_value
 		else:
 			raise ValueError(f"Invalid value: {new_value} ({type(new_value)})")
 
-	def column_api_data(self, search=None):
-		# prepare self.value for submission here
-		if search:
-			value = search
-		else:
-			value = self.value
+	def column_api_data(self, value):
+		# prepare value for submission here
 		if isinstance(value, (int, float)):
 			return {self.column_id: value}
 		else:
 			raise ValueError(f"Invalid value: {value} ({type(value)})")
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -122,41 +217,26 @@ class NumberValue(ValueType):
 		if value is None or value == "":
 			# api has fetched a None value, indicating an emtpy column
 			value = 0
-		elif isinstance(value, str):
-			value = float(value)
 		else:
 			value = float(value)
 
-		log.debug("Loaded column value: %s", value)
-		self.value = value
-		return self.value
+		return value
 
 
 class StatusValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
-
-	@property
-	def value(self):
-		return self._value
 
-	@value.setter
-	def value(self, new_value):
+	def validate(self, new_value):
 		if isinstance(new_value, str):  # or any other condition you want to check
-			self._value = new_value
+			return new_value
 		else:
 			raise ValueError("Invalid value")
 
-	def column_api_data(self, search=None):
-		# prepare self.value for submission here
-		if search:
-			value = str(search)
-		else:
-			value = str(self.value)
-		return {self.column_id: {"label": value}}
+	def column_api_data(self, value):
+		# prepare value for submission here
+		return {self.column_id: {"label": str(value)}}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -168,77 +248,54 @@ class StatusValue(ValueType):
 		else:
 			value = str(value)
 
-		log.debug("Loaded column value: %s", value)
+		return value
 
-		self.value = value
-		return self.value
+	def get_label_map(self, board_id):
+		label_map = board_cache.get_label_map(board_id, self.column_id)
+		if label_map is None:
+			raise MondayDataError(f"Column {self.column_id} not found in board {board_id}")
+		return label_map
 
 	def get_label_conversion_dict(self, board_id):
-		board = board_cache.get_board(board_id)
-		try:
-			column = [col for col in board['columns'] if str(col['id']) == str(self.column_id)][0]
-		except IndexError:
-			raise MondayDataError(f"Column {self.column_id} not found in board {str(board)}")
-
-		formatted_dict = {}
-		label_dict = json.loads(column['settings_str'])['labels']
-		for key, value in label_dict.items():
-			formatted_dict[str(value)] = str(key)
-			formatted_dict[str(key)] = str(value)
-
-		return formatted_dict
+		# label ids and label texts, mapped to each other in both directions
+		label_map = self.get_label_map(board_id)
+		return {**label_map['ids'], **label_map['labels']}
 
 	def get_label_id(self, board_id, label):
 		# get the id of the label with the given name
-		label_dict = self.get_label_conversion_dict(board_id)
-		try:
-			label_id = label_dict[label]
-		except KeyError:
+		label_id = board_cache.lookup_label(board_id, self.column_id, label, direction='labels')
+		if label_id is None:
 			raise MondayDataError(f"Label {label} not found in column {self.column_id} on board {board_id}")
 		return label_id
 
 	def get_label_text(self, board_id, label_id):
 		# get the text of the label with the given id
-		label_dict = self.get_label_conversion_dict(board_id)
-		try:
-			label_text = label_dict[str(label_id)]
-		except KeyError:
+		label_text = board_cache.lookup_label(board_id, self.column_id, label_id, direction='ids')
+		if label_text is None:
 			raise MondayDataError(f"Label id {label_id} not found in column {self.column_id} on board {board_id}")
 		return label_text
 
 
 class DateValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
 
-	@property
-	def value(self):
-		return self._value
-
-	@value.setter
-	def value(self, new_value: datetime):
+	def validate(self, new_value: datetime):
 		# make sure it is a datetime in UTC
 		if isinstance(new_value, datetime):
-			self._value = new_value
+			pass
 
 		elif new_value is None:
 			# allow setting to None, column is cleared
-			self._value = None
+			pass
 
 		else:
 			raise ValueError(f"Invalid value: {new_value} ({type(new_value)})")
 
 		log.debug("Set date value: %s", new_value)
+		return new_value
 
-	def column_api_data(self, search=None):
-		# prepare self.value for submission here
+	def column_api_data(self, value):
+		# prepare value for submission here
 		# desired string format: 'YYYY-MM-DD HH:MM:SS'
-
-		if search:
-			value = search
-		else:
-			value = self.value
-
 		if not value:
 			value = ''
 		else:
@@ -247,8 +304,8 @@ class DateValue(ValueType):
 			value = value.strftime('%Y-%m-%d %H:%M:%S')
 		return {self.column_id: value}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -273,25 +330,16 @@ class DateValue(ValueType):
 				raise ValueError(f"Error parsing date value: {value}")
 			assert (isinstance(value, datetime))
 
-		log.debug("Loaded column value: %s", value)
-
-		self.value = value
-		return self.value
+		return value
 
 
 class LinkURLValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
+	"""value is a [text, url] pair"""
 
-		self.url = None
-		self.text = None
+	def empty_value(self):
+		return [None, None]
 
-	@property
-	def value(self):
-		return [self.text, self.url]
-
-	@value.setter
-	def value(self, text_and_url: tuple | list):
+	def validate(self, text_and_url: tuple | list):
 		if (
 				isinstance(text_and_url, (tuple, list))
 				and len(text_and_url) == 2
@@ -301,34 +349,24 @@ class LinkURLValue(ValueType):
 				text = None
 			if not url:
 				url = None
-			self.text = text
-			self.url = url
+			return [text, url]
 		else:
 			raise ValueError("Invalid value")
 
-	def column_api_data(self, search=None):
+	def column_api_data(self, value):
 		"""
-		create a value to save or searcg the api
-		:param search: if search is provided, it will be used instead of self.value
-			format of search = [text, url]
+		create a value to save or search the api
+		:param value: [text, url]
 		"""
-		# prepare self.value for submission here
-		if search:
-			text, url = search
-		else:
-			if self.text:
-				text = self.text
-			else:
-				text = ""
-
-			if self.url:
-				url = self.url
-			else:
-				url = ""
+		text, url = value
+		if not text:
+			text = ""
+		if not url:
+			url = ""
 		return {self.column_id: {'text': text, 'url': url}}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -336,53 +374,37 @@ class LinkURLValue(ValueType):
 
 		if value is None or value == "":
 			# api has fetched a None value, indicating an emtpy column
-			self.text = None
-			self.url = None
+			return [None, None]
 		else:
 			value = str(value)
 			split_value = [str(_.strip()) for _ in value.split("-")]
 			if len(split_value) == 2:
-				self.text, self.url = split_value
+				return split_value
 			elif len(split_value) > 2:
-				self.text = " - ".join(split_value[:-1])
-				self.url = split_value[-1]
+				return [" - ".join(split_value[:-1]), split_value[-1]]
 			else:
 				raise InvalidColumnData(column_data, 'text - url could not be split')
 
-		return self.value
-
 
 class ConnectBoards(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
-
-	@property
-	def value(self):
-		return self._value
 
-	@value.setter
-	def value(self, new_ids_list):
+	def validate(self, new_ids_list):
 		if isinstance(new_ids_list, (list, tuple)):
 			# make sure the ids are integers
 			try:
-				new_ids = [int(_) for _ in new_ids_list]
+				return [int(_) for _ in new_ids_list]
 			except ValueError:
 				raise ValueError(f"Invalid value: {new_ids_list}")
-			self._value = new_ids
 		else:
 			raise ValueError(f"Invalid value: {new_ids_list}")
 
-	def column_api_data(self, search=None):
-		# prepare self.value for submission here
+	def column_api_data(self, value):
+		# prepare value for submission here
 		# desired format: {col_id: {item_ids: [id1, id2, id3]}}
-		if search:
-			item_ids = search
-		else:
-			item_ids = self.value
-		return {self.column_id: {"item_ids": item_ids}}
+		return {self.column_id: {"item_ids": value}}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value_data = column_data['value']
 		except KeyError:
@@ -402,8 +424,7 @@ class ConnectBoards(ValueType):
 			except Exception as e:
 				raise InvalidColumnData(column_data, 'value - linkedPulseIds')
 
-		self.value = linked_ids
-		return self.value
+		return linked_ids
 
 
 class MirroredDataValue(ValueType):
@@ -411,20 +432,15 @@ class MirroredDataValue(ValueType):
 		super().__init__(column_id)
 		raise MondayDataError("MirroredDataValue cannot be used yet")
 
-	@property
-	def value(self):
-		return self._value
-
-	@value.setter
-	def value(self, new_value):
+	def validate(self, new_value):
 		raise ValueError("Cannot set value for a mirrored column")
 
-	def column_api_data(self, search=None):
+	def column_api_data(self, value):
 		raise EditingNotAllowed(self.column_id)
 
-	def load_column_value(self, column_data: dict):
+	def parse_column_value(self, column_data: dict):
 		# this is probably incorrect, but we cannot get values from the API yet so will rewrite when we can
-		super().load_column_value(column_data)
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -436,37 +452,23 @@ class MirroredDataValue(ValueType):
 		else:
 			value = str(value)
 
-		log.debug("Loaded column value: %s", value)
-
-		self.value = value
-		return self.value
+		return value
 
 
 class LongTextValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
 
-	@property
-	def value(self):
-		return self._value
-
-	@value.setter
-	def value(self, new_value):
+	def validate(self, new_value):
 		if isinstance(new_value, str):  # or any other condition you want to check
-			self._value = new_value
+			return new_value
 		else:
 			raise ValueError("Invalid value")
 
-	def column_api_data(self, search=None):
-		# prepare self.value for submission here
-		if search:
-			value = str(search)
-		else:
-			value = str(self.value)
-		return {self.column_id: value}
+	def column_api_data(self, value):
+		# prepare value for submission here
+		return {self.column_id: str(value)}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		try:
 			value = column_data['text']
 		except KeyError:
@@ -478,38 +480,24 @@ class LongTextValue(ValueType):
 		else:
 			value = str(value)
 
-		log.debug("Loaded column value: %s", value)
-
-		self.value = value
-		return self.value
+		return value
 
 
 class PeopleValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
-
-	@property
-	def value(self):
-		return self._value
 
-	@value.setter
-	def value(self, new_value):
+	def validate(self, new_value):
 		if isinstance(new_value, list):  # or any other condition you want to check
-			self._value = [int(_) for _ in new_value]
+			return [int(_) for _ in new_value]
 		else:
 			raise ValueError(f"Invalid value: {new_value} ({type(new_value)})")
 
-	def column_api_data(self, search: list | tuple = None):
-		# prepare self.value for submission here
-		if search:
-			people_ids = search
-		else:
-			people_ids = self.value
-		str_ids = ", ".join([str(_) for _ in people_ids])
+	def column_api_data(self, value: list | tuple):
+		# prepare value for submission here
+		str_ids = ", ".join([str(_) for _ in value])
 		return {self.column_id: str_ids}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		value_data = column_data['value']
 		if value_data is None:
 			# connected boards column is empty
@@ -525,48 +513,28 @@ class PeopleValue(ValueType):
 			except Exception as e:
 				raise InvalidColumnData(column_data, 'value - personAndTeams')
 
-		value = people_ids
-
-		log.debug("Loaded column value: %s", value)
-
-		self.value = value
-		return self.value
+		return people_ids
 
 
 class DropdownValue(ValueType):
-	def __init__(self, column_id: str):
-		super().__init__(column_id)
-
-		self.ids = []
-		self.text_labels = []
-
-	@property
-	def value(self):
-		return self._value
 
-	@value.setter
-	def value(self, new_ids_list):
+	def validate(self, new_ids_list):
 		if isinstance(new_ids_list, (list, tuple)):
 			# make sure the ids are integers
 			try:
-				new_ids = [int(_) for _ in new_ids_list]
+				return [int(_) for _ in new_ids_list]
 			except ValueError:
 				raise ValueError(f"Invalid value (dropdowns can only bet set with ids, not labels): {new_ids_list}")
-			self._value = new_ids
 		else:
 			raise ValueError(f"Invalid value: {new_ids_list}")
 
-	def column_api_data(self, search=None):
-		# prepare self.value for submission here
+	def column_api_data(self, value):
+		# prepare value for submission here
 		# desired format: {col_id: {ids: [id1, id2, id3]}}
-		if search:
-			item_ids = search
-		else:
-			item_ids = self.value
-		return {self.column_id: {"ids": item_ids}}
+		return {self.column_id: {"ids": value}}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		value_data = column_data['value']
 		if value_data is None:
 			# connected boards column is empty
@@ -577,62 +545,43 @@ class DropdownValue(ValueType):
 			except json.JSONDecodeError:
 				raise InvalidColumnData(column_data, 'json.loads(value)')
 			try:
-				dd_ids = value_data.get('ids', [])
+				dd_ids = [int(_) for _ in value_data.get('ids', [])]
 			except Exception as e:
 				raise InvalidColumnData(column_data, 'value - linkedPulseIds')
 
-		self.value = dd_ids
-		return self.value
+		return dd_ids
 
 
 class CheckBoxValue(ValueType):
 
-	@property
-	def value(self):
-		return self._value
-
-	@value.setter
-	def value(self, value):
+	def validate(self, value):
 		if isinstance(value, bool):
-			self._value = value
+			return value
 		else:
 			raise ValueError(f"Invalid value: {value}, must be bool")
 
-	def column_api_data(self, search=None):
-		if search:
-			val = search
-		else:
-			val = self.value
-		return {self.column_id: {'checked': val}}
+	def column_api_data(self, value):
+		return {self.column_id: {'checked': value}}
 
-	def load_column_value(self, column_data: dict):
-		super().load_column_value(column_data)
+	def parse_column_value(self, column_data: dict):
+		super().parse_column_value(column_data)
 		value_data = json.loads(column_data['value'])
-
-		self.value = value_data['checked']
-		return self.value
+		return value_data['checked']
 
 
 class TimeTrackingColumn(ValueType):
 
-	@property
-	def value(self):
-		return self._value
-
-	@value.setter
-	def value(self, value):
+	def validate(self, value):
 		raise EditingNotAllowed(self.column_id)
 
-	def column_api_data(self, search=None):
+	def column_api_data(self, value):
 		raise EditingNotAllowed(self.column_id)
 
-	def load_column_value(self, column_data: dict):
+	def parse_column_value(self, column_data: dict):
 		value_data = json.loads(column_data['value'])
 		if not value_data.get('duration'):
-			return 0
-		duration = int(value_data['duration'])
-		self._value = duration
-		return self._value
+			return None
+		return int(value_data['duration'])
 
 
 class InvalidColumnData(MondayDataError):
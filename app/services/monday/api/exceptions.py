@@ -16,3 +16,13 @@ class MondayAPIError(MondayError):
 
 class MondayDataError(MondayError):
 	pass
+
+
+class MondayItemNotFoundError(MondayDataError):
+	"""raised when an item does not exist (or has been deleted) on monday"""
+	pass
+
+
+class MondayRateLimitError(MondayAPIError):
+	"""raised when monday's complexity budget will not reset within the time a call is allowed to wait"""
+	pass
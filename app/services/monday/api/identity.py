@@ -0,0 +1,64 @@
+import logging
+import contextvars
+from contextlib import contextmanager
+
+log = logging.getLogger('eric')
+
+_identity_map = contextvars.ContextVar('monday_identity_map', default=None)
+
+
+class IdentityMap:
+	"""the items fetched from the API within one scope, by item type and ID"""
+
+	def __init__(self):
+		self._items = {}
+
+	def __len__(self):
+		return len(self._items)
+
+	@staticmethod
+	def _key(item_type, item_id):
+		return item_type, str(item_id)
+
+	def get(self, item_type, item_id):
+		return self._items.get(self._key(item_type, item_id))
+
+	def add(self, item):
+		self._items[self._key(type(item), item.id)] = item
+
+	def discard_ids(self, item_ids):
+		"""drop items that have changed, of any item type, so they are fetched again when next constructed"""
+		item_ids = {str(_) for _ in item_ids}
+		for key in [key for key in self._items if key[1] in item_ids]:
+			del self._items[key]
+
+
+def current_identity_map():
+	"""the identity map of the current scope, or None outside of an item scope"""
+	return _identity_map.get()
+
+
+def open_item_scope():
+	"""start an item scope, returning a token for close_item_scope (None when a scope is already open)"""
+	if _identity_map.get() is not None:
+		return None
+	return _identity_map.set(IdentityMap())
+
+
+def close_item_scope(token):
+	if token is not None:
+		_identity_map.reset(token)
+
+
+@contextmanager
+def item_scope():
+	"""
+	Within an item scope, constructing an item type by ID alone returns the instance already fetched in the scope,
+	until the item is invalidated (item_cache.invalidate_items). Scopes are opened per Flask request and per RQ job,
+	a nested scope shares the outer scope's map
+	"""
+	token = open_item_scope()
+	try:
+		yield current_identity_map()
+	finally:
+		close_item_scope(token)
@@ -0,0 +1,127 @@
+import json
+import time
+import logging
+
+import redis
+
+from ....cache import get_redis_connection
+from ....cache.rq import q_low, enqueue_once
+from .identity import current_identity_map
+
+log = logging.getLogger('eric')
+
+
+# seconds an item's invalidation count is kept, far longer than any fetch of the item takes
+GENERATION_TTL = 60 * 60
+
+
+def item_cache_key(item_id):
+	return f"monday:item:{item_id}"
+
+
+def item_generation_key(item_id):
+	# incremented each time the item is invalidated, so data fetched before an invalidation is not cached after it
+	return f"monday:item:{item_id}:generation"
+
+
+def get_generation(item_id):
+	"""the number of times an item has been invalidated recently, read before fetching data to pass to set_item_data"""
+	try:
+		return int(get_redis_connection().get(item_generation_key(item_id)) or 0)
+	except redis.RedisError as e:
+		log.warning(f"Could not read item {item_id} generation: {e}")
+		return None
+
+
+def _projection_field(column_ids):
+	# each column projection of an item is cached separately, in one hash per item so they are invalidated together
+	if column_ids is None:
+		return "*"
+	return ",".join(sorted(str(_) for _ in column_ids))
+
+
+def get_item_data(item_id, ttl, column_ids=None, soft_ttl=None):
+	"""
+	get an item's cached API data for a column projection, or None if it is not cached or older than ttl seconds
+	:param soft_ttl: data older than this is still returned, and refreshed by a background job
+	"""
+	try:
+		cached = get_redis_connection().hget(item_cache_key(item_id), _projection_field(column_ids))
+	except redis.RedisError as e:
+		log.warning(f"Could not read item {item_id} from cache: {e}")
+		return None
+	if cached is None:
+		return None
+	cached = json.loads(cached)
+	age = time.time() - cached['cached_at']
+	if age > ttl:
+		return None
+	if soft_ttl is not None and age > soft_ttl:
+		enqueue_once(
+			q_low,
+			f"item_cache:refresh:{item_id}:{_projection_field(column_ids)}",
+			refresh_item_data,
+			item_id,
+			ttl,
+			column_ids,
+		)
+	return cached['data']
+
+
+def set_item_data(item_id, item_data, ttl, column_ids=None, generation=None):
+	"""
+	cache an item's API data for a column projection for ttl seconds
+	:param generation: the item's get_generation() from before the data was fetched, the data is not cached if the
+		item has been invalidated since
+	"""
+	cached = json.dumps({"cached_at": time.time(), "data": item_data})
+	field = _projection_field(column_ids)
+	try:
+		redis_connection = get_redis_connection()
+		if generation is not None and get_generation(item_id) != generation:
+			log.debug(f"Item {item_id} changed while it was being fetched, not caching it")
+			return False
+		pipe = redis_connection.pipeline()
+		pipe.hset(item_cache_key(item_id), field, cached)
+		pipe.expire(item_cache_key(item_id), int(ttl))
+		pipe.execute()
+		if generation is not None and get_generation(item_id) != generation:
+			# invalidated between the check and the write, which may have deleted the item before it was written
+			redis_connection.hdel(item_cache_key(item_id), field)
+			return False
+	except redis.RedisError as e:
+		log.warning(f"Could not write item {item_id} to cache: {e}")
+		return False
+	return True
+
+
+def refresh_item_data(item_id, ttl, column_ids=None):
+	"""fetch an item's API data into the cache, enqueued by reads that find it past its soft TTL"""
+	# the client imports this module
+	from .client import get_api_items
+
+	generation = get_generation(item_id)
+	item_data = get_api_items([item_id], column_ids=column_ids)
+	if item_data:
+		set_item_data(item_id, item_data[0], ttl, column_ids=column_ids, generation=generation)
+	else:
+		invalidate_items([item_id])
+
+
+def invalidate_items(item_ids):
+	"""drop the cached API data of items that have changed, and the instances shared in the current item scope"""
+	item_ids = [item_id for item_id in item_ids if item_id]
+	if not item_ids:
+		return
+	identity_map = current_identity_map()
+	if identity_map is not None:
+		identity_map.discard_ids(item_ids)
+	try:
+		pipe = get_redis_connection().pipeline()
+		pipe.delete(*[item_cache_key(item_id) for item_id in item_ids])
+		for item_id in item_ids:
+			pipe.incr(item_generation_key(item_id))
+			pipe.expire(item_generation_key(item_id), GENERATION_TTL)
+		pipe.execute()
+	except redis.RedisError as e:
+		log.warning(f"Could not invalidate cached items {item_ids}: {e}")
@@ -1,50 +1,110 @@
 import logging
 import abc
-import json
 
 import monday.exceptions
 import redis.utils
 
-from .columns import ValueType, EditingNotAllowed
-from .exceptions import MondayDataError, MondayAPIError
-from ....cache import get_redis_connection, CacheMiss
-from .client import get_api_items, conn
-from . boards import cache as board_cache
+from .columns import ValueType, ColumnValue, ColumnStore, EditingNotAllowed, index_column_data
+from .exceptions import MondayDataError, MondayAPIError, MondayRateLimitError, MondayItemNotFoundError
+from ....cache import get_redis_connection, CacheMiss, catalog
+from ....cache.rq import q_low, enqueue_once
+from .client import get_api_items, iter_board_items, create_items, create_subitems, conn
+from .boards import cache as board_cache, compile_label_maps
+from . import item_cache
+from .identity import current_identity_map
 from ....utilities import notify_admins_of_error
 
 log = logging.getLogger('eric')
 
 
-class BaseItemType:
+class ItemTypeMeta(type):
+
+	def __call__(cls, *args, **kwargs):
+		# within an item scope, an item constructed by ID alone is the instance already fetched in the scope
+		identity_map = current_identity_map()
+		if identity_map is not None and (len(args) == 1 and not kwargs or not args and list(kwargs) == ['item_id']):
+			item_id = args[0] if args else kwargs['item_id']
+			existing = identity_map.get(cls, item_id) if item_id else None
+			if existing is not None:
+				log.debug(f"Reusing {existing} from the item scope")
+				return existing
+		return super().__call__(*args, **kwargs)
+
+
+class BaseItemType(metaclass=ItemTypeMeta):
 	BOARD_ID = None
 
+	# when True, fetches made by the item type only request the columns it declares
+	PROJECT_COLUMNS = False
+
+	# seconds that API data fetched by load_from_api is shared through Redis, None to always fetch from the API
+	# entries are invalidated when the item is committed and by the webhooks that report changes to it
+	API_CACHE_TTL = None
+	# seconds after which a shared entry is still used, but refreshed in the background (None to never refresh)
+	API_CACHE_SOFT_TTL = None
+
 	@classmethod
-	def fetch_all(cls, *args):
+	def iter_all(cls):
+		"""yield every item on the board as it is fetched, page by page"""
 		log.debug(f"Fetching all items for {cls.__name__}")
-		query_results = conn.boards.fetch_items_by_board_id(cls.BOARD_ID)['data']['boards'][0]['items_page']
-		cursor = query_results['cursor']
-		items = [cls(item['id'], item) for item in query_results['items']]
-		while cursor:
-			query_results = conn.boards.fetch_items_by_board_id(
-				cls.BOARD_ID,
-				cursor=cursor
-			)['data']['boards'][0]['items_page']
-			cursor = query_results['cursor']
-			items += [cls(item['id'], item) for item in query_results['items']]
-			log.debug(f"Cursor: {cursor}, {len(query_results['items'])} items fetched")
-			if not cursor:
-				break
-		return items
+		for item in iter_board_items(cls.BOARD_ID, column_ids=cls.default_column_ids()):
+			yield cls(item['id'], item)
 
 	@classmethod
-	def get(cls, item_ids):
+	def fetch_all(cls, *args):
+		return list(cls.iter_all())
+
+	@classmethod
+	def get(cls, item_ids, column_ids=None):
+		if column_ids is None:
+			column_ids = cls.default_column_ids()
 		results = []
-		item_data = get_api_items(item_ids)
+		item_data = get_api_items(item_ids, column_ids=column_ids)
 		for item in item_data:
 			results.append(cls(item['id'], item))
 		return results
 
+	@classmethod
+	def get_columns(cls):
+		"""
+		returns {attribute name: ValueType} for every column declared on this item type
+		built once per class from the class level declarations
+		"""
+		if '_columns' not in cls.__dict__:
+			declared = {}
+			for klass in reversed(cls.__mro__):
+				declared.update(vars(klass))
+			cls._columns = {name: att for name, att in declared.items() if isinstance(att, ValueType)}
+		return cls._columns
+
+	@classmethod
+	def get_column_map(cls):
+		"""returns {attribute name: column ID} for every column declared on this item type"""
+		if '_column_map' not in cls.__dict__:
+			cls._column_map = {name: col.column_id for name, col in cls.get_columns().items()}
+		return cls._column_map
+
+	@classmethod
+	def get_column_store_class(cls):
+		"""the slotted class that holds column values for instances of this item type, one slot per column"""
+		if '_column_store_class' not in cls.__dict__:
+			cls._column_store_class = ColumnStore.for_columns(f"{cls.__name__}Columns", cls.get_columns())
+		return cls._column_store_class
+
+	@classmethod
+	def get_column_ids(cls):
+		"""returns the IDs of every column declared on this item type"""
+		return list(cls.get_column_map().values())
+
+	@classmethod
+	def default_column_ids(cls):
+		"""the column projection used when this item type fetches its own data (None fetches every column)"""
+		if cls.PROJECT_COLUMNS:
+			return cls.get_column_ids()
+		return None
+
 	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
+		self._column_store = self.get_column_store_class()()
 		self.id = item_id
 		self.name = None
 
@@ -62,10 +122,11 @@ class BaseItemType:
 			return f"{self.__class__.__name__}({self.id})"
 
 	def __setattr__(self, name, value):
-		# Check if the attribute being assigned is an instance of ValueType
-		if getattr(self, name, None) and isinstance(getattr(self, name), ValueType):
-			getattr(self, name).value = value
-			self.staged_changes.update(getattr(self, name).column_api_data())
+		# assigning to a declared column sets its value and stages the change
+		if name in self.get_columns():
+			column = getattr(self, name)
+			column.value = value
+			self.staged_changes.update(column.column_api_data())
 		else:
 			# Call the parent class's __setattr__ method
 			super().__setattr__(name, value)
@@ -77,12 +138,23 @@ class BaseItemType:
 		elif not api_data and self.id:
 			self.load_from_api()
 
-	def load_from_api(self, api_data=None):
-		# load the item data from the API
+	def load_from_api(self, api_data=None, column_ids=None):
+		"""
+		load the item data from the API
+		:param api_data: item data already fetched from the API, fetched if not provided
+		:param column_ids: the column projection to fetch or that api_data was fetched with; declared columns outside
+			of the projection are left unloaded
+		"""
 		log.debug(f"Loading item data for {self.__class__.__name__} {self.id}")
+		identity_map = current_identity_map()
+		fetched = False
+		if column_ids is None and not api_data:
+			column_ids = self.default_column_ids()
+			fetched = True
+
 		if not api_data and self.id:
 			log.debug("No Data provided, fetching...")
-			api_data = get_api_items([self.id])[0]
+			api_data = self._fetch_api_data(column_ids)
 		elif not api_data and not self.id:
 			raise IncompleteItemError(self, "Item ID not set (not created)")
 
@@ -90,29 +162,44 @@ class BaseItemType:
 			raise MondayDataError(f"Item ID {self.id} does not match ID in API data: {api_data['id']}")
 
 		assert 'id' in api_data
-		assert 'column_values' in api_data
 		assert 'name' in api_data
 
 		self._api_data = api_data
-		self._column_data = api_data['column_values']
+		# id and name only projections do not include column_values
+		self._column_data = api_data.get('column_values', [])
 
 		self.id = api_data['id']
 		self.name = api_data['name']
 
-		for att in dir(self):
-			instance_property = getattr(self, att)
-			if isinstance(instance_property, ValueType):
-				desired_column_id = instance_property.column_id
-				try:
-					column_data = [col for col in self._column_data if col['id'] == desired_column_id][0]
-				except IndexError:
-					raise ValueError(f"Column with ID {desired_column_id} not found in item data")
-
-				instance_property.load_column_value(column_data)
+		if 'column_values' in api_data:
+			column_index = index_column_data(self._column_data)
+			for att, column_id in self.get_column_map().items():
+				if column_ids is not None and column_id not in column_ids:
+					continue
+				getattr(self, att).load_from_index(column_index)
 
 		self.staged_changes = {}
+		if fetched and identity_map is not None:
+			identity_map.add(self)
 		return self
 
+	def _fetch_api_data(self, column_ids=None):
+		if self.API_CACHE_TTL:
+			api_data = item_cache.get_item_data(
+				self.id, self.API_CACHE_TTL, column_ids=column_ids, soft_ttl=self.API_CACHE_SOFT_TTL
+			)
+			if api_data:
+				log.debug(f"Loaded {self.__class__.__name__} {self.id} from item cache")
+				return api_data
+
+		generation = item_cache.get_generation(self.id) if self.API_CACHE_TTL else None
+		api_data = get_api_items([self.id], column_ids=column_ids)[0]
+		if self.API_CACHE_TTL:
+			item_cache.set_item_data(
+				self.id, api_data, self.API_CACHE_TTL, column_ids=column_ids, generation=generation
+			)
+		return api_data
+
 	def commit(self, name=None, reload=False):
 		# commit changes to the API
 		if not self.id and not name:
@@ -127,12 +214,14 @@ class BaseItemType:
 			)
 			if res.get('error_message'):
 				raise MondayAPIError(f"{str(self)} could not Commit: {res.get('error_message')}")
+		except MondayRateLimitError:
+			raise
 		except Exception as e:
 			raise MondayAPIError(f"Error calling monday API: {e}")
 
+		item_cache.invalidate_items([self.id])
 		if reload:
-			api_data = get_api_items([self.id])[0]
-			self.load_from_api(api_data)
+			self.load_from_api()
 
 		return self
 
@@ -151,6 +240,9 @@ class BaseItemType:
 				raise MondayAPIError(f"Error creating item: {new_item['error_message']}")
 			self.id = new_item['data']['create_item']['id']
 			return self
+		except MondayRateLimitError:
+			# the limiter has already waited for the budget, retrying would only spend more of it
+			raise
 		except monday.exceptions.MondayQueryError as e1:
 			name = name.replace("(", "").replace(")", "")
 			try:
@@ -169,6 +261,36 @@ class BaseItemType:
 			log.error("Staged changes: " + str(self.staged_changes))
 			raise MondayAPIError(f"Error calling monday API: {e}")
 
+	@classmethod
+	def bulk_create(cls, named_items, group_id=None):
+		"""
+		create many items on this board in batched requests, each with its staged changes as column values
+		:param named_items: (name, item) pairs, where each item is an uncreated instance of this type
+		:returns: the created items, in the order given
+		"""
+		item_ids = create_items(cls.BOARD_ID, [(name, item.staged_changes) for name, item in named_items], group_id)
+		return cls._set_created_ids(named_items, item_ids)
+
+	@classmethod
+	def bulk_create_subitems(cls, parent_item_id, named_items):
+		"""
+		create many subitems of this type under one parent item in batched requests
+		:param parent_item_id: the ID of the parent item
+		:param named_items: (name, item) pairs, where each item is an uncreated instance of this type
+		:returns: the created items, in the order given
+		"""
+		item_ids = create_subitems(parent_item_id, [(name, item.staged_changes) for name, item in named_items])
+		return cls._set_created_ids(named_items, item_ids)
+
+	@staticmethod
+	def _set_created_ids(named_items, item_ids):
+		created = []
+		for (name, item), item_id in zip(named_items, item_ids):
+			item.id = item_id
+			item.name = name
+			created.append(item)
+		return created
+
 	def add_update(self, body, thread_id=None):
 
 		if self.id is None:
@@ -180,78 +302,76 @@ class BaseItemType:
 				thread_id=str(thread_id) if thread_id else None
 			)
 
-	def search_board_for_items(self, attribute, value):
+	def search_board_for_items(self, attribute, value, column_ids=None):
+		"""
+		search the board for items matching value in the given attribute's column
+		:param column_ids: column projection for the results, e.g. [] for id and name only
+		"""
 
 		att = getattr(self, attribute)
 		if not att:
 			raise AttributeError(f"{attribute} is not a valid attribute of {self.__class__.__name__}")
 
-		assert isinstance(att, ValueType), f"{attribute} cannot be used to search for items"
+		assert isinstance(att, ColumnValue), f"{attribute} cannot be used to search for items"
 
-		return att.search_for_board_items(self.BOARD_ID, value)
+		return att.search_for_board_items(self.BOARD_ID, value, column_ids=column_ids)
 
 	def convert_dropdown_ids_to_labels(self, ids_list, column_id, board_data=None):
-		try:
-			if board_data is None:
-				board = conn.boards.fetch_boards_by_id(self.BOARD_ID)['data']['boards'][0]
-			else:
-				board = board_data
-			column_data = [
-				_ for _ in
-				board['columns'] if
-				_['id'] == str(column_id)][0]
-		except IndexError:
-			raise MondayDataError(f"Could not find column data for {self.__class__.__name__} {self.BOARD_ID}")
-
-		settings = json.loads(column_data['settings_str'])['labels']
-		labels = []
-
-		if isinstance(settings, dict):
-			for _id in ids_list:
-				try:
-					labels.append(settings[str(_id)])
-				except KeyError:
-					raise MondayDataError(f"Could not find label for ID {_id} in column {column_data['title']}")
-			return labels
-		elif isinstance(settings, list):
-			for _id in ids_list:
-				try:
-					desired_entry = [label for label in settings if str(label['id']) == str(_id)][0]
-					labels.append(desired_entry['name'])
-				except IndexError:
-					raise MondayDataError(f"Could not find label for ID {_id} in column {column_data['title']}")
-			return labels
+		"""
+		get the label texts of status or dropdown label ids, from the cached board schema
+		:param board_data: an already fetched board to read the labels from instead
+		"""
+		if board_data is not None:
+			label_map = compile_label_maps(board_data).get(str(column_id))
+			if label_map is None:
+				raise MondayDataError(f"Could not find column data for {self.__class__.__name__} {self.BOARD_ID}")
+			lookup = label_map['ids'].get
 		else:
-			raise MondayDataError(f"Unknown settings type for column {column_data['title']}: {type(settings)}")
+			def lookup(label_id):
+				return board_cache.lookup_label(self.BOARD_ID, column_id, label_id, direction='ids')
+
+		labels = []
+		for _id in ids_list:
+			if _id is None or str(_id) == '':
+				# an empty value, not a label id
+				continue
+			label = lookup(str(_id))
+			if label is None:
+				raise MondayDataError(f"Could not find label for ID {_id} in column {column_id} on board {self.BOARD_ID}")
+			labels.append(label)
+		return labels
 
 
 class BaseCacheableItem(BaseItemType):
+	# items are cached under versioned '{CACHE_NAMESPACE}:...' keys, see app.cache.catalog
+	CACHE_NAMESPACE = None
+
+	# {index name: key of prepare_cache_data() holding the value (or list of values)}, items can be found by these
+	# values with find_ids and find, without loading the whole catalog
+	CACHE_INDEXES = {}
 
 	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
 		super().__init__(item_id=item_id, api_data=api_data, search=search, cache_data=cache_data)
 
 	@classmethod
-	def fetch_all(cls, key_prefix, force_api=False):
+	def fetch_all(cls, force_api=False):
 		if force_api:
 			return super().fetch_all()
-		# get keys for devices
-		results = get_redis_connection().scan_iter(f"{key_prefix}*")
-		item_keys = [key for key in results]
-		# now fetch all those keys from the cache
-		cache_data = []
-		cache_raw = get_redis_connection().mget(item_keys)
-		for cache_item in cache_raw:
-			if isinstance(cache_item, bytes):
-				cache_data.append(json.loads(cache_item.decode('utf-8')))
-			elif isinstance(cache_item, str):
-				cache_data.append(json.loads(cache_item))
-			elif isinstance(cache_item, dict):
-				cache_data.append(cache_item)
-			else:
-				raise ValueError(f"Unknown type for cache item: {type(cache_item)}")
+		cache_raw = catalog.get_all_items(cls.CACHE_NAMESPACE)
+		if cache_raw is None:
+			log.warning(f"{cls.CACHE_NAMESPACE} cache has not been built, fetching from the API")
+			return super().fetch_all()
+		freshness = catalog.freshness(cls.CACHE_NAMESPACE)
+		if freshness == catalog.EXPIRED:
+			log.warning(f"{cls.CACHE_NAMESPACE} cache has not been swept recently, fetching from the API")
+			return super().fetch_all()
+		if freshness == catalog.STALE:
+			enqueue_once(
+				q_low, f"catalog:sweep:{cls.CACHE_NAMESPACE}", 'app.cache.utilities.sweep_namespace', cls.CACHE_NAMESPACE
+			)
 
 		items = []
-		for data in cache_data:
+		for data in cache_raw:
 			try:
 				item = cls().load_from_cache(data)
 				items.append(item)
@@ -261,6 +381,60 @@ class BaseCacheableItem(BaseItemType):
 				raise e
 		return items
 
+	@classmethod
+	def find_ids(cls, index, value):
+		"""the IDs of the cached items indexed under a value, e.g. ProductItem.find_ids('device_id', device.id)"""
+		if index not in cls.CACHE_INDEXES:
+			raise ValueError(f"{cls.__name__} has no {index} index")
+		ids = catalog.find_ids(cls.CACHE_NAMESPACE, index, value)
+		if ids is not None:
+			return ids
+		# the cache was built before it had indexes, or has not been built
+		log.warning(f"{cls.CACHE_NAMESPACE} cache has no indexes, searching the whole catalog for {index}={value}")
+		cache_data = catalog.get_all_items(cls.CACHE_NAMESPACE)
+		if cache_data is None:
+			cache_data = [_.prepare_cache_data() for _ in cls.iter_all()]
+		entry = (index, str(value))
+		return {str(_['id']) for _ in cache_data if entry in catalog.index_entries(_, {index: cls.CACHE_INDEXES[index]})}
+
+	@classmethod
+	def find(cls, index, value):
+		"""the cached items indexed under a value, fetching any that are missing from the cache from the API"""
+		return cls.get(cls.find_ids(index, value))
+
+	@classmethod
+	def get(cls, item_ids):
+		"""
+		get items from the cache in one read, fetching any that are not cached from the API in one request and caching
+		them. Items are returned in the order requested, without IDs that do not exist
+		"""
+		item_ids = list(dict.fromkeys(str(_) for _ in item_ids if _))
+		cache_data = catalog.get_items(cls.CACHE_NAMESPACE, item_ids)
+		freshness = {item_id: catalog.freshness(cls.CACHE_NAMESPACE, data) for item_id, data in cache_data.items()}
+		# expired items are fetched with the misses, stale items are returned and refreshed in the background
+		cache_data = {item_id: data for item_id, data in cache_data.items() if freshness[item_id] != catalog.EXPIRED}
+		cls.refresh_in_background([item_id for item_id, _ in freshness.items() if _ == catalog.STALE])
+		items = {item_id: cls().load_from_cache(data) for item_id, data in cache_data.items()}
+
+		missing = [_ for _ in item_ids if _ not in cache_data]
+		if missing:
+			# items recently found not to exist are not fetched again
+			known_missing = catalog.get_missing_ids(cls.CACHE_NAMESPACE, missing)
+			missing = [_ for _ in missing if _ not in known_missing]
+		if missing:
+			log.warning(f"{cls.CACHE_NAMESPACE} cache misses, fetching from the API: {missing}")
+			try:
+				fetched = [cls(_['id'], _) for _ in get_api_items(missing, column_ids=cls.default_column_ids())]
+				pipe = get_redis_connection().pipeline(transaction=False)
+				for item in fetched:
+					item.save_to_cache(pipe)
+					items[str(item.id)] = item
+				pipe.execute()
+				catalog.set_missing(cls.CACHE_NAMESPACE, [_ for _ in missing if _ not in items])
+			except Exception as e:
+				notify_admins_of_error(f"Error fetching {cls.__name__} cache misses {missing}: {str(e)}")
+		return [items[_] for _ in item_ids if _ in items]
+
 	def load_data(self, api_data=None, cache_data=None):
 		# load the item data from the cache
 		try:
@@ -271,32 +445,78 @@ class BaseCacheableItem(BaseItemType):
 			elif not api_data and not cache_data and self.id:
 				self.load_from_cache()
 		except CacheMiss:
-			notify_admins_of_error(f"Cache miss for {str(self)} {self.id}")
-			self.load_from_api()
+			self._load_cache_miss()
+
+	def _load_cache_miss(self):
+		"""
+		load an item missing from the cache from the API and cache it. Concurrent misses for the item wait for one
+		fetch, and items found not to exist are remembered for conf.CATALOG_MISSING_TTL
+		"""
+		namespace = self.CACHE_NAMESPACE
+		if catalog.get_missing_ids(namespace, [self.id]):
+			raise MondayItemNotFoundError(f"{self.__class__.__name__} {self.id} does not exist")
+
+		lock = catalog.fill_lock(namespace, self.id)
+		acquired = lock.acquire(blocking=True)
+		try:
+			# another process may have filled the miss while this one waited
+			cache_data = catalog.get_item(namespace, self.id)
+			if cache_data and catalog.freshness(namespace, cache_data) != catalog.EXPIRED:
+				return self.load_from_cache(cache_data)
+			if catalog.get_missing_ids(namespace, [self.id]):
+				raise MondayItemNotFoundError(f"{self.__class__.__name__} {self.id} does not exist")
+
+			log.warning(f"Cache miss for {str(self)}, fetching from the API")
+			api_data = get_api_items([self.id], column_ids=self.default_column_ids())
+			if not api_data:
+				catalog.set_missing(namespace, [self.id])
+				raise MondayItemNotFoundError(f"{self.__class__.__name__} {self.id} does not exist")
+			self.load_from_api(api_data[0])
+			self.save_to_cache()
+			return self
+		finally:
+			if acquired:
+				try:
+					lock.release()
+				except redis.exceptions.LockError:
+					# the fetch outlasted the lock timeout
+					pass
 
-	@abc.abstractmethod
 	def cache_key(self):
-		# load the item data from the cache
-		raise NotImplementedError
+		return f"{self.CACHE_NAMESPACE}:{self.id}"
 
 	def fetch_cache_data(self):
-		cache_data = get_redis_connection().get(self.cache_key())
+		cache_data = catalog.get_item(self.CACHE_NAMESPACE, self.id)
 		if not cache_data:
 			raise CacheMiss(self.cache_key(), cache_data)
-		cache_data = cache_data.decode('utf-8')
-		cache_data = json.loads(cache_data)
+		freshness = catalog.freshness(self.CACHE_NAMESPACE, cache_data)
+		if freshness == catalog.EXPIRED:
+			raise CacheMiss(self.cache_key(), "expired")
+		if freshness == catalog.STALE:
+			self.refresh_in_background([self.id])
 		return cache_data
 
+	@classmethod
+	def refresh_in_background(cls, item_ids):
+		"""refresh stale cached items from the API in a q_low job, leaving out items whose refresh is already queued"""
+		item_ids = catalog.claim_refreshes(cls.CACHE_NAMESPACE, sorted(str(_) for _ in item_ids))
+		if not item_ids:
+			return
+		q_low.enqueue('app.cache.utilities.refresh_namespace_items', cls.CACHE_NAMESPACE, item_ids)
+
 	@abc.abstractmethod
 	def prepare_cache_data(self):
 		raise NotImplementedError
 
-	def save_to_cache(self, pipe: redis.utils.pipeline = None):
+	def save_to_cache(self, pipe: redis.utils.pipeline = None, version=None):
+		"""
+		cache this item in the current version of its namespace
+		:param version: the version being built, for cache rebuilds
+		"""
 		cache_data = self.prepare_cache_data()
-		if pipe:
-			pipe.set(self.cache_key(), json.dumps(cache_data))
-		else:
-			get_redis_connection().set(self.cache_key(), json.dumps(cache_data))
+		catalog.set_item(
+			self.CACHE_NAMESPACE, self.id, cache_data, version=version, pipe=pipe, indexes=self.CACHE_INDEXES
+		)
 		return cache_data
 
 	@abc.abstractmethod
@@ -0,0 +1,149 @@
+import re
+import time
+import logging
+
+import redis
+
+import config
+
+from ....cache import get_redis_connection
+from .exceptions import MondayRateLimitError
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+# the remaining complexity budget reported by monday, shared by every web and worker process
+REMAINING_KEY = "monday:complexity:remaining"
+
+COMPLEXITY_FIELD = "complexity { after reset_in_x_seconds }"
+
+_RESET_PATTERN = re.compile(r"reset in (\d+) seconds?", re.IGNORECASE)
+
+# the complexity field itself, not the word appearing in e.g. an item name or update body
+_COMPLEXITY_FIELD_PATTERN = re.compile(r"\bcomplexity\s*\{")
+
+
+def inject_complexity(query: str):
+	"""add the complexity field to the top level selection of a query or mutation, so every response reports it"""
+	if _COMPLEXITY_FIELD_PATTERN.search(query):
+		return query
+	opening = query.find("{")
+	if opening == -1:
+		return query
+	return f"{query[:opening + 1]} {COMPLEXITY_FIELD} {query[opening + 1:]}"
+
+
+def is_complexity_error(error):
+	"""checks an exception or error response for monday's complexity budget being exhausted"""
+	if isinstance(error, dict):
+		error = " ".join(
+			[str(error.get('error_code', '')), str(error.get('error_message', ''))]
+			+ [str(_) for _ in error.get('errors', [])]
+		)
+	error = str(error)
+	return "ComplexityException" in error or "Complexity budget exhausted" in error
+
+
+def reset_seconds_from_error(error):
+	match = _RESET_PATTERN.search(str(error))
+	if match:
+		return int(match.group(1))
+	return conf.MONDAY_COMPLEXITY_DEFAULT_RESET
+
+
+class ComplexityLimiter:
+	"""
+	Tracks monday's complexity budget in Redis so that processes defer calls until the budget resets, instead of
+	spending it on calls that will fail. Redis being unavailable never blocks a call
+	"""
+
+	def __init__(self, reserve=None, max_wait=None):
+		self.reserve = reserve if reserve is not None else conf.MONDAY_COMPLEXITY_RESERVE
+		self.max_wait = max_wait if max_wait is not None else conf.MONDAY_COMPLEXITY_MAX_WAIT
+
+	def wait_for_budget(self):
+		"""block until the shared budget is above the reserve, raising MondayRateLimitError if it would take too long"""
+		try:
+			pipe = get_redis_connection().pipeline()
+			pipe.get(REMAINING_KEY)
+			pipe.ttl(REMAINING_KEY)
+			remaining, reset_in = pipe.execute()
+		except redis.RedisError as e:
+			log.warning(f"Could not read monday complexity budget: {e}")
+			return
+
+		if remaining is None or int(remaining) > self.reserve or reset_in is None or reset_in <= 0:
+			return
+
+		if reset_in > self.max_wait:
+			raise MondayRateLimitError(
+				f"Complexity budget low ({int(remaining)} remaining), resets in {reset_in}s"
+			)
+		log.info(f"Monday complexity budget low ({int(remaining)} remaining), waiting {reset_in}s for reset")
+		time.sleep(reset_in)
+
+	def record(self, remaining, reset_in):
+		"""store the budget reported by monday, expiring with the budget's reset window"""
+		try:
+			get_redis_connection().set(REMAINING_KEY, int(remaining), ex=max(int(reset_in), 1))
+		except redis.RedisError as e:
+			log.warning(f"Could not store monday complexity budget: {e}")
+
+	def record_response(self, response):
+		if not isinstance(response, dict):
+			return
+		complexity = (response.get('data') or {}).get('complexity')
+		if complexity and complexity.get('after') is not None:
+			self.record(complexity['after'], complexity.get('reset_in_x_seconds') or 0)
+
+	def execute(self, execute, query, *args, **kwargs):
+		"""
+		run a GraphQL call through the limiter, waiting for the budget to reset and retrying when monday reports that
+		the budget was exhausted
+		:param execute: the client function performing the call, e.g. GraphQLClient.execute
+		"""
+		query = inject_complexity(query)
+		waited = 0
+		while True:
+			self.wait_for_budget()
+			try:
+				response = execute(query, *args, **kwargs)
+				error = response if isinstance(response, dict) and is_complexity_error(response) else None
+			except Exception as e:
+				if not is_complexity_error(e):
+					raise
+				error = e
+
+			if error is None:
+				self.record_response(response)
+				return response
+
+			reset_in = reset_seconds_from_error(error)
+			self.record(0, reset_in)
+			if waited + reset_in > self.max_wait:
+				raise MondayRateLimitError(f"Complexity budget exhausted, resets in {reset_in}s: {error}")
+			log.info(f"Monday complexity budget exhausted, retrying in {reset_in}s")
+			time.sleep(reset_in)
+			waited += reset_in
+
+
+limiter = ComplexityLimiter()
+
+
+def limit_client(monday_client):
+	"""route the GraphQL calls of every resource on a MondayClient through the shared limiter"""
+	for resource in vars(monday_client).values():
+		graphql_client = getattr(resource, 'client', None)
+		if graphql_client is None or getattr(graphql_client, '_limited', False):
+			continue
+		graphql_client.execute = _limited(graphql_client.execute)
+		graphql_client._limited = True
+	return monday_client
+
+
+def _limited(execute):
+	def limited_execute(query, *args, **kwargs):
+		return limiter.execute(execute, query, *args, **kwargs)
+
+	return limited_execute
@@ -0,0 +1,74 @@
+import logging
+
+import config
+
+from .client import execute_mutations, graphql_json_arg
+from .items import IncompleteItemError
+from .item_cache import invalidate_items
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+
+class CommitSession:
+	"""
+	Collects the staged changes of many items and commits them together, as aliased change_multiple_column_values
+	mutations sent in batches of conf.MONDAY_MUTATION_BATCH_SIZE per request
+
+	Used as a context manager the session flushes on exit. Changes added before an exception are still committed,
+	as they would have been when committing item by item
+	"""
+
+	def __init__(self, batch_size=None):
+		self.batch_size = batch_size or conf.MONDAY_MUTATION_BATCH_SIZE
+		self._items = {}
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.flush()
+		return False
+
+	def __len__(self):
+		return len(self._items)
+
+	def add(self, item):
+		"""
+		add an item to be committed when the session is flushed, items without staged changes are ignored
+		:param item: a created BaseItemType instance
+		"""
+		if not item.id:
+			raise IncompleteItemError(item, "Item ID not set (not created), items must be created before being added")
+		if not item.staged_changes:
+			return self
+		# the same item added more than once is committed once, with its latest staged changes
+		self._items[(str(item.BOARD_ID), str(item.id))] = item
+		return self
+
+	def flush(self):
+		"""commit every item added since the last flush, clearing their staged changes"""
+		pending = list(self._items.values())
+		self._items = {}
+		for i in range(0, len(pending), self.batch_size):
+			batch = pending[i:i + self.batch_size]
+			log.debug(f"Committing {len(batch)} items in one request")
+			try:
+				execute_mutations([self._change_columns_mutation(item) for item in batch], batch_size=len(batch))
+			except Exception:
+				# keep the uncommitted items so the flush can be retried
+				for item in pending[i:]:
+					self._items.setdefault((str(item.BOARD_ID), str(item.id)), item)
+				raise
+			for item in batch:
+				item.staged_changes = {}
+			invalidate_items([item.id for item in batch])
+		return pending
+
+	@staticmethod
+	def _change_columns_mutation(item):
+		return (
+			f"change_multiple_column_values(board_id: {int(item.BOARD_ID)}, item_id: {int(item.id)}, "
+			f"column_values: {graphql_json_arg(item.staged_changes)}) {{ id }}"
+		)
@@ -0,0 +1,108 @@
+import os
+import logging
+import threading
+
+import httpx
+from monday.exceptions import MondayQueryError
+
+import config
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+MONDAY_API_URL = "https://api.monday.com/v2"
+
+try:
+	import h2  # noqa: F401 (httpx only negotiates HTTP/2 when h2 is installed)
+	HTTP2_AVAILABLE = True
+except ImportError:
+	HTTP2_AVAILABLE = False
+
+
+class MondayTransport:
+	"""
+	Sends GraphQL requests to monday over one pooled, keep-alive httpx client per process (HTTP/2 when available),
+	in place of the monday package's per-request connections. Takes the place of a resource's GraphQLClient
+
+	The httpx client is created lazily and again after a fork, so gunicorn and RQ work-horses never share sockets
+	with their parent
+	"""
+
+	def __init__(self, endpoint=MONDAY_API_URL, token=None, headers=None, http_transport=None):
+		self.endpoint = endpoint
+		self.token = token
+		self.headers = dict(headers or {})
+		self._http_transport = http_transport
+		self._client = None
+		self._pid = None
+		self._lock = threading.Lock()
+
+	@property
+	def client(self) -> httpx.Client:
+		if self._client is None or self._pid != os.getpid():
+			with self._lock:
+				if self._client is None or self._pid != os.getpid():
+					# a client inherited through a fork is abandoned rather than closed, its sockets belong to the parent
+					self._client = self._build_client()
+					self._pid = os.getpid()
+		return self._client
+
+	def _build_client(self):
+		log.debug(f"Opening monday HTTP client (pid {os.getpid()}, http2={HTTP2_AVAILABLE})")
+		return httpx.Client(
+			http2=HTTP2_AVAILABLE,
+			timeout=conf.MONDAY_HTTP_TIMEOUT,
+			limits=httpx.Limits(
+				max_connections=conf.MONDAY_HTTP_MAX_CONNECTIONS,
+				max_keepalive_connections=conf.MONDAY_HTTP_MAX_CONNECTIONS,
+			),
+			transport=self._http_transport,
+		)
+
+	def execute(self, query, variables=None):
+		"""send a query, returning the response JSON and raising MondayQueryError for GraphQL errors"""
+		headers = self.headers.copy()
+		if self.token is not None:
+			headers["Authorization"] = self.token
+		payload = {"query": query}
+		if variables is not None:
+			payload["variables"] = variables
+
+		response = self.client.post(self.endpoint, json=payload, headers=headers)
+		try:
+			response_data = response.json()
+		except ValueError:
+			response.raise_for_status()
+			raise
+
+		if "errors" in response_data:
+			raise MondayQueryError(response_data["errors"][0]["message"], response_data["errors"])
+		if response.is_error and not response_data.get("error_message"):
+			response.raise_for_status()
+		# error_message responses (e.g. rate limits) are returned for callers to check, as the monday package does
+		return response_data
+
+	def close(self):
+		if self._client is not None and self._pid == os.getpid():
+			self._client.close()
+		self._client = None
+
+
+def install_transport(monday_client, transport=None):
+	"""
+	replace the GraphQL client of every resource on a MondayClient with one shared MondayTransport
+	file uploads keep using the monday package's own client
+	"""
+	for resource in vars(monday_client).values():
+		graphql_client = getattr(resource, 'client', None)
+		if graphql_client is None:
+			continue
+		if transport is None:
+			transport = MondayTransport(
+				endpoint=getattr(graphql_client, 'endpoint', MONDAY_API_URL),
+				token=getattr(graphql_client, 'token', None),
+				headers=getattr(graphql_client, 'headers', None),
+			)
+		resource.client = transport
+	return monday_client
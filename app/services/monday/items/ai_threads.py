@@ -48,9 +48,7 @@ class InvoiceAssistantThreadItem(BaseAIThreadItem):
 		else:
 			raise MondayAPIError(f"Too Many Thread Items ({len(results['data']['items_page_by_column_values']['items'])}) with thread_id {thread_id}")
 
-	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
-		self.thread_id = columns.TextValue('text__1')
-		self.message_ts = columns.TextValue('text1__1')
-		self.slack_user_id = columns.TextValue('text3__1')
-		self.running_cost = columns.NumberValue('numbers__1')
-		super().__init__(item_id, api_data, search, cache_data)
+	thread_id = columns.TextValue('text__1')
+	message_ts = columns.TextValue('text1__1')
+	slack_user_id = columns.TextValue('text3__1')
+	running_cost = columns.NumberValue('numbers__1')
@@ -25,27 +25,23 @@ class CorporateAccountItem(BaseItemType):
 		else:
 			raise ValueError(f"No Corporate Account Item found for short_code {short_code}")
 
-	def __init__(self, item_id=None, api_data=None, search=None):
-
-		self.repair_board_id = columns.TextValue("text6")
-
-		# self.zen_org_id = columns.TextValue("text9")
-		self.xero_contact_id = columns.TextValue("text")
+	repair_board_id = columns.TextValue("text6")
 
-		self.invoicing_style = columns.StatusValue("status7")
+	# zen_org_id = columns.TextValue("text9")
+	xero_contact_id = columns.TextValue("text")
 
-		self.req_po = columns.CheckBoxValue("checkbox6")
-		self.req_cost_code = columns.CheckBoxValue("checkbox_1")
-		self.req_username = columns.CheckBoxValue("checkbox_2")
+	invoicing_style = columns.StatusValue("status7")
 
-		self.global_po = columns.TextValue("text2")
+	req_po = columns.CheckBoxValue("checkbox6")
+	req_cost_code = columns.CheckBoxValue("checkbox_1")
+	req_username = columns.CheckBoxValue("checkbox_2")
 
-		self.inv_ref_start = columns.TextValue("text3")
-		self.inv_ref_end = columns.TextValue("text12")
+	global_po = columns.TextValue("text2")
 
-		self.courier_price = columns.NumberValue("numbers9")
+	inv_ref_start = columns.TextValue("text3")
+	inv_ref_end = columns.TextValue("text12")
 
-		super().__init__(item_id, api_data, search)
+	courier_price = columns.NumberValue("numbers9")
 
 	def get_current_invoice(self, user_name=None):
 		"""Get the current invoice for this account"""
@@ -135,24 +131,28 @@ class CorporateAccountItem(BaseItemType):
 class CorporateRepairItem(BaseItemType):
 	"""Base class for corporate board items. contains all required methods for enacting the various base processes"""
 
-	def __init__(self, item_id=None, api_data=None, search=None):
-		self.ticket_id = None
-		self.imeisn = None
-		self.device_name = None
-		self.description = None
-		self.cost = None
-		self.main_board_connect = None
-		self.courier_cost_inc_vat = None
-
-		self._account_item = None
-
-		column_map = self.get_column_id_map()
+	ticket_id = None
+	imeisn = None
+	device_name = None
+	description = None
+	cost = None
+	main_board_connect = None
+	courier_cost_inc_vat = None
+
+	def __init_subclass__(cls, **kwargs):
+		# each corporate board declares its columns through get_column_id_map, installed here as class level columns
+		super().__init_subclass__(**kwargs)
+		column_map = cls.get_column_id_map()
 		for att in column_map:
-			setattr(self, att, column_map[att])
+			column_map[att].__set_name__(cls, att)
+			setattr(cls, att, column_map[att])
 
-		if self.ticket_id is None or self.imeisn is None or self.device_name is None or self.description is None or self.cost is None:
+		if cls.ticket_id is None or cls.imeisn is None or cls.device_name is None or cls.description is None or cls.cost is None:
 			raise NotImplementedError("Subclasses must define all attributes.")
 
+	def __init__(self, item_id=None, api_data=None, search=None):
+		self._account_item = None
+
 		super().__init__(item_id, api_data, search)
 
 	@property
@@ -7,42 +7,33 @@ class CountItem(BaseItemType):
 
 	BOARD_ID = 2885477229
 
-	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
-
-		self.app_meta = columns.LongTextValue("long_text")
-		self.view_data = columns.LongTextValue("long_text6")
-		self.count_status = columns.StatusValue("status")
+	app_meta = columns.LongTextValue("long_text")
+	view_data = columns.LongTextValue("long_text6")
+	count_status = columns.StatusValue("status")
 
-		self.subitem_ids = columns.ConnectBoards("subitems")
-
-		super().__init__(item_id, api_data, search, cache_data)
+	subitem_ids = columns.ConnectBoards("subitems")
 
 
 class CountLineItem(BaseItemType):
 
 	BOARD_ID = 2885485385
 
-	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
+	part_id = columns.TextValue("text")
 
-		self.part_id = columns.TextValue("text")
+	counted = columns.NumberValue("numbers")
+	expected = columns.NumberValue("numbers2")
 
-		self.counted = columns.NumberValue("numbers")
-		self.expected = columns.NumberValue("numbers2")
-
-		self.adjustment_status = columns.StatusValue("status1")
-
-		super().__init__(item_id, api_data, search, cache_data)
+	adjustment_status = columns.StatusValue("status1")
 
 
 class SupplierItem(BaseItemType):
 
 	BOARD_ID = 6390037479
 
-	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
-
-		self.parts_connect = columns.ConnectBoards("board_relation3")
-		self.order_connect = columns.ConnectBoards("connect_boards0")
+	parts_connect = columns.ConnectBoards("board_relation3")
+	order_connect = columns.ConnectBoards("connect_boards0")
 
+	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
 		self._current_order = None
 
 		super().__init__(item_id, api_data, search, cache_data)
@@ -72,12 +63,11 @@ class OrderItem(BaseItemType):
 
 	BOARD_ID = 6392094556
 
-	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
-
-		self.order_status = columns.StatusValue('status2')
-		self.supplier_connect = columns.ConnectBoards('link_to_suppliers')
-		self.subitems = columns.ConnectBoards('subitems')
+	order_status = columns.StatusValue('status2')
+	supplier_connect = columns.ConnectBoards('link_to_suppliers')
+	subitems = columns.ConnectBoards('subitems')
 
+	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
 		self._subitem_data = []
 
 		super().__init__(item_id, api_data, search, cache_data)
@@ -109,9 +99,5 @@ class OrderLineItem(BaseItemType):
 
 	BOARD_ID = 6392131341
 
-	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
-
-		self.part_id = columns.TextValue("text")
-		self.current_stock_level = columns.NumberValue("numbers")
-
-		super().__init__(item_id, api_data, search, cache_data)
\ No newline at end of file
+	part_id = columns.TextValue("text")
+	current_stock_level = columns.NumberValue("numbers")
\ No newline at end of file
@@ -10,12 +10,14 @@ from ....cache import get_redis_connection
 
 class DeviceItem(BaseCacheableItem):
 	BOARD_ID = 3923707691
+	CACHE_NAMESPACE = "device"
+	PROJECT_COLUMNS = True
 
-	def __init__(self, item_id=None, api_data: dict | None = None):
-		self.device_type = columns.StatusValue('status9')
-		self.products_connect = columns.ConnectBoards('connect_boards5')
-		self.pre_checks_connect = columns.ConnectBoards('connect_boards41')
+	device_type = columns.StatusValue('status9')
+	products_connect = columns.ConnectBoards('connect_boards5')
+	pre_checks_connect = columns.ConnectBoards('connect_boards41')
 
+	def __init__(self, item_id=None, api_data: dict | None = None):
 		self._products = None
 		self._pre_check_set = None
 
@@ -23,7 +25,7 @@ class DeviceItem(BaseCacheableItem):
 
 	@classmethod
 	def fetch_all(cls, slack_data=False, force_api=False, *args):
-		results = super().fetch_all("device:", force_api=force_api)
+		results = super().fetch_all(force_api=force_api)
 		if not slack_data:
 			return results
 		else:
@@ -36,9 +38,6 @@ class DeviceItem(BaseCacheableItem):
 					dct[device.device_type.value] = [inner_list]
 			return dct
 
-	def cache_key(self):
-		return f"device:{self.id}"
-
 	def prepare_cache_data(self):
 		return {
 			"name": self.name,
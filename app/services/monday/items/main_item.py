@@ -1,5 +1,4 @@
 import logging
-import json
 
 from ..api import items, columns, boards
 from ..api.client import get_api_items
@@ -13,76 +12,79 @@ log = logging.getLogger('eric')
 
 class MainItem(items.BaseItemType):
 	BOARD_ID = 349212843
+	PROJECT_COLUMNS = True
+	API_CACHE_TTL = 60
+	API_CACHE_SOFT_TTL = 30
+
+	# basic info
+	main_status = columns.StatusValue("status4")
+	client = columns.StatusValue("status")
+	service = columns.StatusValue('service')
+	repair_type = columns.StatusValue('status24')
+	notifications_status = columns.StatusValue('status_18')
+	booking_date = columns.DateValue("date6")
+	date_received = columns.DateValue("date4")
+
+	# contact info
+	ticket_url = columns.LinkURLValue("link1")
+	ticket_id = columns.TextValue("text6")
+	email = columns.TextValue("text5")
+	phone = columns.TextValue("text00")
+
+	# repair info
+	products_connect = columns.ConnectBoards("board_relation")
+	device_connect = columns.ConnectBoards("board_relation5")
+	custom_quote_connect = columns.ConnectBoards("board_relation0")
+	description = columns.TextValue("text368")
+	imeisn = columns.TextValue("text4")
+	passcode = columns.TextValue('text8')
+	repaired_date = columns.DateValue("collection_date")
+
+	stock_checkout_id = columns.TextValue("text766")
+
+	device_deprecated_dropdown = columns.DropdownValue("device0")
+	parts_used_dropdown = columns.DropdownValue("repair")
+	device_colour = columns.StatusValue("status8")
+	parts_connect = columns.ConnectBoards("connect_boards__1")
+
+	# payment info
+	payment_status = columns.StatusValue("payment_status")
+	payment_method = columns.StatusValue("payment_method")
+
+	# tech info
+	technician_id = columns.PeopleValue("person")
+
+	# scheduling info
+	motion_task_id = columns.TextValue("text76")
+	motion_scheduling_status = columns.StatusValue("status_19")
+	hard_deadline = columns.DateValue("date36")
+	phase_deadline = columns.DateValue("date65")
+
+	repair_phase = columns.StatusValue("status_177")
+	phase_status = columns.StatusValue("status_110")
+
+	# thread info
+	notes_thread_id = columns.TextValue("text37")
+	email_thread_id = columns.TextValue("text_1")
+	error_thread_id = columns.TextValue("text34")
+	high_level_thread_id = columns.TextValue("text03")
+
+	# address info
+	address_postcode = columns.TextValue("text93")
+	address_street = columns.TextValue('passcode')
+	address_notes = columns.TextValue('dup__of_passcode')
+	company_name = columns.TextValue("text15")
+
+	be_courier_collection = columns.StatusValue("be_courier_collection")
+	be_courier_return = columns.StatusValue("be_courier_return")
+
+	incoming_tracking_number = columns.TextValue("text796")
+	outgoing_tracking_number = columns.TextValue("text53")
+
+	# customer info
+	corp_item_id = columns.TextValue("text7")
 
 	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		# basic info
-		self.main_status = columns.StatusValue("status4")
-		self.client = columns.StatusValue("status")
-		self.service = columns.StatusValue('service')
-		self.repair_type = columns.StatusValue('status24')
-		self.notifications_status = columns.StatusValue('status_18')
-		self.booking_date = columns.DateValue("date6")
-		self.date_received = columns.DateValue("date4")
-
-		# contact info
-		self.ticket_url = columns.LinkURLValue("link1")
-		self.ticket_id = columns.TextValue("text6")
-		self.email = columns.TextValue("text5")
-		self.phone = columns.TextValue("text00")
-
-		# repair info
-		self.products_connect = columns.ConnectBoards("board_relation")
-		self.device_connect = columns.ConnectBoards("board_relation5")
-		self.custom_quote_connect = columns.ConnectBoards("board_relation0")
-		self.description = columns.TextValue("text368")
-		self.imeisn = columns.TextValue("text4")
-		self.passcode = columns.TextValue('text8')
-		self.repaired_date = columns.DateValue("collection_date")
-
-		self.stock_checkout_id = columns.TextValue("text766")
-
-		self.device_deprecated_dropdown = columns.DropdownValue("device0")
-		self.parts_used_dropdown = columns.DropdownValue("repair")
-		self.device_colour = columns.StatusValue("status8")
-		self.parts_connect = columns.ConnectBoards("connect_boards__1")
-
-		# payment info
-		self.payment_status = columns.StatusValue("payment_status")
-		self.payment_method = columns.StatusValue("payment_method")
-
-		# tech info
-		self.technician_id = columns.PeopleValue("person")
-
-		# scheduling info
-		self.motion_task_id = columns.TextValue("text76")
-		self.motion_scheduling_status = columns.StatusValue("status_19")
-		self.hard_deadline = columns.DateValue("date36")
-		self.phase_deadline = columns.DateValue("date65")
-
-		self.repair_phase = columns.StatusValue("status_177")
-		self.phase_status = columns.StatusValue("status_110")
-
-		# thread info
-		self.notes_thread_id = columns.TextValue("text37")
-		self.email_thread_id = columns.TextValue("text_1")
-		self.error_thread_id = columns.TextValue("text34")
-		self.high_level_thread_id = columns.TextValue("text03")
-
-		# address info
-		self.address_postcode = columns.TextValue("text93")
-		self.address_street = columns.TextValue('passcode')
-		self.address_notes = columns.TextValue('dup__of_passcode')
-		self.company_name = columns.TextValue("text15")
-
-		self.be_courier_collection = columns.StatusValue("be_courier_collection")
-		self.be_courier_return = columns.StatusValue("be_courier_return")
-
-		self.incoming_tracking_number = columns.TextValue("text796")
-		self.outgoing_tracking_number = columns.TextValue("text53")
-
-		# customer info
-		self.corp_item_id = columns.TextValue("text7")
-
 		# properties
 		self._products = None
 
@@ -121,22 +123,19 @@ class MainItem(items.BaseItemType):
 		update = '=== STOCK CHECK ===\n'
 		try:
 			in_stock = True
-			if product_ids:
-				product_data = get_api_items(product_ids)
-			else:
-				product_data = get_api_items(self.products_connect.value)
-			prods = [ProductItem(p['id'], p) for p in product_data]
+			if not product_ids:
+				product_ids = self.products_connect.value
+			prods = ProductItem.get(product_ids)
 			for prod in prods:
 				update += prod.name.upper() + '\n'
-				if not prod.parts_connect.value:
+				parts = PartItem.get(prod.part_ids)
+				if not parts:
 					message = f"""No parts connected!!!
 					Click to fix my connecting parts to this product by making sure the 'parts' column is filled in
 					https://icorrect.monday.com/boards/2477699024/views/55887964/pulses/{prod.id}"""
 					notify_admins_of_error(message)
 					update += message + '\n'
 				else:
-					parts_data = get_api_items(prod.parts_connect.value)
-					parts = [PartItem(_['id'], _) for _ in parts_data]
 					for part in parts:
 						update += f"{part.name}: {part.stock_level}\n"
 						if part.stock_level.value < 1:
@@ -171,7 +170,7 @@ class MainItem(items.BaseItemType):
 	def products(self):
 		if not self._products:
 			if self.products_connect.value:
-				product_data = get_api_items(self.products_connect.value)
+				product_data = get_api_items(self.products_connect.value, column_ids=ProductItem.get_column_ids())
 				self._products = [ProductItem(p['id'], p) for p in product_data]
 			else:
 				self._products = []
@@ -183,7 +182,7 @@ class MainItem(items.BaseItemType):
 			# no products connected, use default phase model
 			return repair_phases.RepairPhaseModel(6106627585)
 		else:
-			product_data = get_api_items(self.products_connect.value)
+			product_data = get_api_items(self.products_connect.value, column_ids=ProductItem.get_column_ids())
 			prods = [ProductItem(p['id'], p) for p in product_data]
 			phase_models = [p.get_phase_model() for p in prods]
 			return max(phase_models, key=lambda x: x.get_total_minutes_required())
@@ -191,16 +190,11 @@ class MainItem(items.BaseItemType):
 	def generate_repair_map_value_list(self):
 		"""creates a list of lists of combined IDS and Dual IDs for use in Repair Map searching"""
 		try:
-			main_board = boards.get_board(self.BOARD_ID)
 			device_no = self.device_deprecated_dropdown.value[0]
-			colour_label = self.device_colour.value
-			colour_col_settings = json.loads(
-				[c for c in main_board['columns'] if c['id'] == str(self.device_colour.column_id)][0]['settings_str'])
 			colour_no = None
-			for _id, _label in colour_col_settings['labels'].items():
-				if str(_label) == str(colour_label):
-					colour_no = _id
-					break
+			if self.device_colour.value:
+				colour_no = boards.lookup_label(
+					self.BOARD_ID, self.device_colour.column_id, self.device_colour.value, direction='labels')
 
 			results = []
 
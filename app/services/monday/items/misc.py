@@ -4,7 +4,7 @@ import json
 from zenpy.lib.api_objects import Ticket, CustomField, Comment
 
 from ..api.items import BaseItemType, BaseCacheableItem
-from ..api import columns, get_api_items, exceptions, monday_connection, get_items_by_board_id
+from ..api import columns, get_api_items, exceptions, monday_connection, iter_board_items
 from ..api.exceptions import MondayDataError
 from ... import typeform
 from ..items import MainItem
@@ -16,59 +16,53 @@ from ....utilities import notify_admins_of_error
 class WebBookingItem(BaseItemType):
 	BOARD_ID = 973467694
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.transfer_status = columns.StatusValue("status_18")
-
-		self.woo_commerce_order_id = columns.TextValue('order_id')
+	transfer_status = columns.StatusValue("status_18")
 
-		self.pay_status = columns.StatusValue("payment_status")
-		self.pay_method = columns.StatusValue("payment_method")
+	woo_commerce_order_id = columns.TextValue('order_id')
 
-		self.booking_notes = columns.TextValue('notes')
-		self.secondary_notes = columns.LongTextValue('enquiry')
+	pay_status = columns.StatusValue("payment_status")
+	pay_method = columns.StatusValue("payment_method")
 
-		self.phone = columns.TextValue('phone_number')
-		self.email = columns.TextValue('email')
+	booking_notes = columns.TextValue('notes')
+	secondary_notes = columns.LongTextValue('enquiry')
 
-		self.service = columns.StatusValue('service')
-		self.client = columns.StatusValue('client')
-		self.repair_type = columns.StatusValue('type')
+	phone = columns.TextValue('phone_number')
+	email = columns.TextValue('email')
 
-		self.booking_date = columns.DateValue('booking_time')
+	service = columns.StatusValue('service')
+	client = columns.StatusValue('client')
+	repair_type = columns.StatusValue('type')
 
-		self.address_postcode = columns.TextValue('post_code')
-		self.address_notes = columns.TextValue('company_flat')
-		self.address_street = columns.TextValue('street_name_number')
-		self.point_of_collection = columns.TextValue('text9')
+	booking_date = columns.DateValue('booking_time')
 
-		self.main_item_id = columns.TextValue("text1")
+	address_postcode = columns.TextValue('post_code')
+	address_notes = columns.TextValue('company_flat')
+	address_street = columns.TextValue('street_name_number')
+	point_of_collection = columns.TextValue('text9')
 
-		self.device_text = columns.TextValue("text__1")
-		self.repairs_text = columns.TextValue("text1__1")
+	main_item_id = columns.TextValue("text1")
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	device_text = columns.TextValue("text__1")
+	repairs_text = columns.TextValue("text1__1")
 
 
 class WebEnquiryItem(BaseItemType):
 	BOARD_ID = 863729294
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.phone = columns.TextValue('text0')
-		self.email = columns.TextValue('text')
-
-		self.zendesk_id = columns.TextValue("zendesk_id")
+	phone = columns.TextValue('text0')
+	email = columns.TextValue('text')
 
-		self.device_type_string = columns.TextValue('text06')
-		self.model_string = columns.TextValue('text2')
+	zendesk_id = columns.TextValue("zendesk_id")
 
-		self.body = columns.TextValue("long_text")
+	device_type_string = columns.TextValue('text06')
+	model_string = columns.TextValue('text2')
 
-		self.fault_type = columns.StatusValue("status6")
+	body = columns.TextValue("long_text")
 
-		self.converted_status = columns.StatusValue("converted")
-		self.date_received = columns.DateValue("date9")
+	fault_type = columns.StatusValue("status6")
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	converted_status = columns.StatusValue("converted")
+	date_received = columns.DateValue("date9")
 
 
 class TypeFormWalkInResponseItem(BaseItemType):
@@ -76,16 +70,13 @@ class TypeFormWalkInResponseItem(BaseItemType):
 
 	FORM_ID = "LtNyVqVN"
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.form_type = columns.StatusValue('status4')
-		self.phone = columns.TextValue('text')
-		self.email = columns.TextValue('text_1')
-		self.device_type = columns.StatusValue('device_category')
-		self.device = columns.TextValue('device6')
-		self.repair_notes = columns.TextValue('text7')
-		self.push_to_slack = columns.StatusValue('status6')
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	form_type = columns.StatusValue('status4')
+	phone = columns.TextValue('text')
+	email = columns.TextValue('text_1')
+	device_type = columns.StatusValue('device_category')
+	device = columns.TextValue('device6')
+	repair_notes = columns.TextValue('text7')
+	push_to_slack = columns.StatusValue('status6')
 
 	def sync_typeform_data(self):
 
@@ -182,32 +173,26 @@ class TypeFormWalkInResponseItem(BaseItemType):
 class NotificationMappingItem(BaseItemType):
 	BOARD_ID = 3428830196
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.macro_search_term = columns.TextValue('text8')
-		self.macro_id = columns.TextValue("text")
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	macro_search_term = columns.TextValue('text8')
+	macro_id = columns.TextValue("text")
 
 
 class RepairSessionItem(BaseItemType):
 	BOARD_ID = 5997573759
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.main_board_id = columns.TextValue('text')
-		self.start_time = columns.DateValue("date")
-		self.end_time = columns.DateValue("date2")
-		self.session_status = columns.StatusValue("status0")
-		self.device_id = columns.TextValue("text8")
-
-		self.phase_label = columns.TextValue("text7")
-		self.ending_status = columns.TextValue("text5")
+	main_board_id = columns.TextValue('text')
+	start_time = columns.DateValue("date")
+	end_time = columns.DateValue("date2")
+	session_status = columns.StatusValue("status0")
+	device_id = columns.TextValue("text8")
 
-		self.technician = columns.PeopleValue("people")
+	phase_label = columns.TextValue("text7")
+	ending_status = columns.TextValue("text5")
 
-		self.gcal_event_id = columns.TextValue("text0")
-		self.gcal_plot_status = columns.StatusValue("status3")
+	technician = columns.PeopleValue("people")
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	gcal_event_id = columns.TextValue("text0")
+	gcal_plot_status = columns.StatusValue("status3")
 
 	def get_session_duration(self):
 		# calculate the duration of the session in minutes from self.start_time and self.end_time
@@ -220,12 +205,9 @@ class RepairSessionItem(BaseItemType):
 class CustomQuoteLineItem(BaseItemType):
 	BOARD_ID = 4570780706
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.description = columns.TextValue('repair_description')
-		self.price = columns.NumberValue('numbers')
-		self.turnaround = columns.NumberValue('numbers3')
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	description = columns.TextValue('repair_description')
+	price = columns.NumberValue('numbers')
+	turnaround = columns.NumberValue('numbers3')
 
 	def prepare_cache_data(self):
 		return {
@@ -239,15 +221,14 @@ class CustomQuoteLineItem(BaseItemType):
 class RepairProfitModelItem(BaseItemType):
 	BOARD_ID = 5938137198
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.products_connect = columns.ConnectBoards("connect_boards")
-		self.parts_connect = columns.ConnectBoards("connect_boards4")
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	products_connect = columns.ConnectBoards("connect_boards")
+	parts_connect = columns.ConnectBoards("connect_boards4")
 
 
 class PreCheckSet(BaseCacheableItem):
 	BOARD_ID = 4347106321
+	CACHE_NAMESPACE = "pre_check_set"
+	PROJECT_COLUMNS = True
 
 	AVAILABLE_CHECKPOINTS = [  # Checkpoint Name, Connect Column Attribute Name
 		["cs_walk_pre_check", 'cs_walk_pre_check_connect'],  # walk-ins
@@ -255,18 +236,15 @@ class PreCheckSet(BaseCacheableItem):
 		["tech_post_check", "tech_post_check_connect"]  # technicians following a repair
 	]
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.set_type = columns.StatusValue('status9')
-		self.cs_walk_pre_check_connect = columns.ConnectBoards('connect_boards4')
-		self.tech_post_check_connect = columns.ConnectBoards("connect_boards__1")
+	set_type = columns.StatusValue('status9')
+	cs_walk_pre_check_connect = columns.ConnectBoards('connect_boards4')
+	tech_post_check_connect = columns.ConnectBoards("connect_boards__1")
 
+	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
 		self._pre_check_items = None
 
 		super().__init__(item_id=item_id, api_data=api_data, search=search)
 
-	def cache_key(self):
-		return "pre_check_set:" + str(self.id)
-
 	def prepare_cache_data(self):
 		return {
 			"name": str(self.name),
@@ -295,37 +273,33 @@ class PreCheckSet(BaseCacheableItem):
 			raise ValueError(f"No Checkpoint Available For: {checkpoint_name}")
 
 		check_item_ids = connect_col.value
-		check_items = [CheckItem(i['id'], i) for i in get_api_items(check_item_ids)]
+		check_items = [CheckItem(i['id'], i) for i in get_api_items(check_item_ids, column_ids=CheckItem.get_column_ids())]
 		return check_items
 
 
 class CheckItem(BaseCacheableItem):
 	BOARD_ID = 4455646189
+	CACHE_NAMESPACE = "pre_check_item"
+	PROJECT_COLUMNS = True
 
 	@classmethod
 	def get_all(cls):
-		item_data = get_items_by_board_id(cls.BOARD_ID)
+		item_data = iter_board_items(cls.BOARD_ID, column_ids=cls.get_column_ids())
 		return [cls(i['id'], i) for i in item_data]
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.available_responses = columns.DropdownValue('dropdown')
-		self.positive_responses = columns.DropdownValue('dropdown6__1')
-		self.check_category = columns.StatusValue('status0__1')
-		self.requires_power = columns.CheckBoxValue('checkbox')
-
-		self.conditional = columns.CheckBoxValue("checkbox__1")
-		self.conditional_tag = columns.TextValue("text0__1")
-
-		self.check_sets_connect = columns.ConnectBoards('board_relation')
+	available_responses = columns.DropdownValue('dropdown')
+	positive_responses = columns.DropdownValue('dropdown6__1')
+	check_category = columns.StatusValue('status0__1')
+	requires_power = columns.CheckBoxValue('checkbox')
 
-		self.results_column_id = columns.TextValue("text__1")
+	conditional = columns.CheckBoxValue("checkbox__1")
+	conditional_tag = columns.TextValue("text0__1")
 
-		self.response_type = columns.StatusValue("status__1")
+	check_sets_connect = columns.ConnectBoards('board_relation')
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	results_column_id = columns.TextValue("text__1")
 
-	def cache_key(self):
-		return "pre_check_item:" + str(self.id)
+	response_type = columns.StatusValue("status__1")
 
 	def prepare_cache_data(self):
 		return {
@@ -440,89 +414,74 @@ class CheckItem(BaseCacheableItem):
 class CheckResultItem(BaseItemType):
 	BOARD_ID = 6487504495
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.main_item_id = columns.TextValue("text__1")
-
-		self.imei_sn = columns.TextValue("text8__1")
-		self.device = columns.TextValue("text7__1")
+	main_item_id = columns.TextValue("text__1")
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	imei_sn = columns.TextValue("text8__1")
+	device = columns.TextValue("text7__1")
 
 
 class CourierDataDumpItem(BaseItemType):
 	BOARD_ID = 1031579094
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.job_id = columns.TextValue("stuart_job_id")
-		self.booking_time = columns.DateValue("booking_time6")
-		self.allocation_time = columns.DateValue("hour3")
-		self.collection_time = columns.DateValue("collection_time4")
-		self.delivery_time = columns.DateValue("delivery_time")
+	job_id = columns.TextValue("stuart_job_id")
+	booking_time = columns.DateValue("booking_time6")
+	allocation_time = columns.DateValue("hour3")
+	collection_time = columns.DateValue("collection_time4")
+	delivery_time = columns.DateValue("delivery_time")
 
-		self.cost_inc_vat = columns.NumberValue("cost__ex_vat_")
-		self.cost_ex_vat = columns.NumberValue("numbers2")
-		self.vat = columns.NumberValue("vat")
+	cost_inc_vat = columns.NumberValue("cost__ex_vat_")
+	cost_ex_vat = columns.NumberValue("numbers2")
+	vat = columns.NumberValue("vat")
 
-		self.collection_postcode = columns.TextValue("collection_postcode5")
-		self.delivery_postcode = columns.TextValue("delivery_postcode")
+	collection_postcode = columns.TextValue("collection_postcode5")
+	delivery_postcode = columns.TextValue("delivery_postcode")
 
-		self.distance = columns.NumberValue("distance")
-		self.tracking_url = columns.LinkURLValue("tracking_url")
+	distance = columns.NumberValue("distance")
+	tracking_url = columns.LinkURLValue("tracking_url")
 
-		self.main_item_id = columns.TextValue("text6")
+	main_item_id = columns.TextValue("text6")
 
-		self.delivery_id = columns.TextValue("text")
+	delivery_id = columns.TextValue("text")
 
-		self.job_status = columns.StatusValue("status")
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	job_status = columns.StatusValue("status")
 
 
 class SickWDataItem(BaseItemType):
 	BOARD_ID = 5808954740
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.imeisn = columns.TextValue("text")
-		self.model_description = columns.TextValue("text5")
-		self.model = columns.TextValue("text0")
-		self.serial = columns.TextValue("text8")
-		self.fetched_data = columns.TextValue("long_text")
+	imeisn = columns.TextValue("text")
+	model_description = columns.TextValue("text5")
+	model = columns.TextValue("text0")
+	serial = columns.TextValue("text8")
+	fetched_data = columns.TextValue("long_text")
 
-		self.model_matches_connect = columns.ConnectBoards("connect_boards")
-		self.model_description_matches_connect = columns.ConnectBoards("board_relation")
-		self.main_board_connect = columns.ConnectBoards("connect_boards9")
+	model_matches_connect = columns.ConnectBoards("connect_boards")
+	model_description_matches_connect = columns.ConnectBoards("board_relation")
+	main_board_connect = columns.ConnectBoards("connect_boards9")
 
-		self.main_item_id = columns.TextValue("text7")
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	main_item_id = columns.TextValue("text7")
 
 
 class StaffItem(BaseItemType):
 	BOARD_ID = 2477606931
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.monday_id = columns.TextValue("text")
-		self.slack_id = columns.TextValue("text8")
-
-		self.internal_hourly_rate = columns.NumberValue("numbers")
+	monday_id = columns.TextValue("text")
+	slack_id = columns.TextValue("text8")
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	internal_hourly_rate = columns.NumberValue("numbers")
 
 
 class BatteryTestItem(BaseItemType):
 	BOARD_ID = 586351593
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search: bool = False):
-		self.start_level = columns.NumberValue("numbers")
-		self.end_level = columns.NumberValue("numbers_1")
-		self.time_tracking = columns.TimeTrackingColumn("time_tracking")
+	start_level = columns.NumberValue("numbers")
+	end_level = columns.NumberValue("numbers_1")
+	time_tracking = columns.TimeTrackingColumn("time_tracking")
 
-		self.test_status = columns.StatusValue("status")
-		self.test_parameters = columns.DropdownValue("dropdown")
+	test_status = columns.StatusValue("status")
+	test_parameters = columns.DropdownValue("dropdown")
 
-		self.main_item_connect = columns.ConnectBoards("connect_boards")
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	main_item_connect = columns.ConnectBoards("connect_boards")
 
 	def get_hourly_consumption_rate(self):
 		start_level = self.start_level.value
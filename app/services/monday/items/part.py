@@ -1,62 +1,36 @@
 from ..api.items import BaseCacheableItem, BaseItemType
-from ..api import columns, get_api_items, monday_connection, exceptions
+from ..api import columns, monday_connection, exceptions
 from ....utilities import notify_admins_of_error
 
 
 class PartItem(BaseCacheableItem):
 	BOARD_ID = 985177480
+	CACHE_NAMESPACE = "part"
+	PROJECT_COLUMNS = True
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.stock_level = columns.NumberValue("quantity")
-		self.products_connect = columns.ConnectBoards("link_to_products___pricing")
-		self.supply_price = columns.NumberValue("supply_price")
+	stock_level = columns.NumberValue("quantity")
+	products_connect = columns.ConnectBoards("link_to_products___pricing")
+	supply_price = columns.NumberValue("supply_price")
 
-		self.supplier_connect = columns.ConnectBoards("connect_boards")
-		self.reorder_level = columns.NumberValue("numbers")
+	supplier_connect = columns.ConnectBoards("connect_boards")
+	reorder_level = columns.NumberValue("numbers")
 
-		self.all_refurb_components_connect = columns.ConnectBoards("connect_boards__1")
+	all_refurb_components_connect = columns.ConnectBoards("connect_boards__1")
 
+	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
 		self._product_ids = None
 
 		super().__init__(item_id, api_data, search)
 
 	@classmethod
 	def fetch_all(cls, *args):
-		return super().fetch_all("part:")
-
-	@classmethod
-	def get(cls, part_ids):
-		results = []
-		failed = []
-		try:
-			for _ in part_ids:
-				try:
-					part = cls(_).load_from_cache()
-					results.append(part)
-				except Exception as e:
-					notify_admins_of_error(f"Error fetching part{_} from cache: {str(e)}")
-					failed.append(_)
-
-			if failed:
-				part_data = get_api_items(failed)
-				for part_info in part_data:
-					part = cls(part_info['id'], part_info)
-					results.append(part)
-		except TypeError as e:
-			raise e
-		except Exception as e:
-			notify_admins_of_error(f"Error fetching parts {part_ids}: {str(e)}")
-
-		return results
-
-	def cache_key(self):
-		return f"part:{self.id}"
+		return super().fetch_all()
 
 	def prepare_cache_data(self):
 		return {
 			"stock_level": self.stock_level.value,
 			"id": self.id,
-			"product_ids": self._product_ids,
+			"product_ids": self.product_ids,
 			"name": self.name
 		}
 
@@ -64,7 +38,9 @@ class PartItem(BaseCacheableItem):
 		if not cache_data:
 			cache_data = self.fetch_cache_data()
 		self.stock_level.value = cache_data['stock_level']
-		self._product_ids = cache_data['product_ids']
+		if cache_data['product_ids'] is not None:
+			# cached data can be shared between items, see app.cache.catalog.LocalCatalog
+			self._product_ids = list(cache_data['product_ids'])
 		self.id = cache_data['id']
 		self.name = cache_data['name']
 		return self
@@ -129,27 +105,24 @@ class PartItem(BaseCacheableItem):
 class InventoryAdjustmentItem(BaseItemType):
 	BOARD_ID = 989490856
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.quantity_before = columns.NumberValue("quantity_before")
-		self.difference = columns.NumberValue("numbers9")
-		self.quantity_after = columns.NumberValue("quantity_after")
-		self.movement_type = columns.StatusValue("movement_type")
-		self.movement_direction = columns.StatusValue("dup__of_movement_type")
-		self.void_status = columns.StatusValue("status7")
-
-		self.part_id = columns.TextValue("text4")
-		self.part_url = columns.LinkURLValue("part_url")
+	quantity_before = columns.NumberValue("quantity_before")
+	difference = columns.NumberValue("numbers9")
+	quantity_after = columns.NumberValue("quantity_after")
+	movement_type = columns.StatusValue("movement_type")
+	movement_direction = columns.StatusValue("dup__of_movement_type")
+	void_status = columns.StatusValue("status7")
 
-		# self.parts_connect = columns.ConnectBoards("connect_boards9")
-		# self.supplier_connect = columns.ConnectBoards("connect_boards")
+	part_id = columns.TextValue("text4")
+	part_url = columns.LinkURLValue("part_url")
 
-		# self.auto_order_status = columns.StatusValue("status_1")
-		# self.auto_order_minimum = columns.NumberValue("numbers")
+	# parts_connect = columns.ConnectBoards("connect_boards9")
+	# supplier_connect = columns.ConnectBoards("connect_boards")
 
-		self.source_item_id = columns.TextValue("mainboard_id")
-		self.source_url = columns.LinkURLValue("link2")
+	# auto_order_status = columns.StatusValue("status_1")
+	# auto_order_minimum = columns.NumberValue("numbers")
 
-		super().__init__(item_id, api_data, search)
+	source_item_id = columns.TextValue("mainboard_id")
+	source_url = columns.LinkURLValue("link2")
 
 	def void_self(self):
 		part = PartItem(self.part_id.value)
@@ -169,51 +142,39 @@ class InventoryAdjustmentItem(BaseItemType):
 class OrderItem(BaseItemType):
 	BOARD_ID = 2854362805
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.app_meta = columns.LongTextValue("long_text")
-		self.order_status = columns.StatusValue("status7")
-		self.subitem_ids = columns.ConnectBoards("subitems")
-
-		super().__init__(item_id, api_data, search)
+	app_meta = columns.LongTextValue("long_text")
+	order_status = columns.StatusValue("status7")
+	subitem_ids = columns.ConnectBoards("subitems")
 
 
 class OrderLineItem(BaseItemType):
 	BOARD_ID = 2854374997
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.part_id = columns.TextValue("text")
-		self.price = columns.NumberValue("numbers_1")
-		self.quantity = columns.NumberValue("numbers5")
-		self.processing_status = columns.StatusValue("status6")
-
-		super().__init__(item_id, api_data, search)
+	part_id = columns.TextValue("text")
+	price = columns.NumberValue("numbers_1")
+	quantity = columns.NumberValue("numbers5")
+	processing_status = columns.StatusValue("status6")
 
 
 class StockCheckoutControlItem(BaseItemType):
 	BOARD_ID = 6267736041
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.main_item_id = columns.TextValue("text")
-		self.main_item_connect = columns.ConnectBoards("connect_boards")
-		# self.repair_status = columns.StatusValue("status47")
-		self.profile_status = columns.StatusValue("status4")
-		self.checkout_status = columns.StatusValue("status3")
-
-		self.checkout_line_ids = columns.ConnectBoards("subitems")
+	main_item_id = columns.TextValue("text")
+	main_item_connect = columns.ConnectBoards("connect_boards")
+	# repair_status = columns.StatusValue("status47")
+	profile_status = columns.StatusValue("status4")
+	checkout_status = columns.StatusValue("status3")
 
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	checkout_line_ids = columns.ConnectBoards("subitems")
 
 
 class StockCheckoutLineItem(BaseItemType):
 	BOARD_ID = 6267766059
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.line_checkout_status = columns.StatusValue("status0")
-		self.parts_cost = columns.NumberValue("numbers")
-		self.part_id = columns.TextValue("text")
-		self.inventory_movement_id = columns.TextValue("text1")
-
-		super().__init__(item_id=item_id, api_data=api_data, search=search)
+	line_checkout_status = columns.StatusValue("status0")
+	parts_cost = columns.NumberValue("numbers")
+	part_id = columns.TextValue("text")
+	inventory_movement_id = columns.TextValue("text1")
 
 
 class RepairMapItem(BaseItemType):
@@ -313,66 +274,50 @@ class RepairMapItem(BaseItemType):
 		except IndexError:
 			return None
 
-	def __init__(self, item_id=None, api_data=None, search=False):
-		self.part_ids = columns.ConnectBoards("connect_boards5")
+	part_ids = columns.ConnectBoards("connect_boards5")
 
-		self.device_col_number = columns.TextValue("device_id")
-		self.parts_used_col_number = columns.TextValue("repair_id")
-		self.colour_col_number = columns.TextValue("colour_id")
+	device_col_number = columns.TextValue("device_id")
+	parts_used_col_number = columns.TextValue("repair_id")
+	colour_col_number = columns.TextValue("colour_id")
 
-		self.combined_id = columns.TextValue("combined_id")
-		self.dual_id = columns.TextValue("dual_only_id")
-
-		super().__init__(item_id, api_data, search)
+	combined_id = columns.TextValue("combined_id")
+	dual_id = columns.TextValue("dual_only_id")
 
 
 class RefurbMenuItem(BaseItemType):
 	BOARD_ID = 1106794399
 
-	def __init__(self, item_id=None, api_data=None, search=False):
-		self.processing_status = columns.StatusValue("status2")
+	processing_status = columns.StatusValue("status2")
 
-		self.part_connect = columns.ConnectBoards("connect_boards")
-		self.quantity_to_add = columns.NumberValue("numbers4")
-
-		super().__init__(item_id, api_data, search)
+	part_connect = columns.ConnectBoards("connect_boards")
+	quantity_to_add = columns.NumberValue("numbers4")
 
 
 class RefurbOutputItem(BaseItemType):
 	BOARD_ID = 3382612900
 
-	def __init__(self, item_id=None, api_data=None, search=False):
-		self.part_id = columns.TextValue("text")
-		self.parts_movement_id = columns.TextValue("text__1")
+	part_id = columns.TextValue("text")
+	parts_movement_id = columns.TextValue("text__1")
 
-		self.batch_size = columns.NumberValue("numbers")
+	batch_size = columns.NumberValue("numbers")
 
-		self.refurb_consumption_status = columns.StatusValue("status1")
-		self.parts_adjustment_status = columns.StatusValue("status6")
-
-		super().__init__(item_id, api_data, search)
+	refurb_consumption_status = columns.StatusValue("status1")
+	parts_adjustment_status = columns.StatusValue("status6")
 
 
 class RefurbOutputSubItem(BaseItemType):
 	BOARD_ID = 3382624519
 
-	def __init__(self, item_id=None, api_data=None, search=False):
-		self.refurb_component_id = columns.TextValue("text")
-		self.quantity_used = columns.NumberValue('numbers')
-		self.stock_adjust_status = columns.StatusValue("status7")
-		self.movement_item_id = columns.TextValue("text2")
-
-		super().__init__(item_id, api_data, search)
+	refurb_component_id = columns.TextValue("text")
+	quantity_used = columns.NumberValue('numbers')
+	stock_adjust_status = columns.StatusValue("status7")
+	movement_item_id = columns.TextValue("text2")
 
 
 class RefurbComponentItem(BaseItemType):
 	BOARD_ID = 3382291117
 
-	def __init__(self, item_id=None, api_data=None, search=False):
-
-		self.stock_level = columns.NumberValue("numbers0")
-
-		super().__init__(item_id, api_data, search)
+	stock_level = columns.NumberValue("numbers0")
 
 	def adjust_stock_level(self, adjustment_quantity, source_item, movement_type):
 		desired_quantity = self.stock_level.value + adjustment_quantity
@@ -416,36 +361,29 @@ class RefurbComponentItem(BaseItemType):
 class RefurbComponentAdjustmentItem(BaseItemType):
 	BOARD_ID = 3390050868
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.quantity_before = columns.NumberValue("numbers")
-		self.difference = columns.NumberValue("numbers_1")
-		self.quantity_after = columns.NumberValue("numbers7")
-		self.movement_type = columns.StatusValue("status1")
-		self.movement_direction = columns.StatusValue("status9")
-
-		self.refurb_component_id = columns.TextValue("text")
+	quantity_before = columns.NumberValue("numbers")
+	difference = columns.NumberValue("numbers_1")
+	quantity_after = columns.NumberValue("numbers7")
+	movement_type = columns.StatusValue("status1")
+	movement_direction = columns.StatusValue("status9")
 
-		self.source_url = columns.LinkURLValue("link__1")
+	refurb_component_id = columns.TextValue("text")
 
-		super().__init__(item_id, api_data, search)
+	source_url = columns.LinkURLValue("link__1")
 
 
 
 class WasteItem(BaseItemType):
 	BOARD_ID = 1157165964
 
-	def __init__(self, item_id=None, api_data=None, search=False):
-
-		self.reason = columns.TextValue("waste_description")
-		self.part_id = columns.TextValue("partboard_id")
-		self.parts_connect = columns.ConnectBoards("connect_boards")
+	reason = columns.TextValue("waste_description")
+	part_id = columns.TextValue("partboard_id")
+	parts_connect = columns.ConnectBoards("connect_boards")
 
-		self.recorded_by = columns.PeopleValue("people")
-		self.movement_item_id = columns.TextValue("text__1")
+	recorded_by = columns.PeopleValue("people")
+	movement_item_id = columns.TextValue("text__1")
 
-		self.stock_adjust_status = columns.StatusValue("waste_status")
-
-		super().__init__(item_id, api_data, search)
+	stock_adjust_status = columns.StatusValue("waste_status")
 
 	def process_stock_adjustment(self, part: PartItem = None):
 		if not part and not self.part_id.value:
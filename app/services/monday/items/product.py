@@ -1,5 +1,5 @@
 from ..api.items import BaseItemType, BaseCacheableItem
-from ..api import columns, get_api_items, monday_connection
+from ..api import columns, monday_connection
 from ..api.exceptions import MondayDataError
 from ....utilities import notify_admins_of_error
 from .repair_phases import RepairPhaseModel
@@ -8,26 +8,29 @@ from .part import PartItem
 
 class ProductItem(BaseCacheableItem):
 	BOARD_ID = 2477699024
+	CACHE_NAMESPACE = "product"
+	CACHE_INDEXES = {"woo_commerce_product_id": "woo_commerce_product_id"}
+	PROJECT_COLUMNS = True
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.device_connect = columns.ConnectBoards("link_to_devices6")
-		self.parts_connect = columns.ConnectBoards("connect_boards8")
-		self.phase_model_connect = columns.ConnectBoards("board_relation4")
+	device_connect = columns.ConnectBoards("link_to_devices6")
+	parts_connect = columns.ConnectBoards("connect_boards8")
+	phase_model_connect = columns.ConnectBoards("board_relation4")
 
-		self.price = columns.NumberValue("numbers")
+	price = columns.NumberValue("numbers")
 
-		self.required_minutes = columns.NumberValue("numbers7")
-		self.woo_commerce_product_id = columns.TextValue("text3")
-		self.price_sync_status = columns.StatusValue("status6")
+	required_minutes = columns.NumberValue("numbers7")
+	woo_commerce_product_id = columns.TextValue("text3")
+	price_sync_status = columns.StatusValue("status6")
 
-		self.product_type = columns.StatusValue("status3")
+	product_type = columns.StatusValue("status3")
 
-		self._device_id = None
-		self._part_ids = None
+	profit_model_gen_text = columns.TextValue("text74")
 
-		self.profit_model_gen_text = columns.TextValue("text74")
+	turnaround = columns.NumberValue("numeric8")
 
-		self.turnaround = columns.NumberValue("numeric8")
+	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
+		self._device_id = None
+		self._part_ids = None
 
 		super().__init__(item_id, api_data, search)
 
@@ -39,7 +42,7 @@ class ProductItem(BaseCacheableItem):
 
 	@classmethod
 	def fetch_all(cls, index_items=False, *args):
-		results = super().fetch_all("product:")
+		results = super().fetch_all()
 		filtered = []
 		for item in results:
 			if not index_items and item.product_type.value == 'Index':
@@ -47,27 +50,6 @@ class ProductItem(BaseCacheableItem):
 			filtered.append(item)
 		return filtered
 
-	@classmethod
-	def get(cls, product_ids):
-		results = []
-		failed = []
-		try:
-			for _ in product_ids:
-				try:
-					results.append(cls(_).load_from_cache())
-				except Exception as e:
-					notify_admins_of_error(f"Error fetching product{_} from cache: {str(e)}")
-					failed.append(_)
-			if failed:
-				prod_data = get_api_items(failed)
-				results.append([cls(_).load_from_api(prod_data[_]) for _ in prod_data])
-		except Exception as e:
-			notify_admins_of_error(f"Error fetching products {product_ids}: {str(e)}")
-		return results
-
-	def cache_key(self):
-		return f"product:{self.id}"
-
 	def load_from_cache(self, cache_data=None):
 		if cache_data is None:
 			cache_data = self.fetch_cache_data()
@@ -76,9 +58,11 @@ class ProductItem(BaseCacheableItem):
 		self.name = cache_data['name']
 		self._device_id = cache_data['device_id']
 		self.id = cache_data['id']
-		self._part_ids = cache_data['part_ids']
+		self._part_ids = list(cache_data['part_ids'])
 		self.turnaround.value = int(cache_data['turnaround'])
 		self.product_type.value = cache_data['product_type']
+		if cache_data.get('woo_commerce_product_id'):
+			self.woo_commerce_product_id.value = cache_data['woo_commerce_product_id']
 		return self
 
 	def prepare_cache_data(self):
@@ -91,6 +75,7 @@ class ProductItem(BaseCacheableItem):
 			"part_ids": self.part_ids,
 			"turnaround": self.turnaround.value,
 			"product_type": self.product_type.value,
+			"woo_commerce_product_id": self.woo_commerce_product_id.value,
 		}
 
 		if not data['device_id']:
@@ -11,9 +11,9 @@ log = logging.getLogger('eric')
 class RepairPhaseModel(BaseItemType):
 	BOARD_ID = 5959544342
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.products_connect = columns.ConnectBoards("connect_boards")
+	products_connect = columns.ConnectBoards("connect_boards")
 
+	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
 		self._phase_lines = []
 
 		super().__init__(item_id, api_data, search)
@@ -44,12 +44,12 @@ class RepairPhaseModel(BaseItemType):
 class RepairPhaseLine(BaseItemType):
 	BOARD_ID = 5959544342
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.phase_entity_connect = columns.ConnectBoards("connect_boards")
+	phase_entity_connect = columns.ConnectBoards("connect_boards")
 
-		self.phase_model_index = columns.NumberValue("numbers5")
-		self.minutes_override = columns.NumberValue("numbers")
+	phase_model_index = columns.NumberValue("numbers5")
+	minutes_override = columns.NumberValue("numbers")
 
+	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
 		self._phase_entity = None
 		self._required_minutes = None
 
@@ -81,12 +81,9 @@ class RepairPhaseLine(BaseItemType):
 class RepairPhaseEntity(BaseItemType):
 	BOARD_ID = 5959721433
 
-	def __init__(self, item_id=None, api_data: dict | None = None, search=False):
-		self.phase_lines_connect = columns.ConnectBoards("board_relation")
-		self.required_minutes = columns.NumberValue("numbers")
-		self.main_board_phase_label = columns.StatusValue("color")
-
-		super().__init__(item_id, api_data, search)
+	phase_lines_connect = columns.ConnectBoards("board_relation")
+	required_minutes = columns.NumberValue("numbers")
+	main_board_phase_label = columns.StatusValue("color")
 
 	def get_phase_line_items(self):
 		phase_line_ids = self.phase_lines_connect.value
@@ -9,6 +9,7 @@ from ....utilities import notify_admins_of_error, users
 from ... import zendesk, monday, xero
 from ..api.items import BaseItemType
 from ..api import columns
+from ..api.exceptions import MondayAPIError
 from . import MainItem
 
 log = logging.getLogger('eric')
@@ -17,30 +18,30 @@ log = logging.getLogger('eric')
 class SaleControllerItem(BaseItemType):
 	BOARD_ID = 6285416596
 
-	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
-		self.main_item_id = columns.TextValue("text")
-		self.main_item_connect = columns.ConnectBoards("connect_boards")
+	main_item_id = columns.TextValue("text")
+	main_item_connect = columns.ConnectBoards("connect_boards")
 
-		self.processing_status = columns.StatusValue("status4")
-		self.convert_to_pl_status = columns.StatusValue("status5")
+	processing_status = columns.StatusValue("status4")
+	convert_to_pl_status = columns.StatusValue("status5")
 
-		self.invoicing_status = columns.StatusValue("status1")
-		self.invoice_line_item_id = columns.TextValue("text018")
-		self.invoice_line_item_connect = columns.ConnectBoards("board_relation")
+	invoicing_status = columns.StatusValue("status1")
+	invoice_line_item_id = columns.TextValue("text018")
+	invoice_line_item_connect = columns.ConnectBoards("board_relation")
 
-		self.corporate_account_connect = columns.ConnectBoards("connect_boards0")
-		self.corporate_account_item_id = columns.TextValue("text00")
-		self.price_override = columns.NumberValue("numbers7")
+	corporate_account_connect = columns.ConnectBoards("connect_boards0")
+	corporate_account_item_id = columns.TextValue("text00")
+	price_override = columns.NumberValue("numbers7")
 
-		self.cost_centre = columns.TextValue("text3")
-		self.username = columns.TextValue("text9")
+	cost_centre = columns.TextValue("text3")
+	username = columns.TextValue("text9")
 
-		self.date_added = columns.DateValue("date4")
+	date_added = columns.DateValue("date4")
 
-		self.subitem_ids = columns.ConnectBoards("subitems")
-		self.device_type = columns.TextValue("text__1")
-		self.parts_cost = columns.NumberValue("numbers7__1")
+	subitem_ids = columns.ConnectBoards("subitems")
+	device_type = columns.TextValue("text__1")
+	parts_cost = columns.NumberValue("numbers7__1")
 
+	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
 		# properties
 		self._main_item = None
 		self._corporate_account_item = None
@@ -205,33 +206,26 @@ class SaleControllerItem(BaseItemType):
 class SaleLineItem(BaseItemType):
 	BOARD_ID = 6285426254
 
-	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
-		self.source_id = columns.TextValue("text")
-		self.line_type = columns.StatusValue("status2")
-		self.price_inc_vat = columns.NumberValue("numbers")
-
-		super().__init__(item_id, api_data, search, cache_data)
+	source_id = columns.TextValue("text")
+	line_type = columns.StatusValue("status2")
+	price_inc_vat = columns.NumberValue("numbers")
 
 
 class InvoiceControllerItem(BaseItemType):
 	BOARD_ID = 6287948446
 
-	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
-
-		self.corporate_account_item_id = columns.TextValue("text9")
-		self.corporate_account_connect = columns.ConnectBoards("connect_boards0")
-		self.po_number = columns.TextValue("text__1")
-
-		self.invoice_id = columns.TextValue("text8")
-		self.invoice_number = columns.TextValue("text0")
+	corporate_account_item_id = columns.TextValue("text9")
+	corporate_account_connect = columns.ConnectBoards("connect_boards0")
+	po_number = columns.TextValue("text__1")
 
-		self.xero_sync_status = columns.StatusValue("status4")
+	invoice_id = columns.TextValue("text8")
+	invoice_number = columns.TextValue("text0")
 
-		self.invoice_status = columns.StatusValue("status58")
+	xero_sync_status = columns.StatusValue("status4")
 
-		self.subitem_ids = columns.ConnectBoards("subitems")
+	invoice_status = columns.StatusValue("status58")
 
-		super().__init__(item_id, api_data, search, cache_data)
+	subitem_ids = columns.ConnectBoards("subitems")
 
 	def add_invoice_line(self, item_name, description, total_price, line_type, source_item) -> "InvoiceLineItem":
 		if not self.id:
@@ -306,18 +300,20 @@ class InvoiceControllerItem(BaseItemType):
 				xero_data['Reference'] = self.po_number.value
 
 			xero_invoice = xero.client.update_invoice(xero_data)
+			session = monday.api.CommitSession()
 			for line_item in xero_invoice['LineItems']:
 				for line in inv_lines_from_monday:
 					if line.line_description.value == line_item['Description']:
 						line.line_item_id = line_item['LineItemID']
-						line.commit()
+						session.add(line)
 
 			self.invoice_id = xero_invoice['InvoiceID']
 			self.invoice_number = xero_invoice['InvoiceNumber']
 
 			self.invoice_status = "DRAFT"
 			self.xero_sync_status = "Synced"
-			self.commit()
+			session.add(self)
+			session.flush()
 		except Exception as e:
 			self.xero_sync_status = "Error"
 			self.commit()
@@ -328,32 +324,32 @@ class InvoiceControllerItem(BaseItemType):
 class InvoiceLineItem(BaseItemType):
 	BOARD_ID = 6288579132
 
-	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
-		self.line_type = columns.StatusValue("status27")
-		self.price_inc_vat = columns.NumberValue("numbers")
-		self.line_item_id = columns.TextValue("text")
-		self.line_description = columns.LongTextValue("line_description")
-
-		self.source_item_id = columns.TextValue("text1")
-		self.source_item_url = columns.LinkURLValue('link')
+	line_type = columns.StatusValue("status27")
+	price_inc_vat = columns.NumberValue("numbers")
+	line_item_id = columns.TextValue("text")
+	line_description = columns.LongTextValue("line_description")
 
-		super().__init__(item_id, api_data, search, cache_data)
+	source_item_id = columns.TextValue("text1")
+	source_item_url = columns.LinkURLValue('link')
 
 
 class WasItWorthItItem(BaseItemType):
 	BOARD_ID = 6310609889
 
-	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
-		self.imeisn = columns.TextValue("text84")
-		self.device_connect = columns.ConnectBoards("connect_boards")
-		self.device_id = columns.TextValue("text3")
+	imeisn = columns.TextValue("text84")
+	device_connect = columns.ConnectBoards("connect_boards")
+	device_id = columns.TextValue("text3")
 
-		self.sale_items_connect = columns.ConnectBoards("connect_boards2")
+	sale_items_connect = columns.ConnectBoards("connect_boards2")
 
-		self.calculation_status = columns.StatusValue("status")
+	calculation_status = columns.StatusValue("status")
 
-		self.date_added = columns.DateValue("date")
-		self.subitem_ids = columns.ConnectBoards("subitems")
+	date_added = columns.DateValue("date")
+	subitem_ids = columns.ConnectBoards("subitems")
+
+	def __init__(self, item_id=None, api_data: dict = None, search=False, cache_data=None):
+		# sub lines are created together at the end of calculate_profit_loss
+		self._pending_sub_lines = []
 
 		super().__init__(item_id, api_data, search, cache_data)
 
@@ -369,17 +365,17 @@ class WasItWorthItItem(BaseItemType):
 			blank.revenue = revenue
 		if notes:
 			blank.notes = notes
-		r = monday.api.monday_connection.items.create_subitem(
-			parent_item_id=int(self.id),
-			subitem_name=name,
-			column_values=blank.staged_changes
-		)
-
-		if r.get('error_message'):
-			notify_admins_of_error(f"Error creating sub line item: {r['error_message']}")
-			raise WasItWorthItError(f"Error creating sub line item on Monday: {r['error_message']}")
+		self._pending_sub_lines.append((name, blank))
+		return blank
 
-		return r['data']['create_subitem']['id'], r['data']['create_subitem']
+	def _create_sub_lines(self):
+		try:
+			created = WasItWorthItLineItem.bulk_create_subitems(int(self.id), self._pending_sub_lines)
+		except MondayAPIError as e:
+			notify_admins_of_error(f"Error creating sub line items: {e}")
+			raise WasItWorthItError(f"Error creating sub line items on Monday: {e}")
+		self._pending_sub_lines = []
+		return created
 
 	def add_parts_cost(self, main_item, sale_item):
 		stock_checkout_item = None
@@ -477,8 +473,8 @@ class WasItWorthItItem(BaseItemType):
 		# remove old lines
 		current_sub_line_ids = self.subitem_ids.value
 		if current_sub_line_ids:
-			for _ in current_sub_line_ids:
-				monday.api.monday_connection.items.delete_item_by_id(_)
+			monday.api.delete_items(current_sub_line_ids)
+		self._pending_sub_lines = []
 
 		try:
 			if not self.sale_items_connect.value:
@@ -497,6 +493,8 @@ class WasItWorthItItem(BaseItemType):
 				self.add_courier_costs(main_item, sale)
 				self.add_labour_costs(main_item)
 
+			self._create_sub_lines()
+
 			self.calculation_status = "Complete"
 			self.commit()
 			return self
@@ -511,38 +509,31 @@ class WasItWorthItItem(BaseItemType):
 class WasItWorthItLineItem(BaseItemType):
 	BOARD_ID = 6310611850
 
-	def __init__(self, item_id=None, api_data=None, search=None, cache_data=None):
-		self.line_type = columns.StatusValue("status")
-		self.cost = columns.NumberValue("numbers")
-		self.revenue = columns.NumberValue("numbers1")
-
-		self.source_item_id = columns.TextValue("text")
-		self.source_item_url = columns.LinkURLValue('link')
+	line_type = columns.StatusValue("status")
+	cost = columns.NumberValue("numbers")
+	revenue = columns.NumberValue("numbers1")
 
-		self.is_warranty = columns.CheckBoxValue("checkbox")
+	source_item_id = columns.TextValue("text")
+	source_item_url = columns.LinkURLValue('link')
 
-		self.notes = columns.LongTextValue("long_text")
+	is_warranty = columns.CheckBoxValue("checkbox")
 
-		super().__init__(item_id, api_data, search, cache_data)
+	notes = columns.LongTextValue("long_text")
 
 
 class ProductSalesLedgerItem(BaseItemType):
 	BOARD_ID = 6894117865
 
-	def __init__(self, item_id=None, api_data=None, search=None):
-
-		self.date_sold = columns.DateValue("date4")
-		self.device_id = columns.TextValue("text9__1")
-		self.device_name = columns.TextValue("text__1")
-		self.device_type = columns.TextValue("text7__1")
-		self.product_id = columns.TextValue("text5__1")
-		self.product_type = columns.TextValue("text2__1")
-		self.sale_subitem_id = columns.TextValue("text55__1")
-		self.price_at_pos = columns.NumberValue("numbers__1")
-		self.sale_item_id = columns.TextValue("text74__1")
-		self.sale_subitem_type = columns.StatusValue("status__1")
-
-		super().__init__(item_id, api_data, search)
+	date_sold = columns.DateValue("date4")
+	device_id = columns.TextValue("text9__1")
+	device_name = columns.TextValue("text__1")
+	device_type = columns.TextValue("text7__1")
+	product_id = columns.TextValue("text5__1")
+	product_type = columns.TextValue("text2__1")
+	sale_subitem_id = columns.TextValue("text55__1")
+	price_at_pos = columns.NumberValue("numbers__1")
+	sale_item_id = columns.TextValue("text74__1")
+	sale_subitem_type = columns.StatusValue("status__1")
 
 	@classmethod
 	def create_new_record(cls, sale_item_id, delete_old_record=True):
@@ -584,6 +575,11 @@ class ProductSalesLedgerItem(BaseItemType):
 				raise Exception(f"Error fetching Sale Subitems: {subitem_query['error_message']}")
 			else:
 				subitem_data = subitem_query['data']['items'][0]['subitems']
+
+			# old records are deleted and new ones created together once every subitem has been processed
+			old_record_ids = []
+			new_records = []
+			new_record_comments = []
 			for sale_subitem_id in [int(_['id']) for _ in subitem_data]:
 				try:
 					# check record doesn't already exist
@@ -599,9 +595,7 @@ class ProductSalesLedgerItem(BaseItemType):
 						if not delete_old_record:
 							continue
 						# delete the item, we will make a new one
-						monday.api.monday_connection.items.delete_item_by_id(
-							existing_query['data']['items_page_by_column_values']['items'][0]['id']
-						)
+						old_record_ids.append(existing_query['data']['items_page_by_column_values']['items'][0]['id'])
 					elif not existing_query['data']['items_page_by_column_values']['items']:
 						pass
 
@@ -650,10 +644,8 @@ class ProductSalesLedgerItem(BaseItemType):
 					new.product_id = str(product_id)
 					new.product_type = str(product_type)
 
-					new.create(sale_subitem.name)
-
-					if comments:
-						new.add_update("\n".join(comments))
+					new_records.append((sale_subitem.name, new))
+					new_record_comments.append(list(comments))
 
 				except Exception as e:
 					error_messages = "\n".join(comments)
@@ -663,6 +655,11 @@ class ProductSalesLedgerItem(BaseItemType):
 						update_value=f"Error creating Product Ledger Record\n\n{error_messages}",
 					)
 
+			monday.api.delete_items(old_record_ids)
+			for new, record_comments in zip(cls.bulk_create(new_records), new_record_comments):
+				if record_comments:
+					new.add_update("\n".join(record_comments))
+
 		except Exception as e:
 			notify_admins_of_error(f"Error creating Product Ledger Record: {e}")
 			monday.api.monday_connection.updates.create_update(
@@ -1,2 +1,2 @@
 from .base import get_modal_base
-from . import add, elements, objects, options
+from . import add, elements, objects, options, typeahead
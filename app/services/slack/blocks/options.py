@@ -1,53 +1,49 @@
 from ... import monday
 from . import objects
+from .typeahead import TypeaheadIndex, TypeaheadEntry
 
 
-def generate_device_options_list(filter_by_name=''):
-	devices = monday.items.DeviceItem.fetch_all(slack_data=False)
+def _device_entries():
+	for device in monday.items.DeviceItem.fetch_all(slack_data=False):
+		yield TypeaheadEntry(device.name, device.id, group=device.device_type.value or 'Device')
+
+
+def _product_entries():
+	for product in monday.items.ProductItem.fetch_all():
+		yield TypeaheadEntry(product.name, product.id, attributes={"device_id": product.device_id})
+
+
+def _part_entries():
+	for part in monday.items.PartItem.fetch_all():
+		if 'index' in part.name.lower():
+			continue
+		yield TypeaheadEntry(part.name, part.id)
 
-	if filter_by_name:
-		devices = [device for device in devices if filter_by_name.lower() in device.name.lower()]
 
-	device_types = set([device.device_type.value for device in devices])
-	raw_dict = {
-		dt: [] for dt in device_types
-	}
+device_index = TypeaheadIndex(monday.items.DeviceItem.CACHE_NAMESPACE, _device_entries)
+product_index = TypeaheadIndex(monday.items.ProductItem.CACHE_NAMESPACE, _product_entries)
+part_index = TypeaheadIndex(monday.items.PartItem.CACHE_NAMESPACE, _part_entries)
 
-	for device in devices:
-		d_type = device.device_type.value
-		if not d_type:
-			d_type = 'Device'
-		raw_dict[d_type].append([device.name, device.id])
 
-	for d_set in raw_dict:
-		raw_dict[d_set].sort(key=lambda x: x[0])
-		raw_dict[d_set].reverse()
+def generate_device_options_list(filter_by_name=''):
+	# groups are ordered by their most relevant device
+	raw_dict = {}
+	for entry in device_index.search(filter_by_name, limit=None):
+		group = raw_dict.setdefault(entry.group, [])
+		if len(group) < 100:
+			group.append([entry.text, entry.value])
 
 	return objects.generate_option_groups(raw_dict)
 
 
 def generate_product_options(device_id=None, filter_by_name=''):
-	products = monday.items.ProductItem.fetch_all()
-
 	if device_id:
-		products = [_ for _ in products if str(_.device_id) == str(device_id)]
+		products = product_index.search(filter_by_name, device_id=device_id)
+	else:
+		products = product_index.search(filter_by_name)
 
-	if filter_by_name:
-		products = [_ for _ in products if filter_by_name.lower() in _.name.lower()]
-
-	return [objects.plain_text_object(_.name, _.id) for _ in products]
+	return [objects.plain_text_object(_.text, _.value) for _ in products]
 
 
 def create_slack_friendly_parts_options(search_string):
-	search_terms = search_string.split(' ')
-	all_parts = monday.items.PartItem.fetch_all()
-	part_options = []
-	for part in all_parts:
-		if 'index' in part.name.lower():
-			continue
-		if all(term.lower() in part.name.lower() for term in search_terms):
-			part_options.append(objects.plain_text_object(part.name, str(part.id)))
-		if len(part_options) > 98:
-			break
-	part_options.sort(key=lambda x: x['text']['text'].lower(), reverse=True)
-	return part_options
\ No newline at end of file
+	return [objects.plain_text_object(_.text, _.value) for _ in part_index.search(search_string, limit=99)]
@@ -0,0 +1,134 @@
+# in-process search indexes over catalog item names, for Slack option (block_suggestion) requests
+# an index is built from the catalog cache once, then queried with n-gram lookups instead of filtering every item on
+# each keystroke. It is rebuilt when its catalog cache version changes, and at least every CATALOG_TYPEAHEAD_TTL
+# seconds so item changes made through webhooks are picked up
+import re
+import time
+import logging
+import threading
+
+import config
+
+from ....cache import catalog
+
+conf = config.get_config()
+
+log = logging.getLogger('eric')
+
+# n-grams of up to this length are indexed, longer search terms are matched through their n-grams
+NGRAM_SIZE = 3
+
+# Slack shows at most 100 options (and 100 options per group)
+MAX_OPTIONS = 100
+
+
+class TypeaheadEntry:
+	__slots__ = ('text', 'value', 'group', 'attributes', 'search_text', 'words')
+
+	def __init__(self, text, value, group=None, attributes=None):
+		self.text = str(text)
+		self.value = str(value)
+		self.group = group
+		self.attributes = attributes or {}
+		self.search_text = self.text.lower()
+		self.words = [_ for _ in re.split(r'[^a-z0-9]+', self.search_text) if _]
+
+
+class TypeaheadIndex:
+	"""
+	A ranked substring search over the names of a catalog's items
+	:param namespace: the catalog cache namespace the entries come from, the index is rebuilt when its version changes
+	:param load_entries: returns the TypeaheadEntry list to index
+	"""
+
+	def __init__(self, namespace, load_entries):
+		self.namespace = namespace
+		self.load_entries = load_entries
+		self._lock = threading.Lock()
+		self._entries = []
+		self._ngrams = {}
+		self._version = None
+		self._built_at = None
+
+	def _is_current(self):
+		if self._built_at is None or time.monotonic() - self._built_at > conf.CATALOG_TYPEAHEAD_TTL:
+			return False
+		return catalog.current_version(self.namespace) == self._version
+
+	def _ensure_built(self):
+		if self._is_current():
+			return
+		with self._lock:
+			if self._is_current():
+				return
+			version = catalog.current_version(self.namespace)
+			entries = list(self.load_entries())
+			ngrams = {}
+			for position, entry in enumerate(entries):
+				for gram in _ngrams(entry.search_text):
+					ngrams.setdefault(gram, set()).add(position)
+			self._entries, self._ngrams = entries, ngrams
+			self._version, self._built_at = version, time.monotonic()
+			log.debug(f"Built {self.namespace} typeahead index of {len(entries)} entries (version {version})")
+
+	def invalidate(self):
+		self._built_at = None
+
+	def search(self, query='', limit=MAX_OPTIONS, **attributes):
+		"""
+		the entries whose text contains every term of query, most relevant first
+		:param attributes: only return entries with these attribute values, e.g. device_id='123'
+		"""
+		self._ensure_built()
+		entries, ngrams = self._entries, self._ngrams
+
+		terms = [_ for _ in query.lower().split() if _]
+		candidates = None
+		for term in terms:
+			found = None
+			for gram in _term_ngrams(term):
+				positions = ngrams.get(gram, set())
+				found = positions if found is None else found & positions
+				if not found:
+					return []
+			candidates = found if candidates is None else candidates & found
+			if not candidates:
+				return []
+		candidates = range(len(entries)) if candidates is None else candidates
+
+		matches = []
+		for position in candidates:
+			entry = entries[position]
+			if any(str(entry.attributes.get(key)) != str(value) for key, value in attributes.items()):
+				continue
+			# n-grams only narrow the candidates, each term must still appear whole
+			if all(term in entry.search_text for term in terms):
+				matches.append(entry)
+		matches.sort(key=lambda entry: _rank(entry, query.lower().strip(), terms))
+		return matches[:limit]
+
+
+def _ngrams(text):
+	grams = set()
+	for size in range(1, NGRAM_SIZE + 1):
+		grams.update(text[i:i + size] for i in range(len(text) - size + 1))
+	return grams
+
+
+def _term_ngrams(term):
+	if len(term) <= NGRAM_SIZE:
+		return [term]
+	return [term[i:i + NGRAM_SIZE] for i in range(len(term) - NGRAM_SIZE + 1)]
+
+
+def _rank(entry, query, terms):
+	# exact names first, then names starting with the query, then names with a word starting with each term
+	if entry.search_text == query:
+		relevance = 0
+	elif query and entry.search_text.startswith(query):
+		relevance = 1
+	elif all(any(word.startswith(term) for word in entry.words) for term in terms):
+		relevance = 2
+	else:
+		relevance = 3
+	return relevance, len(entry.text), entry.search_text
@@ -1246,11 +1246,13 @@ class StandUpViews:
 			)
 
 		# show list of repairs, from tech group and under repair group
-		tech_group_repair = monday.api.get_api_items_by_group(monday.items.MainItem.BOARD_ID, tech.repair_group_id)
-		under_repairs = monday.api.get_api_items_by_group(monday.items.MainItem.BOARD_ID, conf.UNDER_REPAIR_GROUP_ID)
+		tech_group_repair = monday.api.get_api_items_by_group(
+			monday.items.MainItem.BOARD_ID, tech.repair_group_id, column_ids=[])
+		under_repairs = monday.api.get_api_items_by_group(
+			monday.items.MainItem.BOARD_ID, conf.UNDER_REPAIR_GROUP_ID, column_ids=[])
 
 		repair_ids = [i['id'] for i in tech_group_repair] + [i['id'] for i in under_repairs]
-		repairs_data = monday.api.get_api_items(repair_ids)
+		repairs_data = monday.api.get_api_items(repair_ids, column_ids=monday.items.MainItem.get_column_ids())
 		repairs = [monday.items.MainItem(_['id'], _).load_from_api(_) for _ in repairs_data]
 
 		date_in_future = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(weeks=52)
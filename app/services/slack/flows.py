@@ -333,15 +333,12 @@ class RepairViewFlow(FlowController):
 				self.meta['pre_checks'] = check_dicts
 
 		check_item_data = {_['id']: _ for _ in monday.api.get_api_items([_['id'] for _ in check_dicts])}
-		check_board_data = monday.api.monday_connection.boards.fetch_boards_by_id(
-			monday.items.misc.CheckItem.BOARD_ID
-		)['data']['boards'][0]
 		for check in check_dicts:
 			check_id = check['id']
 			pre_check_item = monday.items.misc.CheckItem(check_id, check_item_data[check_id])
 			if pre_check_item.response_type.value in ("Text Input", "Number Input"):
 				continue
-			available_responses = pre_check_item.get_available_responses(labels=True, board_data=check_board_data)
+			available_responses = pre_check_item.get_available_responses(labels=True)
 			options = []
 			for available_response in available_responses:
 				option = {
@@ -471,10 +468,10 @@ class WalkInFlow(RepairViewFlow):
 		self.ack()
 
 		# Get the repairs
-		results = monday.api.monday_connection.groups.get_items_by_group(monday.items.MainItem.BOARD_ID,
-																		 conf.TODAYS_REPAIRS_GROUP_ID)
-		results = results['data']['boards'][0]['groups'][0]['items_page']['items']
-		item_data = monday.api.get_api_items([_['id'] for _ in results])
+		results = monday.api.get_api_items_by_group(
+			monday.items.MainItem.BOARD_ID, conf.TODAYS_REPAIRS_GROUP_ID, column_ids=[])
+		item_data = monday.api.get_api_items(
+			[_['id'] for _ in results], column_ids=monday.items.MainItem.get_column_ids())
 		repairs = [monday.items.MainItem(item['id'], item) for item in item_data]
 		repairs = [repair for repair in repairs if 'walk' in repair.service.value.lower()]
 
@@ -920,11 +917,10 @@ class CountsFlow(FlowController):
 		log.debug(f"Devices for count: {devices}")
 
 		for device in devices:
-			product_ids = device.products_connect.value
-			if not product_ids:
+			products = monday.items.ProductItem.get(device.products_connect.value or [])
+			if not products:
 				devices_without_products.append(device)
 				continue
-			products = monday.items.ProductItem.get(product_ids)
 			for product in products:
 				try:
 					part_type_from_monday = product.product_type.value.lower()
@@ -26,12 +26,15 @@ def sync_product_field_options():
 	log.debug("Syncing Product Field")
 	product_field_id = 360011640097
 	all_products = items.ProductItem.fetch_all()
+	devices = {str(_.id): _ for _ in items.DeviceItem.fetch_all()}
 	results = []
 	for product in all_products:
 		device_id = product.device_id
+		if device_id and str(device_id) not in devices:
+			device_data = api.get_api_items([device_id])[0]
+			devices[str(device_id)] = items.DeviceItem(device_data['id'], device_data)
 		if device_id:
-			device_data = api.get_api_items([product.device_id])[0]
-			device = items.DeviceItem(device_data['id'], device_data)
+			device = devices[str(device_id)]
 			option_name = f"{device.device_type.value}::{device.name}::{product.name}: £{product.price.value}"
 		else:
 			option_name = f"Device::Other Device::{product.name}: £{product.price.value}"
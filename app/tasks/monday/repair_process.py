@@ -1,9 +1,21 @@
 import datetime
+import logging
 
 import config
+from ...errors import EricError
 from ...utilities import notify_admins_of_error, users
 from ...services import monday as mon_obj, slack
 
+log = logging.getLogger('eric')
+
+REPAIR_PAUSED_STATUS_LABELS = (
+	'No/Incorrect Password',
+	'Parts Issue',
+	'Stuck with Repair',
+	'Jump to Other Repair',
+	'Battery Testing',
+)
+
 
 def sync_check_items_and_results_columns(check_item_id=None):
 	results_board_id = 6487504495
@@ -50,6 +62,56 @@ def sync_check_items_and_results_columns(check_item_id=None):
 		continue
 
 
+def handle_tech_status_change(main_id, new_label):
+	"""moves a repair to its next phase when the technician completes the current one"""
+	def get_next_phase_entity(main):
+		# get_phase_model, then look at line items and match self.phase_status to line item mainboard_repair_status
+		phase_model = main.get_phase_model()
+		lines = phase_model.phase_lines
+		log.debug(f"Got {len(lines)} phase lines:")
+		for line in lines:
+			log.debug(str(line))
+		for i, line in enumerate(lines):
+			phase_entity = line.get_phase_entity_item()
+			log.debug(str(phase_entity))
+			if phase_entity.main_board_phase_label.value == main.repair_phase.value:
+				# Check if there is a next item
+				if i + 1 < len(lines):
+					next_line = lines[i + 1]
+					return next_line.get_phase_entity_item()
+				else:
+					# There is no next item, handle accordingly
+					return None
+
+	if new_label == 'Complete':
+		log.debug(f"Phase completed, moving to next phase")
+		main = mon_obj.items.MainItem(main_id).load_from_api()
+		next_phase = get_next_phase_entity(main)
+		if not next_phase:
+			# no more phases, repair has been completed
+			main.repair_phase = "Repaired"
+		else:
+			main.repair_phase = next_phase.main_board_phase_label.value
+			main.phase_status = "Not Started"
+
+		main.commit()
+
+	elif new_label in REPAIR_PAUSED_STATUS_LABELS:
+		log.warning(f"Repair Paused: {new_label}")
+	# notify_admins_of_error(f"{str(main)} paused with status: {new_label}. Actions will neeed to be taken")
+
+	elif new_label == 'Not Started':
+		log.debug('Not Started: Do Nothing')
+	# notify_admins_of_error(f"{str(main)} has been reset to Not Started. This is likely a system change.")
+
+	elif new_label == 'Active':
+		log.warning("Not Yet Developed")
+	# notify_admins_of_error("Tech Status Adjustment: Active. A technician has started repairing a phase")
+
+	else:
+		raise EricError(f"Unknown Tech Status: {new_label}")
+
+
 def request_checks_from_technician(main_item_id, checkpoint_name, monday_user_id=None):
 	slack_cli = slack.slack_app.client
 	main_item = mon_obj.items.MainItem(main_item_id)
@@ -6,6 +6,7 @@ from zenpy.lib.api_objects import Comment
 from ...errors import EricError
 from ...services import monday, zendesk, xero
 from ...utilities import notify_admins_of_error
+from ...cache.rq import q_high, enqueue_debounced
 
 
 def create_or_update_sale(main_id, report_to_main=False):
@@ -27,8 +28,7 @@ def create_or_update_sale(main_id, report_to_main=False):
 	try:
 		# remove old sale lines
 		current_sale_line_ids = sale_controller.subitem_ids.value or []
-		for _id in current_sale_line_ids:
-			monday.api.monday_connection.items.delete_item_by_id(int(_id))
+		monday.api.delete_items(current_sale_line_ids)
 	except Exception as e:
 		notify_admins_of_error(f"Error removing old sale lines: {e}")
 		sale_controller.processing_status = "Error"
@@ -50,6 +50,9 @@ def create_or_update_sale(main_id, report_to_main=False):
 		return sale_controller
 
 	try:
+		# sale lines are created together once all have been prepared
+		sale_lines = []
+
 		# add products
 		for prod in main_item.products:
 
@@ -60,11 +63,7 @@ def create_or_update_sale(main_id, report_to_main=False):
 			if price:
 				blank_line.price_inc_vat = int(price)
 			blank_line.source_id = str(prod.id)
-			line = monday.api.monday_connection.items.create_subitem(
-				parent_item_id=sale_controller.id,
-				subitem_name=prod.name,
-				column_values=blank_line.staged_changes
-			)
+			sale_lines.append((prod.name, blank_line))
 
 		custom_quote_ids = main_item.custom_quote_connect.value
 
@@ -79,11 +78,9 @@ def create_or_update_sale(main_id, report_to_main=False):
 				if price:
 					blank_line.price_inc_vat = int(price)
 				blank_line.source_id = str(custom.id)
-				line = monday.api.monday_connection.items.create_subitem(
-					parent_item_id=sale_controller.id,
-					subitem_name=custom.name,
-					column_values=blank_line.staged_changes
-				)
+				sale_lines.append((custom.name, blank_line))
+
+		monday.items.sales.SaleLineItem.bulk_create_subitems(sale_controller.id, sale_lines)
 		sale_controller.processing_status = "Complete"
 
 		if main_item.device_id:
@@ -95,7 +92,7 @@ def create_or_update_sale(main_id, report_to_main=False):
 		sale_controller.device_type = device_type
 
 		stock_checkout_item = monday.items.part.StockCheckoutControlItem().search_board_for_items(
-			"main_item_id", str(main_id)
+			"main_item_id", str(main_id), column_ids=[]
 		)
 		if stock_checkout_item:
 			stock_checkout_item = monday.items.part.StockCheckoutControlItem(stock_checkout_item[0]['id'])
@@ -126,6 +123,19 @@ def create_or_update_sale(main_id, report_to_main=False):
 		raise e
 
 
+def sync_sale_from_linked_item(item_id, main_id_column_id):
+	"""(re)create the sale of the main item that a sales control or old financial item holds the ID of"""
+	api_data = monday.api.get_api_items([int(item_id)])[0]
+	main_id = [c for c in api_data['column_values'] if c['id'] == main_id_column_id][0]['text']
+
+	return enqueue_debounced(
+		q_high,
+		f"sale_sync:{main_id}",
+		create_or_update_sale,
+		main_id
+	)
+
+
 def create_or_update_sales_ledger_item(sale_id):
 	monday.items.sales.ProductSalesLedgerItem.create_new_record(sale_id)
 
@@ -53,7 +53,8 @@ def update_stock_checkouts(main_id, create_sc_item=False):
 			if line.inventory_movement_id.value:
 				mov_item = monday.items.part.InventoryAdjustmentItem(line.inventory_movement_id.value)
 				mov_item.void_self()
-			monday.api.monday_connection.items.delete_item_by_id(line.id)
+			# deleted straight after voiding its movement, so a retry never voids (and restocks) a line twice
+			monday.api.delete_items([line.id])
 
 		# repair_id_lists = main_item.generate_repair_map_value_list()
 
@@ -143,14 +144,12 @@ def update_stock_checkouts(main_id, create_sc_item=False):
 
 		parts_data = monday.api.get_api_items(part_ids)
 		parts = [monday.items.PartItem(_['id'], _) for _ in parts_data]
+		checkout_lines = []
 		for part in parts:
-			i = monday.api.monday_connection.items.create_subitem(
-				checkout_controller.id,
-				part.name,
-			)
-			i = monday.items.part.StockCheckoutLineItem(i['data']['create_subitem']['id'], i['data']['create_subitem'])
+			i = monday.items.part.StockCheckoutLineItem()
 			i.part_id = str(part.id)
-			i.commit()
+			checkout_lines.append((part.name, i))
+		monday.items.part.StockCheckoutLineItem.bulk_create_subitems(checkout_controller.id, checkout_lines)
 
 		checkout_controller.profile_status = profile_status
 		if profile_status == "Complete":
@@ -166,6 +165,14 @@ def update_stock_checkouts(main_id, create_sc_item=False):
 		raise e
 
 
+def update_stock_checkouts_for_control_item(sc_item_id):
+	sc_item = monday.items.part.StockCheckoutControlItem(sc_item_id)
+	main_id = sc_item.main_item_id.value
+	if main_id:
+		return update_stock_checkouts(main_id)
+	return False
+
+
 def process_stock_checkout(stock_checkout_id):
 	checkout_controller = monday.items.part.StockCheckoutControlItem(stock_checkout_id).load_from_api()
 	try:
@@ -251,6 +258,8 @@ def process_complete_order_item(order_item_id):
 					movement_type="Order"
 				)
 
+				# each line's status is committed with its stock change, so a failure part way never leaves stock
+				# adjusted on a line that does not show it was processed
 				line.processing_status = "Complete"
 				line.commit()
 			except Exception as e:
@@ -283,7 +292,6 @@ def process_completed_count_item(count_item_id):
 					source_item=line,
 					movement_type="Stock Count",
 				)
-				part.commit()
 			except Exception as e:
 				notify_admins_of_error(f"Could Not Process Count Line {line}: {e}")
 				raise e
@@ -419,14 +427,12 @@ def list_refurb_components(refurb_output_id, refurb_output=None):
 			raise monday.api.exceptions.MondayDataError(f"{part.name} has no Refurb Components Connected")
 		refurb_component_data = monday.api.get_api_items(part.all_refurb_components_connect.value)
 		refurb_components = [monday.items.part.RefurbComponentItem(_['id'], _) for _ in refurb_component_data]
+		component_lines = []
 		for component in refurb_components:
 			blank = monday.items.part.RefurbOutputSubItem()
 			blank.refurb_component_id = str(component.id)
-			monday.api.monday_connection.items.create_subitem(
-				parent_item_id=refurb_output.id,
-				subitem_name=component.name,
-				column_values=blank.staged_changes
-			)
+			component_lines.append((component.name, blank))
+		monday.items.part.RefurbOutputSubItem.bulk_create_subitems(refurb_output.id, component_lines)
 		refurb_output.refurb_consumption_status = "Waiting for User Input"
 		refurb_output.commit()
 	except Exception as e:
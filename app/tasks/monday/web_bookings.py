@@ -246,12 +246,15 @@ def transfer_web_booking(web_booking_item_id, is_second_attempt=False):
 		try:
 			for _ in repair_products:
 				try:
-					results = monday.items.ProductItem(search=True).search_board_for_items(
-						'woo_commerce_product_id',
-						str(_['id'])
-					)
-					result = results[0]
-					search_results.append(monday.items.ProductItem(result['id'], result))
+					products = monday.items.ProductItem.find('woo_commerce_product_id', _['id'])
+					if not products:
+						# the product may have been linked to Woo Commerce since it was cached
+						result = monday.items.ProductItem(search=True).search_board_for_items(
+							'woo_commerce_product_id',
+							str(_['id'])
+						)[0]
+						products = [monday.items.ProductItem(result['id'], result)]
+					search_results.append(products[0])
 				except IndexError:
 					log.error(f"Could not find Woo product in Eric: {str(_['name'])}({str(_['id'])})")
 
@@ -428,6 +431,20 @@ def transfer_web_booking(web_booking_item_id, is_second_attempt=False):
 	return booking_item
 
 
+def create_web_booking_from_woo_order(order_data):
+	try:
+		item = monday.items.misc.WebBookingItem()
+		item.woo_commerce_order_id = str(order_data['id'])
+		item.create(order_data['billing']['first_name'])
+	except Exception as e:
+		log.error(f"Error processing WooCommerce Order: {e}")
+		notify_admins_of_error(f"Error processing WooCommerce Order: {e}\n\n{type(order_data)}\n{order_data}")
+		return None
+
+	item.add_update(json.dumps(order_data, indent=4))
+	return item
+
+
 def push_web_enquiry_to_zendesk(web_enquiry_id):
 	try:
 		enquiry = monday.items.misc.WebEnquiryItem(web_enquiry_id)
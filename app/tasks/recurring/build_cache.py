@@ -1,8 +1,7 @@
 # run_cache.py
-from app.cache.utilities import build_product_cache, build_device_cache, build_pre_check_cache, build_part_cache
+from app.cache.utilities import sweep_catalog_caches
 
 if __name__ == "__main__":
-    build_product_cache()
-    build_device_cache()
-    build_pre_check_cache()
-    build_part_cache()
+    # catalog caches are kept up to date by webhooks, the sweep catches missed changes (and builds missing caches)
+    # full rebuilds are still available through /admin/refresh-cache
+    sweep_catalog_caches()
@@ -38,7 +38,8 @@ def reconcile_enquiry_conversions(start=datetime.datetime.now() - datetime.timed
 		email = ticket.requester.email
 		search = monday.items.misc.WebBookingItem(search=True).search_board_for_items(
 			"email",
-			str(email)
+			str(email),
+			column_ids=[]
 		)
 
 		if search:
@@ -3,7 +3,6 @@ import time
 from dateutil.parser import parse
 import os
 import datetime
-from rq.job import Job
 from typing import List
 from pprint import pprint as p
 
@@ -12,32 +11,21 @@ from ...services.motion import MotionClient, MotionRateLimitError, MotionError
 from ...utilities import users, notify_admins_of_error
 from ... import conf
 from ...errors import EricError
-from ...cache import get_redis_connection
-from ...cache.rq import q_high
+from ...cache.rq import q_high, enqueue_debounced
 
 log = logging.getLogger('eric')
 
 
 def schedule_update(repair_group_id):
+	# changes to a technician's repairs within the delay are synced in one run
 	user = users.User(repair_group_id=repair_group_id)
-	job_id = f"schedule_sync:{user.monday_id}"
-
-	scheduled_registry = q_high.scheduled_job_registry
-
-	# Check if there are any existing jobs for this task/user and cancel them
-	for job_id in scheduled_registry.get_job_ids():
-		job = Job(job_id, get_redis_connection())
-		if job.meta.get('schedule_task_id') == job_id:
-			scheduled_registry.remove(job)
-
-	# Schedule a new job to update Monday.com after the delay period
-	job = q_high.enqueue_in(
-		time_delta=datetime.timedelta(seconds=15),
-		func=sync_repair_schedule,
-		args=(user.repair_group_id,)
+	return enqueue_debounced(
+		q_high,
+		f"schedule_sync:{user.monday_id}",
+		sync_repair_schedule,
+		user.repair_group_id,
+		delay=15,
 	)
-	job.meta['schedule_task_id'] = job_id
-	job.save_meta()
 
 
 def sync_repair_schedule(monday_group_id):
@@ -49,13 +37,15 @@ def sync_repair_schedule(monday_group_id):
 
 		log.debug(f"Syncing for user: {user.name}")
 
-		tech_group_ids = [api_data['id'] for api_data in monday.api.client.get_api_items_by_group(conf.MONDAY_MAIN_BOARD_ID, monday_group_id)]
-		repair_group_ids = [api_data['id'] for api_data in monday.api.client.get_api_items_by_group(conf.MONDAY_MAIN_BOARD_ID, conf.UNDER_REPAIR_GROUP_ID)]
+		tech_group_ids = [api_data['id'] for api_data in monday.api.client.get_api_items_by_group(conf.MONDAY_MAIN_BOARD_ID, monday_group_id, column_ids=[])]
+		repair_group_ids = [api_data['id'] for api_data in monday.api.client.get_api_items_by_group(conf.MONDAY_MAIN_BOARD_ID, conf.UNDER_REPAIR_GROUP_ID, column_ids=[])]
+
+		main_columns = monday.items.MainItem.get_column_ids()
 
-		tech_group_data = monday.api.client.get_api_items(tech_group_ids)
+		tech_group_data = monday.api.client.get_api_items(tech_group_ids, column_ids=main_columns)
 		tech_group_items = [monday.items.MainItem(data['id'], data) for data in tech_group_data]
 
-		under_repair_data = monday.api.client.get_api_items(repair_group_ids)
+		under_repair_data = monday.api.client.get_api_items(repair_group_ids, column_ids=main_columns)
 		under_repair_group_items = [monday.items.MainItem(data['id'], data) for data in under_repair_data]
 
 		assigned_repair_group_item = [
@@ -67,19 +57,20 @@ def sync_repair_schedule(monday_group_id):
 
 		all_repairs = tech_group_items + status_valid_under_repair_items
 		repairs = []
-		for repair in all_repairs:
-			if not repair.hard_deadline.value:
-				log.debug(f"Repair {repair.name} has no deadline, skipping")
-				repair.motion_scheduling_status = 'No Deadline'
-				repair.commit()
-				continue
-			elif repair.hard_deadline.value < datetime.datetime.now(datetime.timezone.utc):
-				log.debug(f"Repair {repair.name} has deadline in past, skipping")
-				repair.motion_scheduling_status = 'Deadline in Past'
-				repair.commit()
-				continue
-			else:
-				repairs.append(repair)
+		with monday.api.CommitSession() as session:
+			for repair in all_repairs:
+				if not repair.hard_deadline.value:
+					log.debug(f"Repair {repair.name} has no deadline, skipping")
+					repair.motion_scheduling_status = 'No Deadline'
+					session.add(repair)
+					continue
+				elif repair.hard_deadline.value < datetime.datetime.now(datetime.timezone.utc):
+					log.debug(f"Repair {repair.name} has deadline in past, skipping")
+					repair.motion_scheduling_status = 'Deadline in Past'
+					session.add(repair)
+					continue
+				else:
+					repairs.append(repair)
 
 		log.debug(f"Syncing for repairs: {[repair.name for repair in repairs]}")
 
@@ -218,65 +209,203 @@ def sync_monday_phase_deadlines(user, repairs: List[monday.items.MainItem]):
 	motion_client = MotionClient(user)
 	schedule = motion_client.list_tasks()['tasks']
 	# now we actually schedule Monday
-	for repair in repairs:
-		try:
-			log.debug(f"Syncing {repair} with Motion ID {repair.motion_task_id.value}")
-			# cycle through Monday repairs, raising errors for incorrect values
+	with monday.api.CommitSession() as session:
+		for repair in repairs:
 			try:
-				motion_task = [t for t in schedule if t['id'] == repair.motion_task_id.value][0]
-			except IndexError:
-				# this means we have Motion Task ID in Monday that does not exist in Motion, we should replace this value
-				log.debug(f"Cannot find Motion task with ID: {repair.motion_task_id.value}")
-				continue
-			try:
-				motion_deadline = parse(motion_task['scheduledEnd'])
-			except TypeError:
-				log.error(f"Received No Deadline from Motion Schedule for {str(repair)}, deleting")
-				log.debug(motion_task)
-				motion_client.delete_task(motion_task['id'])
-				repair.motion_scheduling_status = "No Scheduled End"
+				log.debug(f"Syncing {repair} with Motion ID {repair.motion_task_id.value}")
+				# cycle through Monday repairs, raising errors for incorrect values
+				try:
+					motion_task = [t for t in schedule if t['id'] == repair.motion_task_id.value][0]
+				except IndexError:
+					# this means we have Motion Task ID in Monday that does not exist in Motion, we should replace this value
+					log.debug(f"Cannot find Motion task with ID: {repair.motion_task_id.value}")
+					continue
+				try:
+					motion_deadline = parse(motion_task['scheduledEnd'])
+				except TypeError:
+					log.error(f"Received No Deadline from Motion Schedule for {str(repair)}, deleting")
+					log.debug(motion_task)
+					motion_client.delete_task(motion_task['id'])
+					repair.motion_scheduling_status = "No Scheduled End"
+					repair.motion_task_id = ""
+					session.add(repair)
+					notify_admins_of_error(f"Motion Task {motion_task['id']} has no scheduledEnd\n\n{motion_task}")
+					continue
+				# raise MotionError(f"Motion Task {motion_task['id']} has no scheduledEnd")
+				motion_deadline = motion_deadline.replace(microsecond=0, second=0).astimezone(datetime.timezone.utc)
+				log.debug(f"Motion Deadline: {motion_deadline.strftime('%c')}")
+
+				cs_deadline = repair.hard_deadline.value
+				if not cs_deadline:
+					raise MissingDeadlineInMonday(repair)
+				cs_deadline = cs_deadline.replace()
+				cs_deadline = cs_deadline.replace(microsecond=0, second=0).astimezone(datetime.timezone.utc)
+				if cs_deadline < datetime.datetime.now(datetime.timezone.utc):
+					raise DeadlineInPast(repair)
+
+				log.debug(f"Monday Deadline: {cs_deadline.strftime('%c')}")
+
+				# check is proposed Motion deadline is after Client side deadline
+				if motion_deadline > cs_deadline:
+					raise NotEnoughTime(repair)
+				else:
+					repair.phase_deadline = motion_deadline
+					repair.motion_scheduling_status = "Synced"
+
+			except MissingDeadlineInMonday:
+				log.debug(f"Missing Deadline in Monday: {str(repair)}, removed from schedule")
+				repair.phase_deadline = None
 				repair.motion_task_id = ""
-				repair.commit()
-				notify_admins_of_error(f"Motion Task {motion_task['id']} has no scheduledEnd\n\n{motion_task}")
-				continue
-			# raise MotionError(f"Motion Task {motion_task['id']} has no scheduledEnd")
-			motion_deadline = motion_deadline.replace(microsecond=0, second=0).astimezone(datetime.timezone.utc)
-			log.debug(f"Motion Deadline: {motion_deadline.strftime('%c')}")
-
-			cs_deadline = repair.hard_deadline.value
-			if not cs_deadline:
-				raise MissingDeadlineInMonday(repair)
-			cs_deadline = cs_deadline.replace()
-			cs_deadline = cs_deadline.replace(microsecond=0, second=0).astimezone(datetime.timezone.utc)
-			if cs_deadline < datetime.datetime.now(datetime.timezone.utc):
-				raise DeadlineInPast(repair)
+				motion_client.delete_task(repair.motion_task_id)
 
-			log.debug(f"Monday Deadline: {cs_deadline.strftime('%c')}")
+			except NotEnoughTime:
+				log.debug(f"Not Enough Time in schedule to complete {str(repair)}")
+				repair.phase_deadline = None
 
-			# check is proposed Motion deadline is after Client side deadline
-			if motion_deadline > cs_deadline:
-				raise NotEnoughTime(repair)
+			except DeadlineInPast:
+				log.debug(f"Deadline in Past for {str(repair)}, removed from schedule")
+				repair.phase_deadline = None
+				repair.motion_task_id = ""
+				motion_client.delete_task(repair.motion_task_id)
+
+			session.add(repair)
+
+
+def handle_repair_group_change(main_id, old_group_id, new_group_id):
+	"""keeps motion tasks in the schedule of the repairer whose group a repair has been moved to"""
+	all_users = [users.User(_['name']) for _ in users.USER_DATA]
+	repair_group_ids = [
+		user.repair_group_id for user in all_users if user.name in ('ferrari', 'andres', 'safan')
+	]
+	log.debug(f"MainItem({main_id}) moved from group({old_group_id}) to group({new_group_id})")
+
+	# if moving from non repair group to non repair group, do nothing
+	if old_group_id not in repair_group_ids and new_group_id not in repair_group_ids:
+		log.debug(f"MainItem({main_id}) moved from non repair group to non repair group, do nothing")
+		return
+
+	item = monday.api.client.get_api_items([main_id])[0]
+	main = monday.items.MainItem(item['id'], item)
+
+	if old_group_id in repair_group_ids and main.motion_task_id.value:
+		# moving from a repairer group
+		if new_group_id == conf.UNDER_REPAIR_GROUP_ID:
+			# moving to under repair group, keep in schedule
+			log.debug(f"MainItem({main_id}) moved to Under Repair Group, keeping in schedule")
+			return
+
+		# moving to another schedule, delete
+		log.debug(f"MainItem({main_id}) moved from repair group({old_group_id})")
+		user = users.User(repair_group_id=old_group_id)
+		motion = MotionClient(user)
+		motion.delete_task(main.motion_task_id.value)
+		main.motion_task_id = ""
+		main.motion_scheduling_status = "Not In Repair Schedule"
+		schedule_update(old_group_id)
+
+	if new_group_id in repair_group_ids:
+		# repair has been moved a repairer's group, add motion task to new repairer schedule
+		log.debug(f"MainItem({main_id}) moved to repair group({new_group_id})")
+		user = users.User(repair_group_id=new_group_id)
+		motion = MotionClient(user)
+		try:
+			if main.products_connect.value:
+				prod_data = monday.api.client.get_api_items(main.products_connect.value)
+				products = [monday.items.ProductItem(p['id'], p) for p in prod_data]
+				duration = max([p.required_minutes.value for p in products]) or 60
 			else:
-				repair.phase_deadline = motion_deadline
-				repair.motion_scheduling_status = "Synced"
-
-		except MissingDeadlineInMonday:
-			log.debug(f"Missing Deadline in Monday: {str(repair)}, removed from schedule")
-			repair.phase_deadline = None
-			repair.motion_task_id = ""
-			motion_client.delete_task(repair.motion_task_id)
-
-		except NotEnoughTime:
-			log.debug(f"Not Enough Time in schedule to complete {str(repair)}")
-			repair.phase_deadline = None
-
-		except DeadlineInPast:
-			log.debug(f"Deadline in Past for {str(repair)}, removed from schedule")
-			repair.phase_deadline = None
-			repair.motion_task_id = ""
-			motion_client.delete_task(repair.motion_task_id)
-
-		repair.commit()
+				duration = 60
+			task = motion.create_task(
+				name=main.name,
+				deadline=main.hard_deadline.value,
+				description=main.description.value,
+				labels=['Repair'],
+				duration=duration
+			)
+			log.debug(f"Created Motion Task({task['id']}) for MainItem({main_id})")
+		except (MissingDeadlineInMonday, AttributeError):
+			log.debug(f"MainItem({main_id}) missing deadline, not creating motion task")
+			main.commit()
+			return
+
+		main.motion_task_id = task['id']
+		main.motion_scheduling_status = 'Awaiting Sync'
+		schedule_update(new_group_id)
+
+	main.commit()
+
+
+def handle_client_side_deadline_adjustment(main_id, group_id):
+	"""moves a repair's motion task to its new deadline, creating the task if it is missing"""
+	all_users = [users.User(_['name']) for _ in users.USER_DATA]
+	repair_group_ids = [
+		user.repair_group_id for user in all_users if user.name in ('ferrari', 'andres')
+	]
+	if group_id not in repair_group_ids:
+		log.debug("CS Deadline Adjusted within non-repair group, do nothing")
+		return
+
+	user = users.User(repair_group_id=group_id)
+	motion = MotionClient(user)
+	item = monday.api.client.get_api_items([main_id])[0]
+	main = monday.items.MainItem(item['id'], item)
+
+	if main.motion_task_id.value:
+		if not main.hard_deadline.value:
+			log.debug(f"{main.name} missing deadline, deleting task")
+			motion.delete_task(main.motion_task_id.value)
+			main.motion_task_id = ""
+			main.motion_scheduling_status = "No Deadline"
+			main.commit()
+			schedule_update(group_id)
+			return
+
+		log.debug(f"Updating Motion Task({main.motion_task_id}) deadline for {main.hard_deadline}")
+		try:
+			motion.update_task(
+				task_id=main.motion_task_id.value,
+				deadline=main.hard_deadline.value
+			)
+			log.debug(f"Updated Motion Task({main.motion_task_id}) deadline for MainItem({main.id})")
+		except MotionError:
+			log.debug(f"Motion Task({main.motion_task_id}) not found, creating instead")
+			if main.products_connect.value:
+				prod_data = monday.api.client.get_api_items(main.products_connect.value)
+				duration = max(
+					[monday.items.ProductItem(p['id'], p).required_minutes.value for p in prod_data]
+				)
+			else:
+				duration = 60
+			task = motion.create_task(
+				name=main.name,
+				deadline=main.hard_deadline.value,
+				description=main.description.value,
+				labels=['Repair'],
+				duration=duration
+			)
+			main.motion_task_id = task['id']
+		schedule_update(group_id)
+		main.motion_scheduling_status = 'Awaiting Sync'
+		main.commit()
+
+	else:
+		log.debug(f"MainItem({main.id}) missing motion task, Cannot update Task. Creating instead")
+		try:
+			task = motion.create_task(
+				name=main.name,
+				deadline=main.hard_deadline.value,
+				description=main.description.value,
+				labels=['Repair']
+			)
+			log.debug(f"Created Motion Task({task['id']}) for MainItem({main.id})")
+			main.motion_task_id = task['id']
+			main.motion_scheduling_status = 'Awaiting Sync'
+			main.commit()
+			schedule_update(group_id)
+		except (MissingDeadlineInMonday, AttributeError):
+			log.debug(f"MainItem({main.id}) missing deadline, not creating motion task")
+			main.motion_scheduling_status = "No Deadline"
+			main.commit()
 
 
 class SchedulingError(EricError):
@@ -28,6 +28,7 @@ def process_slack_order_submission(metadata):
 		raise e
 
 	try:
+		order_lines = []
 		for order_line in metadata['order_lines']:
 
 			order_line_item = monday.items.part.OrderLineItem()
@@ -37,11 +38,9 @@ def process_slack_order_submission(metadata):
 			order_line_item.price = round(float(order_line['price']), 3)
 			order_line_item.processing_status = "Pending"
 
-			order_line_item_raw = monday.api.monday_connection.items.create_subitem(
-				parent_item_id=order_item.id,
-				subitem_name=order_line['name'],
-				column_values=order_line_item.staged_changes
-			)
+			order_lines.append((order_line['name'], order_line_item))
+
+		monday.items.part.OrderLineItem.bulk_create_subitems(order_item.id, order_lines)
 
 		order_item.order_status = 'Submitted'
 		order_item.commit()
@@ -67,25 +66,21 @@ def process_slack_stock_count(metadata, view=''):
 	count_item.commit()
 
 	try:
-
+		# count lines are created with their values in one batch, rather than created and then committed one by one
+		count_lines = []
 		for count_line in metadata['count_lines']:
 			part = monday.items.part.PartItem(count_line['part_id'])
-			count_line_item = monday.api.monday_connection.items.create_subitem(count_item.id, part.name)
-			count_line_item = monday.items.counts.CountLineItem(count_line_item['data']['create_subitem']['id'])
+			count_line_item = monday.items.counts.CountLineItem()
 			try:
-				try:
-					count_line_item.supply_price = round(part.supply_price.value, 2)
-				except TypeError:
-					pass
 				count_line_item.part_id = count_line['part_id']
 				count_line_item.counted = int(count_line['counted'])
 				count_line_item.expected = int(part.stock_level.value)
-
-				count_line_item.commit()
 			except Exception as e:
-				notify_admins_of_error(f"Error creating count line item: {e}")
-				count_line_item.add_update(f"Error creating count line item: {e}")
+				notify_admins_of_error(f"Error creating count line item for {part.name}: {e}")
 				raise e
+			count_lines.append((part.name, count_line_item))
+
+		monday.items.counts.CountLineItem.bulk_create_subitems(count_item.id, count_lines)
 		count_item.count_status = "Counted"
 		count_item.commit()
 	except Exception as e:
@@ -31,7 +31,7 @@ def sync_to_zendesk(main_item_id, ticket_id):
 		tags = ticket.tags
 		# main status
 		try:
-			index = main_item.main_status.get_label_conversion_dict(main_item.BOARD_ID)[main_item.main_status.value]
+			index = main_item.main_status.get_label_id(main_item.BOARD_ID, main_item.main_status.value)
 		except MondayDataError:
 			index = 0  # awaiting confirmation index
 			failed.append(['MainStatus', main_item.main_status.value])
@@ -39,7 +39,7 @@ def sync_to_zendesk(main_item_id, ticket_id):
 
 		# client
 		try:
-			index = main_item.client.get_label_conversion_dict(main_item.BOARD_ID)[main_item.client.value]
+			index = main_item.client.get_label_id(main_item.BOARD_ID, main_item.client.value)
 		except MondayDataError:
 			index = 5  # unconfirmed index
 			failed.append(['Client', main_item.client.value])
@@ -47,7 +47,7 @@ def sync_to_zendesk(main_item_id, ticket_id):
 
 		# service
 		try:
-			index = main_item.service.get_label_conversion_dict(main_item.BOARD_ID)[main_item.service.value]
+			index = main_item.service.get_label_id(main_item.BOARD_ID, main_item.service.value)
 		except MondayDataError:
 			index = 0
 			failed.append(['Service', main_item.service.value])
@@ -55,7 +55,7 @@ def sync_to_zendesk(main_item_id, ticket_id):
 
 		# repair type
 		try:
-			index = main_item.repair_type.get_label_conversion_dict(main_item.BOARD_ID)[main_item.repair_type.value]
+			index = main_item.repair_type.get_label_id(main_item.BOARD_ID, main_item.repair_type.value)
 		except MondayDataError:
 			index = 0
 			failed.append(['RepairType', main_item.repair_type.value])
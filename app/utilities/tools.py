@@ -33,12 +33,7 @@ class MondayTools:
 		if not desired_class:
 			raise Exception(f"Class not found for board_id:{board_id}")
 
-		class_col_ids = []
-		desired_instance = desired_class()
-		instance_attributes = vars(desired_instance)
-		for i_att in instance_attributes:
-			if hasattr(instance_attributes[i_att], 'column_id'):
-				class_col_ids.append(instance_attributes[i_att].column_id)
+		class_col_ids = desired_class.get_column_ids()
 
 		board = api_package.boards.get_board(board_id)
 		board_columns = board['columns']
@@ -177,7 +177,8 @@ class User:
 		from ..services.monday.items.misc import StaffItem
 		search = StaffItem(search=True).search_board_for_items(
 			"monday_id",
-			str(self.monday_id)
+			str(self.monday_id),
+			column_ids=[]
 		)
 		if search:
 			return StaffItem(search[0]['id'])
@@ -99,6 +99,37 @@ class Config(object):
 		]
 	}
 
+	# MONDAY API TUNING
+	MONDAY_ITEM_CHUNK_SIZE = 25  # item IDs per request in get_api_items
+	MONDAY_MAX_CONCURRENT_REQUESTS = 4  # parallel requests per get_api_items call
+	MONDAY_PAGE_SIZE = 100  # items per cursor page for board, group and search queries
+	MONDAY_MUTATION_BATCH_SIZE = 25  # aliased mutations per request for CommitSession and bulk create/delete
+	MONDAY_COMPLEXITY_RESERVE = 100000  # calls wait for the budget to reset once the shared remaining budget drops below this
+	MONDAY_COMPLEXITY_MAX_WAIT = 60  # longest a call waits for the budget to reset before raising MondayRateLimitError
+	MONDAY_COMPLEXITY_DEFAULT_RESET = 30  # seconds to wait when monday does not say when the budget resets
+	MONDAY_HTTP_TIMEOUT = 60  # seconds before a request to the monday API times out
+	MONDAY_HTTP_MAX_CONNECTIONS = 10  # pooled keep-alive connections to the monday API per process
+	MONDAY_BOARD_CACHE_TTL = 60 * 60 * 6  # seconds a board schema is shared through Redis before being refetched
+	MONDAY_BOARD_LOCAL_TTL = 60  # seconds each process reuses a board schema before checking Redis again
+	MONDAY_BOARD_REFETCH_INTERVAL = 60  # shortest time between refetches of a board caused by missing labels
+	MONDAY_BOARD_MISSING_LABEL_TTL = 60  # seconds a label still missing after a refetch is reported missing without a lookup
+
+	# CATALOG CACHE
+	CATALOG_CACHE_GRACE_PERIOD = 60 * 10  # seconds a replaced catalog cache version is kept for readers
+	CATALOG_VERSION_LOCAL_TTL = 5  # seconds each process reuses a catalog version before checking Redis again
+	CATALOG_LOCAL_TTL = 60 * 5  # longest each process keeps its local copy of a catalog, in case an invalidation is missed
+	CATALOG_REBUILD_LOCK_TIMEOUT = 60 * 30  # seconds before an abandoned catalog rebuild lock is released
+	CATALOG_SOFT_TTL = 60 * 60  # seconds after a catalog item was last checked that reads also refresh it in the background
+	CATALOG_HARD_TTL = 60 * 60 * 24  # seconds after a catalog item was last checked that reads fetch it from the API
+	CATALOG_MISSING_TTL = 60 * 2  # seconds an item found not to exist is remembered, instead of refetched on each lookup
+	CATALOG_FILL_LOCK_TIMEOUT = 10  # longest a cache miss waits for another process's fetch of the same item
+	CATALOG_REFRESH_DEDUPE_TTL = 60  # seconds after a stale item's background refresh is queued that reads do not queue another
+	CATALOG_TYPEAHEAD_TTL = 60  # longest each process serves Slack option searches from a catalog before rebuilding
+
+	# WEBHOOKS
+	WEBHOOK_DEDUPE_TTL = 60 * 60  # seconds a received webhook event is remembered, monday retries for up to 30 minutes
+	WEBHOOK_EVENT_LOG_LENGTH = 10000  # approximate number of raw events kept in each source's webhook event stream
+
 	# MONDAY KEYS
 	MONDAY_KEYS = {
 		"system": os.environ["MON_SYSTEM"],
@@ -0,0 +1,24 @@
+from unittest.mock import patch, MagicMock
+
+from rq.job import JobStatus
+
+from app.cache import rq
+
+
+def test_debounced_job_replaces_pending_job():
+	queue = MagicMock()
+	queue.enqueue_in.side_effect = [MagicMock(id="job-1"), MagicMock(id="job-2")]
+	redis_connection = MagicMock()
+	redis_connection.pipeline.return_value.execute.side_effect = [[None, True], [b"job-1", True]]
+	previous = MagicMock(id="job-1")
+	previous.get_status.return_value = JobStatus.SCHEDULED
+
+	with patch.object(rq, 'get_redis_connection', return_value=redis_connection), \
+			patch.object(rq.Job, 'fetch', return_value=previous) as fetch:
+		rq.enqueue_debounced(queue, "sync:1", print, "first")
+		job = rq.enqueue_debounced(queue, "sync:1", print, "second")
+
+	assert job.id == "job-2"
+	fetch.assert_called_once_with("job-1", connection=redis_connection)
+	previous.cancel.assert_called_once()
+	assert queue.enqueue_in.call_args.args[1:] == (print, "second")
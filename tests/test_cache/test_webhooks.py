@@ -0,0 +1,101 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import pytest
+from flask import Flask, jsonify
+
+from app.cache import webhooks
+
+
+@pytest.fixture
+def redis_connection():
+	seen = set()
+	connection = MagicMock()
+	connection.set.side_effect = lambda key, value, nx=False, ex=None: None if key in seen else seen.add(key) or True
+	connection.delete.side_effect = lambda key: seen.discard(key)
+	with patch.object(webhooks, 'get_redis_connection', return_value=connection):
+		yield connection
+
+
+def test_redelivered_events_are_handled_once(redis_connection):
+	handled = []
+	flask_app = Flask(__name__)
+
+	@flask_app.route('/hook', methods=['POST'])
+	@webhooks.ingests_webhook('monday')
+	def hook():
+		handled.append(1)
+		return jsonify({'message': 'OK'}), 200
+
+	client = flask_app.test_client()
+	event = json.dumps({'event': {'pulseId': 1, 'triggerUuid': 'abc'}})
+	assert client.post('/hook', data=event, content_type='application/json').json == {'message': 'OK'}
+	assert client.post('/hook', data=event, content_type='application/json').json == {'message': 'Duplicate'}
+
+	assert handled == [1]
+	assert redis_connection.xadd.call_count == 1
+	assert redis_connection.xadd.call_args.args[0] == "webhooks:monday:events"
+
+
+def test_one_event_is_handled_by_every_route_it_is_sent_to(redis_connection):
+	handled = []
+	flask_app = Flask(__name__)
+
+	@flask_app.route('/first', methods=['POST'])
+	@webhooks.ingests_webhook('monday')
+	def first():
+		handled.append('first')
+		return jsonify({'message': 'OK'}), 200
+
+	@flask_app.route('/second', methods=['POST'])
+	@webhooks.ingests_webhook('monday')
+	def second():
+		handled.append('second')
+		return jsonify({'message': 'OK'}), 200
+
+	client = flask_app.test_client()
+	event = json.dumps({'event': {'pulseId': 1, 'triggerUuid': 'abc'}})
+	assert client.post('/first', data=event, content_type='application/json').json == {'message': 'OK'}
+	assert client.post('/second', data=event, content_type='application/json').json == {'message': 'OK'}
+	assert client.post('/second', data=event, content_type='application/json').json == {'message': 'Duplicate'}
+	assert handled == ['first', 'second']
+
+
+def test_failed_events_are_handled_on_redelivery(redis_connection):
+	flask_app = Flask(__name__)
+	calls = []
+
+	@flask_app.route('/hook', methods=['POST'])
+	@webhooks.ingests_webhook('zendesk')
+	def hook():
+		calls.append(1)
+		if len(calls) == 1:
+			raise ValueError("enqueue failed")
+		return jsonify({'message': 'OK'}), 200
+
+	client = flask_app.test_client()
+	event = json.dumps({'id': 5, 'event': 'sync_item'})
+	assert client.post('/hook', data=event, content_type='application/json').status_code == 500
+	assert client.post('/hook', data=event, content_type='application/json').json == {'message': 'OK'}
+	assert len(calls) == 2
+
+
+def test_monday_events_invalidate_their_item_before_the_route_runs(redis_connection):
+	from app.routes.monday.misc import monday_misc_bp
+
+	flask_app = Flask(__name__)
+	flask_app.register_blueprint(monday_misc_bp)
+	item_redis = MagicMock()
+	invalidated_before_sync = []
+
+	def sync(main_id):
+		invalidated_before_sync.append(item_redis.pipeline.return_value.delete.call_args.args)
+
+	with patch('app.services.monday.api.item_cache.get_redis_connection', return_value=item_redis), \
+			patch('app.tasks.sync_platform.sync_to_external_corporate_boards', side_effect=sync), \
+			patch('app.routes.monday.misc.q_low'):
+		event = json.dumps({'event': {'pulseId': 42, 'triggerUuid': 'def'}})
+		response = flask_app.test_client().post('/monday/misc/info-sync', data=event, content_type='application/json')
+
+	assert response.status_code == 200
+	assert invalidated_before_sync == [("monday:item:42",)]
@@ -0,0 +1,129 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.cache.catalog import LocalCatalog
+
+
+class FakeRedis:
+	"""the subset of redis commands used by the caches, stored in a dict"""
+
+	def __init__(self):
+		self.store = {}
+		self.expiries = {}
+		# {channel: [handler]}, published messages are delivered to subscribers immediately
+		self.subscribers = {}
+
+	@staticmethod
+	def _key(key):
+		return key.encode() if isinstance(key, str) else key
+
+	def get(self, key):
+		return self.store.get(self._key(key))
+
+	def set(self, key, value, ex=None, nx=False):
+		if nx and self._key(key) in self.store:
+			return None
+		if isinstance(value, int):
+			value = str(value)
+		if isinstance(value, str):
+			value = value.encode()
+		self.store[self._key(key)] = value
+		return True
+
+	def mget(self, keys):
+		return [self.get(key) for key in keys]
+
+	def incr(self, key):
+		value = int(self.store.get(self._key(key), 0)) + 1
+		self.set(key, value)
+		return value
+
+	def exists(self, *keys):
+		return sum(1 for key in keys if self.store.get(self._key(key)))
+
+	def delete(self, *keys):
+		for key in keys:
+			self.store.pop(self._key(key), None)
+
+	def expire(self, key, seconds):
+		self.expiries[self._key(key)] = seconds
+
+	def hget(self, key, field):
+		return self.store.get(self._key(key), {}).get(self._key(field))
+
+	def hset(self, key, field, value):
+		self.store.setdefault(self._key(key), {})[self._key(field)] = self._key(value)
+
+	def hdel(self, key, *fields):
+		for field in fields:
+			self.store.get(self._key(key), {}).pop(self._key(field), None)
+
+	def hmget(self, key, fields):
+		return [self.hget(key, field) for field in fields]
+
+	def hgetall(self, key):
+		return dict(self.store.get(self._key(key), {}))
+
+	def hkeys(self, key):
+		return list(self.store.get(self._key(key), {}))
+
+	def hvals(self, key):
+		return list(self.store.get(self._key(key), {}).values())
+
+	def sadd(self, key, *members):
+		self.store.setdefault(self._key(key), set()).update(self._key(_) for _ in members)
+
+	def srem(self, key, *members):
+		self.store.get(self._key(key), set()).difference_update(self._key(_) for _ in members)
+
+	def smembers(self, key):
+		return set(self.store.get(self._key(key), set()))
+
+	def publish(self, channel, message):
+		for handler in self.subscribers.get(channel, []):
+			handler({"type": "message", "channel": self._key(channel), "data": self._key(message)})
+
+	def pubsub(self, ignore_subscribe_messages=False):
+		def subscribe(**handlers):
+			for channel, handler in handlers.items():
+				self.subscribers.setdefault(channel, []).append(handler)
+
+		return MagicMock(
+			subscribe=subscribe, run_in_thread=MagicMock(return_value=MagicMock(is_alive=MagicMock(return_value=True)))
+		)
+
+	def lock(self, name, timeout=None, blocking_timeout=None):
+		return MagicMock(acquire=MagicMock(return_value=True))
+
+	def pipeline(self, transaction=True):
+		return FakePipeline(self)
+
+
+class FakePipeline:
+
+	def __init__(self, redis_connection):
+		self.redis_connection = redis_connection
+		self.commands = []
+
+	def __getattr__(self, name):
+		def queue(*args, **kwargs):
+			self.commands.append((name, args, kwargs))
+			return self
+		return queue
+
+	def execute(self):
+		results = [getattr(self.redis_connection, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+		self.commands = []
+		return results
+
+
+@pytest.fixture
+def fake_redis():
+	redis_connection = FakeRedis()
+	with patch('app.cache.catalog.local_catalog', LocalCatalog()), \
+			patch('app.cache.catalog.get_redis_connection', return_value=redis_connection), \
+			patch('app.cache.utilities.get_redis_connection', return_value=redis_connection), \
+			patch('app.services.monday.api.items.get_redis_connection', return_value=redis_connection), \
+			patch.dict('app.cache.catalog._versions', clear=True), \
+			patch.dict('app.cache.catalog._swept_at', clear=True):
+		yield redis_connection
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.services.monday.api import columns
+from app.services.monday.api.boards import BoardCache, compile_label_maps
+from app.services.monday.api.exceptions import MondayDataError
+
+
+def make_board(status_labels):
+	return {"id": "123", "columns": [
+		{"id": "status", "type": "color", "settings_str": json.dumps({"labels": status_labels})},
+		{"id": "dropdown", "type": "dropdown", "settings_str": json.dumps({"labels": [{"id": 1, "name": "iPhone"}]})},
+		{"id": "text", "type": "text", "settings_str": "{}"},
+	]}
+
+
+@pytest.fixture
+def mock_redis():
+	with patch('app.services.monday.api.boards.get_redis_connection') as mock_connection:
+		store = {}
+		redis_conn = MagicMock()
+		redis_conn.get.side_effect = store.get
+		redis_conn.set.side_effect = lambda key, value, ex=None, nx=False: (
+			None if nx and key in store else store.__setitem__(key, value) or True
+		)
+		redis_conn.delete.side_effect = lambda key: store.pop(key, None)
+		mock_connection.return_value = redis_conn
+		yield store
+
+
+@pytest.fixture
+def mock_fetch():
+	with patch('app.services.monday.api.boards.conn') as mock_conn:
+		yield mock_conn.boards.fetch_boards_by_id
+
+
+def test_compile_label_maps():
+	label_maps = compile_label_maps(make_board({"0": "Working on it"}))
+	assert label_maps["status"] == {"ids": {"0": "Working on it"}, "labels": {"Working on it": "0"}}
+	assert label_maps["dropdown"]["labels"] == {"iPhone": "1"}
+	assert "text" not in label_maps
+
+
+def test_board_is_shared_through_redis(mock_redis, mock_fetch):
+	mock_fetch.return_value = {"data": {"boards": [make_board({"0": "Working on it"})]}}
+	BoardCache().get_board(123)
+	assert BoardCache().get_label_map(123, "status")["ids"] == {"0": "Working on it"}
+	assert mock_fetch.call_count == 1
+
+
+def test_missing_label_refetches_board_once_per_interval(mock_redis, mock_fetch):
+	mock_fetch.side_effect = [
+		{"data": {"boards": [make_board({"0": "Working on it"})]}},
+		{"data": {"boards": [make_board({"0": "Working on it", "1": "Done"})]}},
+	]
+	status = columns.StatusValue("status")
+	with patch('app.services.monday.api.columns.board_cache', BoardCache()) as board_cache:
+		assert status.get_label_id(123, "Working on it") == "0"
+		assert status.get_label_id(123, "Done") == "1"
+		with pytest.raises(MondayDataError):
+			status.get_label_text(123, "5")
+		# empty values are not labels, and are not looked up
+		assert board_cache.lookup_label(123, "status", "") is None
+		assert board_cache.lookup_label(123, "status", None) is None
+	assert mock_fetch.call_count == 2
+	# the shared entry was replaced by the refetch, not dropped
+	assert "Done" in mock_redis["monday:board:123"]
+
+
+def test_missing_labels_are_remembered(mock_redis, mock_fetch):
+	mock_fetch.return_value = {"data": {"boards": [make_board({"0": "Working on it"})]}}
+	board_cache = BoardCache(refetch_interval=0)
+	assert board_cache.lookup_label(123, "status", "5") is None
+	assert board_cache.lookup_label(123, "status", "5") is None
+	# one fetch to load the board, one refetch for the missing label, the second lookup is answered from memory
+	assert mock_fetch.call_count == 2
+
+
+def test_dropdown_ids_resolve_from_cached_board(mock_redis, mock_fetch):
+	from app.services.monday.api.items import BaseItemType
+
+	class DropdownTestItem(BaseItemType):
+		BOARD_ID = 123
+
+	mock_fetch.return_value = {"data": {"boards": [make_board({"0": "Working on it"})]}}
+	with patch('app.services.monday.api.items.board_cache', BoardCache()):
+		item = DropdownTestItem()
+		assert item.convert_dropdown_ids_to_labels([1], "dropdown") == ["iPhone"]
+		assert item.convert_dropdown_ids_to_labels([0], "status") == ["Working on it"]
+		assert item.convert_dropdown_ids_to_labels([None, ""], "dropdown") == []
+	assert mock_fetch.call_count == 1
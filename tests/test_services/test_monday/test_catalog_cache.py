@@ -0,0 +1,187 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.cache import catalog, utilities
+from app.services.monday.api.exceptions import MondayItemNotFoundError
+from app.services.monday.api import columns
+from app.services.monday.api.items import BaseCacheableItem
+
+
+class CatalogTestItem(BaseCacheableItem):
+	BOARD_ID = 123
+	CACHE_NAMESPACE = "catalog_test"
+	CACHE_INDEXES = {"price": "price"}
+
+	price = columns.NumberValue("price")
+
+	def prepare_cache_data(self):
+		return {"id": str(self.id), "name": self.name, "price": self.price.value}
+
+	def load_from_cache(self, cache_data=None):
+		if cache_data is None:
+			cache_data = self.fetch_cache_data()
+		self.id = cache_data['id']
+		self.name = cache_data['name']
+		self.price.value = cache_data['price']
+		return self
+
+
+def board_items(*prices):
+	return [
+		{"id": str(i), "name": f"Item {i}", "column_values": [{"id": "price", "text": str(price), "value": None}]}
+		for i, price in enumerate(prices, start=1)
+	]
+
+
+def test_rebuild_switches_versions(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20)):
+		assert utilities.build_catalog_cache(CatalogTestItem) == 2
+	assert sorted(item.price.value for item in CatalogTestItem.fetch_all()) == [10, 20]
+
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(30)):
+		utilities.build_catalog_cache(CatalogTestItem)
+	assert [item.price.value for item in CatalogTestItem.fetch_all()] == [30]
+	# the previous version is kept for readers that have not seen the switch
+	assert fake_redis.expiries[b"cache:catalog_test:1:items"] == 600
+	assert fake_redis.smembers("cache:catalog_test:versions") == {b"2"}
+
+
+def test_failed_rebuild_keeps_current_version(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10)):
+		utilities.build_catalog_cache(CatalogTestItem)
+
+	def failing_board():
+		yield from board_items(99)
+		raise RuntimeError("API down")
+
+	with patch('app.services.monday.api.items.iter_board_items', return_value=failing_board()):
+		try:
+			utilities.build_catalog_cache(CatalogTestItem)
+		except RuntimeError:
+			pass
+	assert catalog.current_version("catalog_test") == "1"
+	assert CatalogTestItem("1").price.value == 10
+
+
+def test_sweep_refreshes_updated_and_removes_deleted_items(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20)):
+		utilities.build_catalog_cache(CatalogTestItem)
+	catalog.set_swept_at("catalog_test", 1700000000)
+
+	updates = [{"id": "1", "updated_at": "2020-01-01T00:00:00Z"}, {"id": "3", "updated_at": "2030-01-01T00:00:00Z"}]
+	new_item = board_items(0, 0, 30)[2]
+	with patch.object(utilities.monday.api, 'iter_board_item_updates', return_value=updates), \
+			patch.object(utilities.monday.api, 'get_api_items', return_value=[new_item]) as get_api_items, \
+			patch.object(utilities, 'get_catalog_item_types', return_value=[CatalogTestItem]):
+		utilities.sweep_catalog_caches()
+
+	get_api_items.assert_called_once_with(["3"], column_ids=None)
+	assert sorted(item.id for item in CatalogTestItem.fetch_all()) == ["1", "3"]
+
+
+def test_local_copy_follows_invalidations(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20)):
+		utilities.build_catalog_cache(CatalogTestItem)
+	CatalogTestItem.fetch_all()
+
+	# listing again is served from the local copy
+	fake_redis.store[b"cache:catalog_test:1:items"][b"2"] = b'{"id": "2", "name": "Item 2", "price": 99}'
+	assert sorted(item.price.value for item in CatalogTestItem.fetch_all()) == [10, 20]
+
+	# a published change refreshes only that item
+	catalog.set_item("catalog_test", "1", {"id": "1", "name": "Item 1", "price": 15})
+	assert sorted(item.price.value for item in CatalogTestItem.fetch_all()) == [15, 20]
+
+	# a version switch drops the local copy
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(30)):
+		utilities.build_catalog_cache(CatalogTestItem)
+	assert [item.price.value for item in CatalogTestItem.fetch_all()] == [30]
+
+
+def test_changes_published_while_loading_are_applied(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20)):
+		utilities.build_catalog_cache(CatalogTestItem)
+
+	hgetall = fake_redis.hgetall
+
+	def hgetall_then_change(key):
+		# item 1 changes after the copy has been read, before it is stored
+		loaded = hgetall(key)
+		catalog.set_item("catalog_test", "1", {"id": "1", "name": "Item 1", "price": 15})
+		return loaded
+
+	with patch.object(fake_redis, 'hgetall', side_effect=hgetall_then_change):
+		CatalogTestItem.fetch_all()
+	assert sorted(item.price.value for item in CatalogTestItem.fetch_all()) == [15, 20]
+
+
+def test_indexes_follow_item_changes(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20, 10)):
+		utilities.build_catalog_cache(CatalogTestItem)
+	# prices are parsed as floats, so are indexed as '10.0'
+	assert CatalogTestItem.find_ids("price", 10.0) == {"1", "3"}
+
+	catalog.set_item(
+		"catalog_test", "1", {"id": "1", "name": "Item 1", "price": 20.0}, indexes=CatalogTestItem.CACHE_INDEXES
+	)
+	utilities.remove_cached_items(CatalogTestItem, ["2"])
+	assert CatalogTestItem.find_ids("price", 10.0) == {"3"}
+	assert [item.id for item in CatalogTestItem.find("price", 20.0)] == ["1"]
+
+
+def test_get_fetches_misses_in_one_request(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20)):
+		utilities.build_catalog_cache(CatalogTestItem)
+
+	new_item = board_items(0, 0, 30)[2]
+	with patch('app.services.monday.api.items.get_api_items', return_value=[new_item]) as get_api_items:
+		items = CatalogTestItem.get(["3", 2, "404"])
+		# misses are written back to the cache
+		assert [item.id for item in CatalogTestItem.get(["3"])] == ["3"]
+
+	get_api_items.assert_called_once_with(["3", "404"], column_ids=None)
+	assert [item.price.value for item in items] == [30, 20]
+
+
+def test_missing_items_are_remembered(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10)):
+		utilities.build_catalog_cache(CatalogTestItem)
+
+	with patch('app.services.monday.api.items.get_api_items', return_value=[]) as get_api_items:
+		for _ in range(2):
+			with pytest.raises(MondayItemNotFoundError):
+				CatalogTestItem("404")
+		assert CatalogTestItem.get(["1", "404"])[0].id == "1"
+	get_api_items.assert_called_once()
+
+	# a miss that does exist is cached by the process that fetches it
+	with patch('app.services.monday.api.items.get_api_items', return_value=board_items(0, 20)[1:]):
+		assert CatalogTestItem("2").price.value == 20
+	assert catalog.get_item("catalog_test", "2")["price"] == 20
+
+
+def test_stale_items_are_refreshed_in_background(fake_redis):
+	with patch('app.services.monday.api.items.iter_board_items', return_value=board_items(10, 20)):
+		utilities.build_catalog_cache(CatalogTestItem)
+	catalog.set_swept_at("catalog_test", 0)
+	data = fake_redis.store[b"cache:catalog_test:1:items"]
+	data[b"1"] = b'{"id": "1", "name": "Item 1", "price": 10, "_cached_at": %d}' % (time.time() - 7200)
+	data[b"2"] = b'{"id": "2", "name": "Item 2", "price": 20, "_cached_at": 0}'
+
+	with patch('app.services.monday.api.items.q_low') as q_low, \
+			patch('app.services.monday.api.items.get_api_items', return_value=board_items(0, 25)[1:]) as get_api_items:
+		items = CatalogTestItem.get(["1", "2"])
+
+		# the stale item is returned as cached, the expired item is fetched
+		assert [item.price.value for item in items] == [10, 25]
+		get_api_items.assert_called_once_with(["2"], column_ids=None)
+		q_low.enqueue.assert_called_once()
+		assert q_low.enqueue.call_args.args[1:] == ("catalog_test", ["1"])
+
+		# refreshes are queued once per item, so a batch overlapping a queued refresh only queues its other items
+		data[b"2"] = data[b"1"].replace(b'"1", "name": "Item 1"', b'"2", "name": "Item 2"')
+		CatalogTestItem.get(["1", "2"])
+		assert q_low.enqueue.call_count == 2
+		assert q_low.enqueue.call_args.args[1:] == ("catalog_test", ["2"])
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.services.monday.api import columns
+from app.services.monday.api.items import BaseItemType
+from app.services.monday.items.corporate.base import CorporateRepairItem
+
+
+class StoreTestItem(BaseItemType):
+	BOARD_ID = 123
+
+	text = columns.TextValue("text")
+	status = columns.StatusValue("status")
+	dropdown = columns.DropdownValue("dropdown")
+	time_tracking = columns.TimeTrackingColumn("time_tracking")
+
+
+class CorporateTestItem(CorporateRepairItem):
+	BOARD_ID = 456
+
+	@property
+	def account_item(self):
+		return None
+
+	@staticmethod
+	def get_column_id_map():
+		return {
+			"ticket_id": columns.TextValue("text4"),
+			"imeisn": columns.TextValue("text"),
+			"device_name": columns.TextValue("text9"),
+			"description": columns.TextValue("repair_summary"),
+			"cost": columns.NumberValue("numbers"),
+		}
+
+
+def column_values():
+	return [
+		{"id": "text", "text": "", "value": None},
+		{"id": "status", "text": "", "value": None},
+		{"id": "dropdown", "text": "", "value": None},
+		{"id": "time_tracking", "text": "", "value": '{"running": false}'},
+	]
+
+
+def test_assignment_stages_changes():
+	item = StoreTestItem()
+	item.text = "hello"
+	item.status = "Done"
+	item.dropdown = ["1", 2]
+
+	# dropdowns are set with label ids, which are cast to int
+	assert item.dropdown.value == [1, 2]
+	assert item.staged_changes == {
+		"text": "hello",
+		"status": {"label": "Done"},
+		"dropdown": {"ids": [1, 2]},
+	}
+	with pytest.raises(ValueError):
+		item.dropdown = ["iPhone"]
+
+
+def test_commit_sends_staged_changes():
+	item = StoreTestItem(1, {"id": "1", "name": "Item 1", "column_values": column_values()})
+	item.text = "hello"
+	with patch('app.services.monday.api.items.conn') as mock_conn, \
+			patch('app.services.monday.api.items.item_cache.invalidate_items') as invalidate_items:
+		mock_conn.items.change_multiple_column_values.return_value = {"data": {}}
+		item.commit()
+
+	mock_conn.items.change_multiple_column_values.assert_called_once_with(
+		board_id=123, item_id="1", column_values={"text": "hello"}
+	)
+	invalidate_items.assert_called_once_with(["1"])
+
+
+def test_columns_are_read_through_column_value_views():
+	assert isinstance(StoreTestItem.text, columns.TextValue)
+	item = StoreTestItem()
+	view = item.status
+	assert isinstance(view, columns.ColumnValue)
+	assert view.column_id == "status"
+	assert view.value is None
+
+	# setting the value directly does not stage it, only assignment to the item does
+	view.value = "Working on it"
+	assert str(item.status) == "Working on it"
+	assert item.staged_changes == {}
+
+	# column helpers are reached through the view, and values are kept per item
+	assert view.get_label_id.__func__ is columns.StatusValue.get_label_id
+	assert StoreTestItem().status.value is None
+
+
+def test_time_tracking_columns():
+	item = StoreTestItem(1, {"id": "1", "name": "Item 1", "column_values": column_values()})
+	assert item.time_tracking.value is None
+	item.time_tracking.load_column_value({"id": "time_tracking", "text": "", "value": '{"duration": 90}'})
+	assert item.time_tracking.value == 90
+	with pytest.raises(columns.EditingNotAllowed):
+		item.time_tracking = 100
+
+
+def test_corporate_columns_are_installed_on_subclasses():
+	assert CorporateTestItem.get_column_map()["ticket_id"] == "text4"
+	assert CorporateTestItem.ticket_id.name == "ticket_id"
+
+	item = CorporateTestItem(1, {"id": "1", "name": "Repair 1", "column_values": [
+		{"id": column_id, "text": "99" if column_id == "text4" else "", "value": None}
+		for column_id in CorporateTestItem.get_column_ids()
+	]})
+	assert item.ticket_id.value == "99"
+	item.cost = 10
+	assert item.staged_changes == {"numbers": 10}
+
+	with pytest.raises(NotImplementedError):
+		class IncompleteCorporateItem(CorporateRepairItem):
+			@staticmethod
+			def get_column_id_map():
+				return {"ticket_id": columns.TextValue("text4")}
@@ -0,0 +1,36 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from app.services.monday.api import columns
+from app.services.monday.api.items import BaseItemType
+
+
+class LazyTestItem(BaseItemType):
+	BOARD_ID = 123
+
+	date = columns.DateValue("date")
+	connections = columns.ConnectBoards("connect")
+
+
+def make_item():
+	return LazyTestItem(1, {"id": "1", "name": "Item 1", "column_values": [
+		{"id": "date", "text": "2024-01-02", "value": '{"date": "2024-01-02", "time": "10:00:00"}'},
+		{"id": "connect", "text": "", "value": '{"linkedPulseIds": [{"linkedPulseId": 5}]}'},
+	]})
+
+
+def test_columns_are_decoded_on_first_read():
+	with patch.object(columns.DateValue, 'parse_column_value', wraps=LazyTestItem.date.parse_column_value) as parse:
+		item = make_item()
+		parse.assert_not_called()
+		assert isinstance(item.date.value, datetime)
+		item.date.value
+		assert parse.call_count == 1
+	assert item.connections.value == [5]
+
+
+def test_set_values_replace_undecoded_data():
+	item = make_item()
+	item.connections = [7]
+	assert item.connections.value == [7]
+	assert item.staged_changes == {"connect": {"item_ids": [7]}}
@@ -0,0 +1,56 @@
+import pytest
+from unittest.mock import patch
+
+from app.services.monday.api import columns, item_scope, item_cache
+from app.services.monday.api.items import BaseItemType
+
+
+class ScopedTestItem(BaseItemType):
+	BOARD_ID = 123
+
+	text = columns.TextValue("text")
+
+
+@pytest.fixture
+def mock_get_api_items():
+	api_data = {"id": "1", "name": "Item 1", "column_values": [{"id": "text", "text": "hello", "value": None}]}
+	with patch('app.services.monday.api.items.get_api_items', return_value=[api_data]) as mock_get:
+		yield mock_get
+
+
+def test_items_are_shared_within_a_scope(mock_get_api_items):
+	with item_scope():
+		item = ScopedTestItem(1)
+		assert ScopedTestItem(1) is item
+		assert ScopedTestItem(item_id="1") is item
+	assert mock_get_api_items.call_count == 1
+
+
+def test_load_from_api_refetches_a_shared_item(mock_get_api_items):
+	with item_scope():
+		item = ScopedTestItem(1)
+		assert item.load_from_api() is item
+		assert ScopedTestItem(1) is item
+	assert mock_get_api_items.call_count == 2
+
+
+def test_items_are_not_shared_outside_a_scope(mock_get_api_items):
+	with item_scope():
+		item = ScopedTestItem(1)
+	assert ScopedTestItem(1) is not item
+	assert mock_get_api_items.call_count == 2
+
+
+def test_items_built_from_data_are_not_shared(mock_get_api_items):
+	with item_scope():
+		item = ScopedTestItem(1, mock_get_api_items.return_value[0])
+		assert ScopedTestItem(1) is not item
+
+
+def test_invalidated_items_are_no_longer_shared(mock_get_api_items):
+	with item_scope(), patch('app.services.monday.api.item_cache.get_redis_connection'):
+		item = ScopedTestItem(1)
+		# e.g. written through another instance, by a CommitSession or by delete_items
+		item_cache.invalidate_items(["1"])
+		assert ScopedTestItem(1) is not item
+	assert mock_get_api_items.call_count == 2
@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.services.monday.api import columns, item_cache
+from app.services.monday.api.items import BaseItemType
+
+
+class CachedTestItem(BaseItemType):
+	BOARD_ID = 123
+	API_CACHE_TTL = 60
+
+	text = columns.TextValue("text")
+
+
+API_DATA = {"id": "1", "name": "Item 1", "column_values": [{"id": "text", "text": "hello", "value": None}]}
+
+
+@pytest.fixture
+def mock_redis():
+	with patch('app.services.monday.api.item_cache.get_redis_connection') as mock_connection:
+		store = {}
+		redis_conn = MagicMock()
+		pipe = redis_conn.pipeline.return_value
+		redis_conn.get.side_effect = store.get
+		redis_conn.hget.side_effect = lambda key, field: store.get(key, {}).get(field)
+		redis_conn.hdel.side_effect = lambda key, field: store.get(key, {}).pop(field, None)
+		pipe.hset.side_effect = lambda key, field, value: store.setdefault(key, {}).__setitem__(field, value)
+		pipe.delete.side_effect = lambda *keys: [store.pop(key, None) for key in keys]
+		pipe.incr.side_effect = lambda key: store.__setitem__(key, int(store.get(key, 0)) + 1)
+		mock_connection.return_value = redis_conn
+		yield store
+
+
+@pytest.fixture
+def mock_get_api_items():
+	with patch('app.services.monday.api.items.get_api_items', return_value=[API_DATA]) as mock_get:
+		yield mock_get
+
+
+def test_repeated_loads_are_served_from_cache(mock_redis, mock_get_api_items):
+	assert CachedTestItem(1).text.value == "hello"
+	assert CachedTestItem(1).text.value == "hello"
+	assert mock_get_api_items.call_count == 1
+
+
+def test_commit_invalidates(mock_redis, mock_get_api_items):
+	item = CachedTestItem(1)
+	item.text = "changed"
+	with patch('app.services.monday.api.items.conn') as mock_conn:
+		mock_conn.items.change_multiple_column_values.return_value = {"data": {}}
+		item.commit()
+	CachedTestItem(1)
+	assert mock_get_api_items.call_count == 2
+
+
+def test_refresh_does_not_cache_data_fetched_before_an_invalidation(mock_redis):
+	def fetch_during_commit(item_ids, column_ids=None):
+		# the item is committed while the refresh is fetching it
+		item_cache.invalidate_items(item_ids)
+		return [API_DATA]
+
+	with patch('app.services.monday.api.client.get_api_items', side_effect=fetch_during_commit):
+		item_cache.refresh_item_data(1, 60)
+	assert item_cache.get_item_data(1, 60) is None
+
+	with patch('app.services.monday.api.client.get_api_items', return_value=[API_DATA]):
+		item_cache.refresh_item_data(1, 60)
+	assert item_cache.get_item_data(1, 60) == API_DATA
@@ -0,0 +1,60 @@
+import pytest
+from unittest.mock import patch, MagicMock
+
+from monday.exceptions import MondayQueryError
+
+from app.services.monday.api import limiter
+from app.services.monday.api.exceptions import MondayRateLimitError
+
+
+@pytest.fixture
+def mock_redis():
+	with patch('app.services.monday.api.limiter.get_redis_connection') as mock_connection:
+		redis_conn = MagicMock()
+		redis_conn.pipeline.return_value.execute.return_value = [None, -2]
+		mock_connection.return_value = redis_conn
+		yield redis_conn
+
+
+@pytest.fixture
+def mock_sleep():
+	with patch('app.services.monday.api.limiter.time.sleep') as mock_sleep:
+		yield mock_sleep
+
+
+def test_inject_complexity():
+	query = limiter.inject_complexity("query { items (ids: [1]) { id } }")
+	assert query.startswith("query { complexity { after reset_in_x_seconds }")
+	assert limiter.inject_complexity(query) == query
+
+	mutation = limiter.inject_complexity('mutation { create_update (item_id: 1, body: "complexity") { id } }')
+	assert mutation.startswith("mutation { complexity { after reset_in_x_seconds }")
+
+
+def test_records_reported_budget(mock_redis):
+	execute = MagicMock(return_value={"data": {"complexity": {"after": 5000, "reset_in_x_seconds": 20}}})
+	limiter.ComplexityLimiter().execute(execute, "query { me { id } }")
+	mock_redis.set.assert_called_once_with(limiter.REMAINING_KEY, 5000, ex=20)
+
+
+def test_waits_and_retries_when_exhausted(mock_redis, mock_sleep):
+	execute = MagicMock(side_effect=[
+		MondayQueryError("Complexity budget exhausted, query cost 30 budget remaining 0 out of 1000 reset in 7 seconds"),
+		{"data": {}},
+	])
+	assert limiter.ComplexityLimiter(max_wait=60).execute(execute, "query { me { id } }") == {"data": {}}
+	mock_sleep.assert_called_once_with(7)
+
+
+def test_raises_when_reset_is_too_far_away(mock_redis, mock_sleep):
+	mock_redis.pipeline.return_value.execute.return_value = [b"10", 120]
+	with pytest.raises(MondayRateLimitError):
+		limiter.ComplexityLimiter(reserve=100, max_wait=60).execute(MagicMock(), "query { me { id } }")
+	mock_sleep.assert_not_called()
+
+
+def test_other_errors_are_not_retried(mock_redis, mock_sleep):
+	execute = MagicMock(side_effect=MondayQueryError("Column not found"))
+	with pytest.raises(MondayQueryError):
+		limiter.ComplexityLimiter().execute(execute, "query { me { id } }")
+	assert execute.call_count == 1
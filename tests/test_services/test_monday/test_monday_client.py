@@ -0,0 +1,95 @@
+import re
+import json
+
+import pytest
+from unittest.mock import patch
+
+from app.services.monday.api import client
+from app.services.monday.api.exceptions import MondayAPIError
+
+
+def fake_execute_custom_query(query):
+	ids = json.loads(re.search(r"items\(ids: (\[[^\]]*\])", query).group(1))
+	return {"data": {"items": [{"id": str(_), "name": f"Item {_}", "column_values": []} for _ in ids]}}
+
+
+@pytest.fixture
+def mock_conn():
+	with patch('app.services.monday.api.client.conn') as mock_conn:
+		mock_conn.custom.execute_custom_query.side_effect = fake_execute_custom_query
+		yield mock_conn
+
+
+def test_get_api_items_empty(mock_conn):
+	assert client.get_api_items([]) == []
+	mock_conn.custom.execute_custom_query.assert_not_called()
+
+
+def test_get_api_items_chunks_and_preserves_order(mock_conn):
+	item_ids = list(range(1, 61))
+	results = client.get_api_items(item_ids, chunk_size=10, max_workers=4)
+
+	assert [int(_['id']) for _ in results] == item_ids
+	assert mock_conn.custom.execute_custom_query.call_count == 6
+
+
+def test_get_api_items_rejects_oversized_chunks(mock_conn):
+	with pytest.raises(ValueError):
+		client.get_api_items([1, 2, 3], chunk_size=client.MAX_ITEMS_PER_QUERY + 1)
+
+
+def test_get_api_items_raises_on_error_message(mock_conn):
+	mock_conn.custom.execute_custom_query.side_effect = None
+	mock_conn.custom.execute_custom_query.return_value = {"error_message": "Boom"}
+	with pytest.raises(MondayAPIError):
+		client.get_api_items(list(range(100)), chunk_size=25)
+
+
+def test_item_fields_projection():
+	assert "column_values" in client.item_fields()
+	assert client.item_fields([]) == "id name"
+	assert 'column_values(ids: ["text", "status4"])' in client.item_fields(["text", "status4"])
+
+
+def test_get_api_items_projects_columns(mock_conn):
+	client.get_api_items([1, 2], column_ids=["text"])
+	query = mock_conn.custom.execute_custom_query.call_args[0][0]
+	assert 'column_values(ids: ["text"])' in query
+
+
+def fake_mutation(query):
+	aliases = re.findall(r"(m\d+): \w+\(", query)
+	return {"data": {alias: {"id": str(1000 + int(alias[1:]))} for alias in aliases}}
+
+
+def test_create_subitems_batches_and_returns_ids_in_order(mock_conn):
+	mock_conn.custom.execute_custom_query.side_effect = fake_mutation
+	subitems = [(f"Line {i}", {"text": f"value {i}"}) for i in range(30)]
+	with patch.object(client.conf, 'MONDAY_MUTATION_BATCH_SIZE', 25):
+		item_ids = client.create_subitems(123, subitems)
+
+	assert mock_conn.custom.execute_custom_query.call_count == 2
+	assert item_ids == [str(1000 + i) for i in range(25)] + [str(1000 + i) for i in range(5)]
+	query = mock_conn.custom.execute_custom_query.call_args_list[0][0][0]
+	assert 'item_name: "Line 0"' in query
+	assert 'column_values: "{\\"text\\": \\"value 0\\"}"' in query
+
+
+def test_delete_items_empty(mock_conn):
+	assert client.delete_items([]) == []
+	mock_conn.custom.execute_custom_query.assert_not_called()
+
+
+def test_iter_board_items_follows_cursors():
+	pages = {
+		None: {"boards": [{"items_page": {"cursor": "a", "items": [{"id": "1"}, {"id": "2"}]}}]},
+		"a": {"next_items_page": {"cursor": "b", "items": [{"id": "3"}]}},
+		"b": {"next_items_page": {"cursor": None, "items": [{"id": "4"}]}},
+	}
+
+	def fake_execute_query(query):
+		cursor = re.search(r'cursor: "(\w+)"', query)
+		return pages[cursor.group(1) if cursor else None]
+
+	with patch('app.services.monday.api.client.execute_query', side_effect=fake_execute_query):
+		assert [_['id'] for _ in client.iter_board_items(123)] == ["1", "2", "3", "4"]
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+from unittest.mock import patch
+
+from app.services.monday.api import columns
+from app.services.monday.api.items import BaseItemType, IncompleteItemError
+from app.services.monday.api.session import CommitSession
+from app.services.monday.api.exceptions import MondayAPIError
+
+
+class SessionTestItem(BaseItemType):
+	BOARD_ID = 123
+
+	text = columns.TextValue("text")
+	number = columns.NumberValue("numbers")
+
+
+def make_item(item_id):
+	return SessionTestItem(item_id, {"id": str(item_id), "name": f"Item {item_id}", "column_values": [
+		{"id": "text", "text": "", "value": None},
+		{"id": "numbers", "text": "", "value": None},
+	]})
+
+
+@pytest.fixture
+def mock_execute():
+	with patch('app.services.monday.api.client.execute_query') as mock_execute:
+		mock_execute.side_effect = lambda query: {
+			alias: {"id": "1"} for alias in re.findall(r"(m\d+):", query)
+		}
+		yield mock_execute
+
+
+def test_flush_batches_aliased_mutations(mock_execute):
+	items = [make_item(i) for i in range(1, 6)]
+	session = CommitSession(batch_size=2)
+	for item in items:
+		item.text = f"value {item.id}"
+		session.add(item)
+	session.flush()
+
+	assert mock_execute.call_count == 3
+	first = mock_execute.call_args_list[0][0][0]
+	assert re.findall(r"(m\d+): change_multiple_column_values", first) == ["m0", "m1"]
+	assert all(item.staged_changes == {} for item in items)
+
+
+def test_unchanged_items_are_skipped(mock_execute):
+	with CommitSession() as session:
+		session.add(make_item(1))
+	mock_execute.assert_not_called()
+
+
+def test_uncreated_items_are_rejected():
+	with pytest.raises(IncompleteItemError):
+		CommitSession().add(SessionTestItem())
+
+
+def test_failed_flush_keeps_changes(mock_execute):
+	mock_execute.side_effect = MondayAPIError("Boom")
+	item = make_item(1)
+	item.number = 5
+	session = CommitSession()
+	session.add(item)
+	with pytest.raises(MondayAPIError):
+		session.flush()
+	assert len(session) == 1
+	assert item.staged_changes == {"numbers": 5}
@@ -0,0 +1,52 @@
+import json
+
+import httpx
+import pytest
+from monday.exceptions import MondayQueryError
+
+from app.services.monday.api.transport import MondayTransport, install_transport
+
+
+def make_transport(handler):
+	return MondayTransport(token="token", headers={"API-Version": "2023-10"}, http_transport=httpx.MockTransport(handler))
+
+
+def test_posts_query_with_auth_headers():
+	requests = []
+
+	def handler(request):
+		requests.append(request)
+		return httpx.Response(200, json={"data": {"me": {"id": "1"}}})
+
+	transport = make_transport(handler)
+	assert transport.execute("query { me { id } }") == {"data": {"me": {"id": "1"}}}
+	assert transport.execute("query { me { id } }", variables={"a": 1})
+
+	assert requests[0].headers["Authorization"] == "token"
+	assert requests[0].headers["API-Version"] == "2023-10"
+	assert json.loads(requests[1].content) == {"query": "query { me { id } }", "variables": {"a": 1}}
+
+
+def test_client_is_reused():
+	transport = make_transport(lambda request: httpx.Response(200, json={"data": {}}))
+	assert transport.client is transport.client
+
+
+def test_graphql_errors_raise():
+	transport = make_transport(lambda request: httpx.Response(200, json={"errors": [{"message": "Column not found"}]}))
+	with pytest.raises(MondayQueryError, match="Column not found"):
+		transport.execute("query { me { id } }")
+
+
+def test_error_message_responses_are_returned():
+	body = {"error_code": "ComplexityException", "error_message": "Complexity budget exhausted"}
+	transport = make_transport(lambda request: httpx.Response(429, json=body))
+	assert transport.execute("query { me { id } }") == body
+
+
+def test_install_transport_shares_one_transport():
+	import monday
+	client = install_transport(monday.MondayClient("token"))
+	assert client.items.client is client.boards.client
+	assert isinstance(client.items.client, MondayTransport)
+	assert client.items.client.token == "token"
@@ -0,0 +1,35 @@
+from unittest.mock import patch, MagicMock
+
+from app.services.slack.blocks.typeahead import TypeaheadIndex, TypeaheadEntry
+
+
+def build_index(load_entries):
+	return TypeaheadIndex("test", load_entries)
+
+
+def test_search_ranks_matches():
+	entries = [
+		TypeaheadEntry("iPhone 12 Pro Max", 1, attributes={"device_id": "10"}),
+		TypeaheadEntry("iPhone 12", 2, attributes={"device_id": "10"}),
+		TypeaheadEntry("Pro Display", 3, attributes={"device_id": "20"}),
+		TypeaheadEntry("Unibody Pro", 4, attributes={"device_id": "20"}),
+	]
+	with patch('app.services.slack.blocks.typeahead.catalog.current_version', return_value="1"):
+		index = build_index(lambda: entries)
+		assert [_.value for _ in index.search("iphone 12")] == ["2", "1"]
+		assert [_.value for _ in index.search("pro")] == ["3", "4", "1"]
+		assert [_.value for _ in index.search("pro", device_id=20)] == ["3", "4"]
+		assert index.search("ipad") == []
+
+
+def test_rebuilds_when_version_changes():
+	load_entries = MagicMock(return_value=[TypeaheadEntry("iPhone 12", 1)])
+	with patch('app.services.slack.blocks.typeahead.catalog.current_version', return_value="1") as current_version:
+		index = build_index(load_entries)
+		index.search("iph")
+		index.search("iphone")
+		assert load_entries.call_count == 1
+
+		current_version.return_value = "2"
+		index.search("iphone")
+		assert load_entries.call_count == 2
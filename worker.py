@@ -2,11 +2,20 @@ from rq import Worker
 
 from app.cache import get_redis_connection
 from app.cache.rq import q_high, q_ai_results, q_low, q_med
+from app.services.monday.api import item_scope
+
+
+class ItemScopedWorker(Worker):
+    """runs each job in its own monday item scope, so items fetched by a job are shared for the rest of the job"""
+
+    def perform_job(self, job, queue):
+        with item_scope():
+            return super().perform_job(job, queue)
 
 
 # When running `with_scheduler=True` this is necessary
 if __name__ == '__main__':
-    worker = Worker(
+    worker = ItemScopedWorker(
         queues=[
             q_high,
             q_ai_results,